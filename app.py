@@ -1175,9 +1175,11 @@ import logging
 import threading
 import pytz
 from datetime import datetime, timedelta, date
-from functools import wraps
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import secrets
+import random
 from collections import defaultdict
 
 # Cache busting timestamp - updates on every app restart
@@ -1250,7 +1252,7 @@ ENABLE_AI_DIARY_REFLECTION = False
 
 from flask import (
     Flask, request, jsonify, session,
-    render_template, send_from_directory, redirect, url_for
+    render_template, send_from_directory, redirect, url_for, g
 )
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
@@ -1258,7 +1260,7 @@ from flask_cors import CORS
 from flask_session import Session
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import select, and_, or_, desc, func, inspect, text
+from sqlalchemy import select, and_, or_, desc, func, inspect, text, exists, insert, bindparam, update, literal_column, delete, case
 # SMTP email (Resend.com compatible)
 import smtplib
 import requests as http_requests  # L100: For Resend batch API (broadcast emails)
@@ -1366,6 +1368,74 @@ except ImportError as e:
     OPENPYXL_AVAILABLE = False
     print(f"WARNING: openpyxl not available - Excel generation disabled: {e}")
 
+# PERF: orjson is a C JSON encoder - much faster than jsonify's stdlib json
+# on the large list-of-dicts payloads (circles, recommendations, feed).
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError as e:
+    ORJSON_AVAILABLE = False
+    print(f"WARNING: orjson not available - falling back to jsonify: {e}")
+
+
+def json_dumps_bytes(obj):
+    """Serialize obj to compact JSON bytes (orjson when available, stdlib json otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_bytes_response(body, status=200):
+    """Wrap already-encoded JSON bytes in a Response without re-serializing."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+def ojsonify(obj, status=200):
+    """Drop-in replacement for jsonify() that serializes with orjson when available."""
+    if not ORJSON_AVAILABLE:
+        resp = jsonify(obj)
+        resp.status_code = status
+        return resp
+    return json_bytes_response(json_dumps_bytes(obj), status=status)
+
+
+def conditional_ojsonify(obj):
+    """ojsonify() with a content-derived weak ETag; answers If-None-Match with 304 (no body).
+    Cache-Control is private/no-cache so the browser always revalidates but can reuse its copy."""
+    resp = ojsonify(obj)
+    resp.add_etag(weak=True)
+    resp.cache_control.private = True
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
+
+# PERF: msgspec decodes + validates request JSON against a typed schema in C
+# (used for the POST /api/parameters body).
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError as e:
+    MSGSPEC_AVAILABLE = False
+    print(f"WARNING: msgspec not available - using manual request validation: {e}")
+
+# PERF: numpy vectorizes the trigger streak detection (pure-Python fallback otherwise)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError as e:
+    NUMPY_AVAILABLE = False
+    print(f"WARNING: numpy not available - trigger streaks use the Python scan: {e}")
+
+# PERF: numba compiles the trigger streak run search to machine code - on ~30-day arrays the
+# NumPy per-call dispatch overhead outweighs the work (NumPy / Python paths otherwise)
+try:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numba requires numpy")
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError as e:
+    NUMBA_AVAILABLE = False
+    print(f"WARNING: numba not available - trigger streaks use the NumPy/Python scan: {e}")
+
 # Import security functions
 from security import (
     sanitize_input, validate_email, validate_username,
@@ -1421,6 +1491,9 @@ app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     'pool_pre_ping': True,
     'pool_timeout': 45,  # Increased from 30 for high load scenarios
     'pool_use_lifo': True,  # Better for bursty traffic patterns
+    # PERF: larger compiled-statement cache (default 500) so hot statements are not evicted
+    # by the long tail of one-off queries across the app's many routes
+    'query_cache_size': 1200,
 }
 
 # CHANGE 11: Enhanced session configuration for security
@@ -1497,26 +1570,37 @@ OAUTH_PROVIDERS = {
 # =====================
 import gzip as _gzip_module
 
+# PERF: JSON API bodies are small, dynamic and full of repeated keys - compress them from
+# 256 bytes at a cheaper level; static text (index.html, JS) keeps the denser level 6
+_COMPRESS_MIN_SIZE = 256
+_COMPRESS_LEVEL_JSON = 4
+_COMPRESS_LEVEL_TEXT = 6
+
 @app.after_request
 def compress_response(response):
     """Gzip compress text responses for faster delivery"""
     # Skip if client doesn't accept gzip
     if 'gzip' not in request.headers.get('Accept-Encoding', ''):
         return response
-    # Skip if already encoded, or not a text type, or too small to bother
+    # Skip if already encoded or not a success response
     if (response.direct_passthrough or
         response.status_code < 200 or response.status_code >= 300 or
-        'Content-Encoding' in response.headers or
-        len(response.get_data()) < 500):
+        'Content-Encoding' in response.headers):
         return response
     content_type = response.content_type or ''
-    if not any(t in content_type for t in ['text/', 'application/json', 'application/javascript']):
+    is_json = 'application/json' in content_type
+    if not (is_json or 'text/' in content_type or 'application/javascript' in content_type):
+        return response
+    body = response.get_data()
+    if len(body) < _COMPRESS_MIN_SIZE:  # too small to bother
         return response
-    compressed = _gzip_module.compress(response.get_data(), compresslevel=6)
+    compressed = _gzip_module.compress(
+        body, compresslevel=_COMPRESS_LEVEL_JSON if is_json else _COMPRESS_LEVEL_TEXT
+    )
     response.set_data(compressed)
     response.headers['Content-Encoding'] = 'gzip'
     response.headers['Content-Length'] = len(compressed)
-    response.headers['Vary'] = 'Accept-Encoding'
+    response.vary.add('Accept-Encoding')  # keep any Vary already set (e.g. Cookie)
     return response
 
 # APPLOAD: Cache headers for static assets
@@ -2625,6 +2709,62 @@ def send_daily_diary_reminder_email(user_email, user_language='en'):
         return False
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _find_day_streaks_jit(flags, day_numbers, min_len):
+        """Compiled _find_day_streaks(): one pass with a scalar run start, writing (start, end)
+        rows into a buffer sized for the most runs of min_len that fit in len(flags)."""
+        n = len(flags)
+        out = np.empty((n // max(min_len, 1) + 1, 2), dtype=np.int64)
+        count = 0
+        start = -1
+        for i in range(n):
+            if flags[i] and start >= 0 and day_numbers[i] - day_numbers[i - 1] == 1:
+                continue
+            if start >= 0 and i - start >= min_len:
+                out[count, 0] = start
+                out[count, 1] = i - 1
+                count += 1
+            start = i if flags[i] else -1
+        if start >= 0 and n - start >= min_len:
+            out[count, 0] = start
+            out[count, 1] = n - 1
+            count += 1
+        return out[:count]
+
+
+def _find_day_streaks(flags, day_numbers, min_len):
+    """Return (start, end) index pairs of the maximal runs where flags[i] is true and
+    day_numbers (ordinal days, ascending) advance by exactly 1, keeping runs of >= min_len."""
+    if NUMBA_AVAILABLE:
+        runs = _find_day_streaks_jit(np.asarray(flags, dtype=np.bool_),
+                                     np.asarray(day_numbers, dtype=np.int64), int(min_len))
+        return [(start, end) for start, end in runs.tolist()]
+
+    if NUMPY_AVAILABLE:
+        ok = np.asarray(flags, dtype=bool)
+        if not ok.any():
+            return []
+        # joined[i]: entries i and i+1 belong to the same run
+        joined = ok[:-1] & ok[1:] & (np.diff(np.asarray(day_numbers)) == 1)
+        starts = np.flatnonzero(ok & ~np.r_[False, joined])
+        ends = np.flatnonzero(ok & ~np.r_[joined, False])
+        keep = (ends - starts + 1) >= min_len
+        return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+    runs = []
+    start = None
+    for i, flag in enumerate(flags):
+        if flag and start is not None and day_numbers[i] - day_numbers[i - 1] == 1:
+            continue
+        if start is not None and i - start >= min_len:
+            runs.append((start, i - 1))
+        start = i if flag else None
+    if start is not None and len(flags) - start >= min_len:
+        runs.append((start, len(flags) - 1))
+    return runs
+
+
 def check_duplicate_alert(watcher_id, watched_username, parameter, date_pattern):
     """
     PJ6018: Check for duplicate alerts based on ALERT_EMAIL_MODE setting.
@@ -2654,7 +2794,7 @@ def check_duplicate_alert(watcher_id, watched_username, parameter, date_pattern)
         # Check within last 24 hours to allow one per day as the count increments.
         if parameter == 'no_checkin':
             existing = base_query.filter(
-                Alert.created_at >= datetime.now() - timedelta(hours=24),
+                Alert.created_at >= datetime.utcnow() - timedelta(hours=24),  # created_at is UTC
                 Alert.content.ilike(f"%{watched_username}%hasn't checked in%")
             ).first()
             return existing
@@ -2685,6 +2825,77 @@ def check_duplicate_alert(watcher_id, watched_username, parameter, date_pattern)
         return None
 
 
+@lru_cache(maxsize=1024)
+def _ilike_regex(pattern):
+    """Compile a SQL ILIKE pattern ('%' / '_' wildcards) into an equivalent case-insensitive regex.
+    Memoized: the same (username, parameter, date range) patterns recur across watchers and runs."""
+    return re.compile(
+        ''.join('.*' if ch == '%' else '.' if ch == '_' else re.escape(ch) for ch in pattern),
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+def _trigger_pattern_key(source_user_id, param_name, start_date, end_date):
+    """Alert.pattern_key for a trigger streak: '{source_user_id}:{param}:{start_iso}:{end_iso}'."""
+    return f"{source_user_id}:{param_name}:{start_date.isoformat()}:{end_date.isoformat()}"
+
+
+def load_trigger_alert_index(watcher_ids, watched_user_id, watched_username, dup_cutoff=None):
+    """PERF: Prefetch, in ONE query, what the trigger duplicate check needs for watched_user
+    across all watcher_ids (same ALERT_EMAIL_MODE time window as check_duplicate_alert()):
+      - (watcher_id, pattern_key) pairs of keyed trigger alerts about watched_user_id
+      - {watcher_id: [content, ...]} of legacy rows without a pattern_key, matched by content
+    dup_cutoff is the daily_reminder window start (UTC, like Alert.created_at); callers
+    processing a batch pass one computed up front.
+    Returns (keys, legacy_contents) for check_duplicate_alert_cached()."""
+    keys = set()
+    legacy_contents = {}
+    if not watcher_ids:
+        return keys, legacy_contents
+    try:
+        query = select(Alert.user_id, Alert.pattern_key, Alert.content).where(
+            Alert.user_id.in_(list(watcher_ids)),
+            Alert.alert_type == 'trigger',
+            or_(
+                and_(Alert.source_user_id == watched_user_id, Alert.pattern_key.isnot(None)),
+                and_(Alert.pattern_key.is_(None), Alert.content.ilike(f"%{watched_username}'s %"))
+            )
+        )
+        if ALERT_EMAIL_MODE == "daily_reminder":
+            if dup_cutoff is None:
+                dup_cutoff = datetime.utcnow() - timedelta(hours=24)
+            query = query.where(Alert.created_at >= dup_cutoff)
+        for watcher_id, pattern_key, content in db.session.execute(query):
+            if pattern_key:
+                keys.add((watcher_id, pattern_key))
+            elif content:
+                legacy_contents.setdefault(watcher_id, []).append(content)
+    except Exception as e:
+        logger.warning(f"[DUPLICATE CHECK] Error prefetching trigger alerts: {e}")
+        try:
+            db.session.rollback()
+        except Exception:
+            pass
+    return keys, legacy_contents
+
+
+def check_duplicate_alert_cached(alert_index, watcher_id, watched_username, parameter, date_pattern, pattern_key):
+    """In-memory check_duplicate_alert() over load_trigger_alert_index() data: an exact
+    pattern_key match, or - for legacy rows without a key - the same ILIKE content patterns
+    (original and underscore parameter name)."""
+    keys, legacy_contents = alert_index
+    if (watcher_id, pattern_key) in keys:
+        return True
+    contents = legacy_contents.get(watcher_id)
+    if not contents:
+        return False
+    for param in {parameter, parameter.replace(' ', '_')}:
+        rx = _ilike_regex(f"%{watched_username}'s {param}%{date_pattern}%")
+        if any(rx.fullmatch(c) for c in contents):
+            return True
+    return False
+
+
 def check_duplicate_alert_broad(watcher_id, watched_username, parameter):
     """
     PJ6018: Broader duplicate check (no date pattern) based on ALERT_EMAIL_MODE.
@@ -2727,7 +2938,8 @@ def check_duplicate_alert_broad(watcher_id, watched_username, parameter):
         return None
 
 
-def create_alert_with_email(user_id, title, content, alert_type='info', source_user_id=None, alert_category='general'):
+def create_alert_with_email(user_id, title, content, alert_type='info', source_user_id=None, alert_category='general',
+                            pattern_key=None):
     """
     Create an alert and optionally send email notification if user has email_on_alert enabled.
     
@@ -2738,6 +2950,7 @@ def create_alert_with_email(user_id, title, content, alert_type='info', source_u
         alert_type: Type of alert ('info', 'warning', 'success', 'error')
         source_user_id: PJ401 - ID of user this alert is about (for filtering based on following)
         alert_category: PJ401 - Category: 'trigger', 'feed', 'message', 'follow', 'general'
+        pattern_key: Trigger streak identity (see _trigger_pattern_key), for duplicate checks
     
     Returns:
         The created Alert object
@@ -2755,7 +2968,8 @@ def create_alert_with_email(user_id, title, content, alert_type='info', source_u
             content=content,
             alert_type=alert_type,
             source_user_id=source_user_id,
-            alert_category=alert_category
+            alert_category=alert_category,
+            pattern_key=pattern_key
         )
         db.session.add(alert)
         db.session.flush()  # Get the alert ID without committing
@@ -2820,7 +3034,8 @@ def create_alert_with_email(user_id, title, content, alert_type='info', source_u
         raise
 
 
-def create_alert_no_email(user_id, title, content, alert_type='info', source_user_id=None, alert_category='general'):
+def create_alert_no_email(user_id, title, content, alert_type='info', source_user_id=None, alert_category='general',
+                          pattern_key=None):
     """
     PJ6007: Create an alert WITHOUT sending email.
     Used for individual trigger alerts when we want to send a consolidated email later.
@@ -2832,6 +3047,7 @@ def create_alert_no_email(user_id, title, content, alert_type='info', source_use
         alert_type: Type of alert
         source_user_id: ID of user this alert is about
         alert_category: Category of alert
+        pattern_key: Trigger streak identity (see _trigger_pattern_key), for duplicate checks
     
     Returns:
         The created Alert object
@@ -2843,7 +3059,8 @@ def create_alert_no_email(user_id, title, content, alert_type='info', source_use
             content=content,
             alert_type=alert_type,
             source_user_id=source_user_id,
-            alert_category=alert_category
+            alert_category=alert_category,
+            pattern_key=pattern_key
         )
         db.session.add(alert)
         db.session.flush()
@@ -3845,9 +4062,52 @@ def ensure_saved_parameters_schema():
         # Don't raise - allow app to start even if this fails
 
 
+def ensure_alerts_schema():
+    """Ensure alerts table has the pattern_key column (trigger duplicate checks) - runs on startup"""
+    # Guard: Skip if already run in this process
+    if hasattr(ensure_alerts_schema, '_completed'):
+        return
+
+    try:
+        with app.app_context():
+            inspector = inspect(db.engine)
+            if 'alerts' not in inspector.get_table_names():
+                logger.info("alerts table doesn't exist yet, will be created by migrations")
+                return
+
+            existing_columns = {col['name'] for col in inspector.get_columns('alerts')}
+            if 'pattern_key' not in existing_columns:
+                is_postgres = 'postgresql' in str(db.engine.url)
+                with db.engine.connect() as connection:
+                    if is_postgres:
+                        # T15a: Prevent indefinite blocking during rolling deploys
+                        try:
+                            connection.execute(text("SET lock_timeout = '5s'"))
+                        except Exception:
+                            pass
+                        alter_query = text("ALTER TABLE alerts ADD COLUMN IF NOT EXISTS pattern_key VARCHAR(128)")
+                    else:
+                        alter_query = text("ALTER TABLE alerts ADD COLUMN pattern_key VARCHAR(128)")
+                    try:
+                        connection.execute(alter_query)
+                        connection.commit()
+                        logger.info("Added column: alerts.pattern_key")
+                    except Exception as e:
+                        logger.debug(f"Column alerts.pattern_key might already exist: {e}")
+
+        # Mark as completed for this process
+        ensure_alerts_schema._completed = True
+
+    except Exception as e:
+        logger.error(f"Error ensuring alerts schema: {str(e)}")
+        # Don't raise - allow app to start even if this fails
+
+
 # Initialize Redis client (optional, for caching)
+# PERF: one module-level client with a shared connection pool - handlers reuse it instead of
+# calling redis.from_url() (new pool + handshake) on every cache read/write/invalidation.
 try:
-    redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+    redis_client = redis.from_url(REDIS_URL, max_connections=64) if REDIS_URL else None
     if redis_client:
         redis_client.ping()
         logger.info("Redis connected successfully")
@@ -4516,10 +4776,7 @@ class User(db.Model):
 
     def is_following(self, user):
         """Check if following a user"""
-        return Follow.query.filter_by(
-            follower_id=self.id,
-            followed_id=user.id
-        ).first() is not None
+        return _follow_exists(self.id, user.id)
 
     def block_user(self, user):
         """Block another user"""
@@ -4922,7 +5179,7 @@ class SavedParameters(db.Model):
                     elif param_privacy == 'class_a' and 'class_a' in viewer_circles:
                         base_dict[param] = getattr(self, param)
                 elif param_privacy == 'public' or \
-                        (param_privacy == 'class_b' and privacy_level in ['class_b', 'class_a']) or \
+                        (param_privacy == 'class_b' and privacy_level in _CLASS_AB) or \
                         (param_privacy == 'class_a' and privacy_level == 'class_a'):
                     # Note: 'private' params are excluded - only owner can see
                     base_dict[param] = getattr(self, param)
@@ -4933,7 +5190,7 @@ class SavedParameters(db.Model):
                         (notes_priv == 'class_a' and 'class_a' in viewer_circles):
                     base_dict['notes'] = self.notes
             elif notes_priv == 'public' or \
-                    (notes_priv == 'class_b' and privacy_level in ['class_b', 'class_a']) or \
+                    (notes_priv == 'class_b' and privacy_level in _CLASS_AB) or \
                     (notes_priv == 'class_a' and privacy_level == 'class_a'):
                 base_dict['notes'] = self.notes
 
@@ -4953,6 +5210,124 @@ def _get_notes_privacy(params_id):
         return 'private'
 
 
+_params_select_stmt = None
+
+
+def _get_params_select():
+    """PERF: Build the GET /api/parameters SELECT once, with bound parameters. Reusing the
+    same statement object skips per-call construction and cache-key generation, so each
+    execution is a straight hit in SQLAlchemy's compiled cache."""
+    global _params_select_stmt
+    if _params_select_stmt is None:
+        sp_columns = SavedParameters.__table__.c
+        _params_select_stmt = select(
+            sp_columns.id,
+            *[func.coalesce(sp_columns[f], 0).label(f) for f in _PARAM_FIELDS],
+            *[func.coalesce(sp_columns[pf], 'private').label(pf) for pf in _PRIVACY_FIELDS],
+            func.coalesce(sp_columns.notes, '').label('notes')
+        ).where(
+            sp_columns.user_id == bindparam('user_id'),
+            sp_columns.date == bindparam('date')
+        ).limit(1)
+    return _params_select_stmt
+
+
+def _get_params_cached(user_id, date_str):
+    """PERF: Request-scoped memo of the SavedParameters row for (user_id, date_str) on flask.g,
+    so repeated lookups within one request issue a single SELECT.
+    Returns a lightweight Row with only the columns the diary payload needs (id, the six
+    ratings, their privacy settings and notes) - no ORM instance / identity-map overhead.
+    NULLs are coalesced in SQL (ratings -> 0, privacy -> 'private', notes -> '') so the
+    row can be serialized as-is."""
+    cache = g.setdefault('_sp_cache', {})
+    key = (user_id, date_str)
+    if key not in cache:
+        cache[key] = db.session.execute(
+            _get_params_select(), {'user_id': user_id, 'date': date_str}
+        ).first()
+    return cache[key]
+
+
+# PERF: Short-lived per-process cache of GET /api/parameters payloads, keyed on
+# (user_id, date_str). Dashboards poll the current date; a few seconds of TTL collapses
+# that fan-out to one query per window. Writes in this process evict immediately via
+# _invalidate_params_cache(); other workers converge within the TTL.
+_PARAMS_PAYLOAD_CACHE = {}
+_PARAMS_PAYLOAD_CACHE_TTL = 3
+_PARAMS_PAYLOAD_CACHE_MAX = 10000
+
+
+def _get_cached_params_payload(user_id, date_str):
+    """Cached GET /api/parameters data dict for (user_id, date_str), or None."""
+    hit = _PARAMS_PAYLOAD_CACHE.get((user_id, date_str))
+    if hit and hit[1] > time.monotonic():
+        return hit[0]
+    return None
+
+
+def _set_cached_params_payload(user_id, date_str, data):
+    if len(_PARAMS_PAYLOAD_CACHE) >= _PARAMS_PAYLOAD_CACHE_MAX:
+        _PARAMS_PAYLOAD_CACHE.clear()
+    _PARAMS_PAYLOAD_CACHE[(user_id, date_str)] = (data, time.monotonic() + _PARAMS_PAYLOAD_CACHE_TTL)
+
+
+# PERF: the once-per-login diary redirect check only needs the day's ratings. They are kept in
+# Redis under diary:<user_id>:<date> (shared by every worker) until a parameters write for that
+# date evicts them; a cached JSON null records "no entry yet".
+_DIARY_RATINGS_TTL = 86400
+
+
+def _get_diary_ratings(user_id, date_str):
+    """{field: value} of the ratings saved for (user_id, date_str), or None if there is no entry.
+    Served from Redis when available; falls back to a column-only SELECT."""
+    key = f'diary:{user_id}:{date_str}'
+    if redis_client:
+        try:
+            cached = redis_client.get(key)
+            if cached is not None:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f'Diary cache read failed: {e}')
+    sp_columns = SavedParameters.__table__.c
+    row = db.session.execute(
+        select(*[sp_columns[f] for f in _PARAM_FIELDS]).where(
+            sp_columns.user_id == user_id,
+            sp_columns.date == date_str  # String(10) column
+        ).limit(1)
+    ).first()
+    ratings = dict(row._mapping) if row else None
+    if redis_client:
+        try:
+            redis_client.setex(key, _DIARY_RATINGS_TTL, json_dumps_bytes(ratings))
+        except Exception as e:
+            logger.warning(f'Diary cache write failed: {e}')
+    return ratings
+
+
+def _invalidate_diary_ratings(user_id, date_str):
+    if not redis_client:
+        return
+    try:
+        redis_client.delete(f'diary:{user_id}:{date_str}')
+    except Exception as e:
+        logger.warning(f'Diary cache invalidation failed: {e}')
+
+
+def _invalidate_params_cache(user_id, date_str=None):
+    """Drop the cached SavedParameters row/payload for (user_id, date_str) after a write.
+    date_str=None evicts every date for the user (bulk privacy updates)."""
+    cache = g.get('_sp_cache')
+    if date_str is None:
+        for store in (cache or {}, _PARAMS_PAYLOAD_CACHE):
+            for key in [k for k in store if k[0] == user_id]:
+                store.pop(key, None)
+        return
+    if cache:
+        cache.pop((user_id, date_str), None)
+    _PARAMS_PAYLOAD_CACHE.pop((user_id, date_str), None)
+    _invalidate_diary_ratings(user_id, date_str)
+
+
 def _batch_get_notes_privacy(param_ids):
     """NP1-PERF: Batch-read notes_privacy for multiple params in ONE query.
     Returns dict {param_id: privacy_value}. Falls back to 'private' on error."""
@@ -4984,6 +5359,11 @@ _CIRCLE_RANK = {
     'class_a': 2, 'family': 2
 }
 
+# PERF: Hoisted membership sets for circle-tier checks (no list literal rebuilt per check)
+_CLASS_AB = frozenset(('class_a', 'class_b'))
+_FAMILY_TIER = frozenset(('class_a', 'family'))
+_CLOSE_FRIENDS_TIER = frozenset(('class_b', 'close_friends'))
+
 def _resolve_lowest_circle(owner_user_id, member_user_id):
     """Return the Circle row with the lowest access level for a user in multiple circles.
     Returns None if the member is not in any of the owner's circles."""
@@ -4998,6 +5378,13 @@ def _resolve_lowest_circle(owner_user_id, member_user_id):
 
 
 # T800q: Helper to get ALL circle types a viewer is in (for non-hierarchical visibility)
+_CIRCLE_TYPE_NORMALIZATION = {
+    'public': 'public', 'general': 'public',
+    'class_b': 'class_b', 'close_friends': 'class_b',
+    'class_a': 'class_a', 'family': 'class_a'
+}
+
+
 def _get_all_viewer_circle_types(owner_user_id, member_user_id):
     """Return a set of normalized circle types the member is in for the given owner.
     Used for T800q non-hierarchical parameter visibility checks."""
@@ -5007,12 +5394,43 @@ def _get_all_viewer_circle_types(owner_user_id, member_user_id):
     ).all()
     if not circles:
         return set()
-    type_mapping = {
-        'public': 'public', 'general': 'public',
-        'class_b': 'class_b', 'close_friends': 'class_b',
-        'class_a': 'class_a', 'family': 'class_a'
-    }
-    return {type_mapping.get(c.circle_type, c.circle_type) for c in circles}
+    return {_CIRCLE_TYPE_NORMALIZATION.get(c.circle_type, c.circle_type) for c in circles}
+
+
+def _get_members_circle_types(owner_user_id, member_user_ids):
+    """PERF: Bulk _get_all_viewer_circle_types() - {member_id: set of normalized circle types}
+    for every member in ONE query. Members in no circle are absent from the result."""
+    result = {}
+    if not member_user_ids:
+        return result
+    rows = db.session.execute(
+        select(Circle.circle_user_id, Circle.circle_type).where(
+            Circle.user_id == owner_user_id,
+            Circle.circle_user_id.in_(list(member_user_ids))
+        )
+    ).all()
+    for member_id, circle_type in rows:
+        result.setdefault(member_id, set()).add(_CIRCLE_TYPE_NORMALIZATION.get(circle_type, circle_type))
+    return result
+
+
+def _get_circle_types_by_pair(owner_user_ids, member_user_ids):
+    """PERF: Bulk _get_all_viewer_circle_types() across several owners -
+    {(owner_id, member_id): set of normalized circle types} in ONE query. Pairs with no
+    circle are absent from the result."""
+    result = {}
+    if not owner_user_ids or not member_user_ids:
+        return result
+    rows = db.session.execute(
+        select(Circle.user_id, Circle.circle_user_id, Circle.circle_type).where(
+            Circle.user_id.in_(list(owner_user_ids)),
+            Circle.circle_user_id.in_(list(member_user_ids))
+        )
+    ).all()
+    for owner_id, member_id, circle_type in rows:
+        result.setdefault((owner_id, member_id), set()).add(
+            _CIRCLE_TYPE_NORMALIZATION.get(circle_type, circle_type))
+    return result
 
 
 class Alert(db.Model):
@@ -5029,6 +5447,9 @@ class Alert(db.Model):
     source_user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     # Alert category for filtering: 'trigger', 'feed', 'message', 'follow', 'general'
     alert_category = db.Column(db.String(50), default='general')
+    # PERF: trigger streak identity "{source_user_id}:{param}:{start_iso}:{end_iso}" - duplicate
+    # checks are equality lookups instead of ILIKE over content (NULL on legacy/non-trigger rows)
+    pattern_key = db.Column(db.String(128), nullable=True)
     
     # PJ401: Relationship to source user (the user this alert is about)
     source_user = db.relationship('User', foreign_keys=[source_user_id], backref='triggered_alerts')
@@ -5114,6 +5535,57 @@ class Follow(db.Model):
     __table_args__ = (db.UniqueConstraint('follower_id', 'followed_id', name='unique_follow'),)
 
 
+# PERF: Small per-process username cache for feed/comment author labels.
+# Entries expire after _USERNAME_CACHE_TTL so renames made in other workers converge;
+# rename handlers in this process evict immediately via _invalidate_username().
+_USERNAME_CACHE = {}
+_USERNAME_CACHE_TTL = 300
+_USERNAME_CACHE_MAX = 4096
+
+
+def _get_usernames(user_ids):
+    """Return {user_id: username} for user_ids, querying only ids not already cached."""
+    now = time.monotonic()
+    result = {}
+    missing = []
+    for uid in set(user_ids):
+        hit = _USERNAME_CACHE.get(uid)
+        if hit and hit[1] > now:
+            result[uid] = hit[0]
+        else:
+            missing.append(uid)
+    if missing:
+        rows = db.session.execute(
+            select(User.id, User.username).where(User.id.in_(missing))
+        ).all()
+        if len(_USERNAME_CACHE) + len(rows) > _USERNAME_CACHE_MAX:
+            _USERNAME_CACHE.clear()
+        for uid, username in rows:
+            _USERNAME_CACHE[uid] = (username, now + _USERNAME_CACHE_TTL)
+            result[uid] = username
+    return result
+
+
+def _get_username(user_id):
+    """Cached username for a single user id (None if the user does not exist)."""
+    return _get_usernames([user_id]).get(user_id)
+
+
+def _invalidate_username(user_id):
+    """Evict a user's cached username after a rename or account deletion."""
+    _USERNAME_CACHE.pop(user_id, None)
+
+
+def _follow_exists(follower_id, followed_id):
+    """PERF: Boolean follow check via SELECT EXISTS - no Follow row is hydrated."""
+    return bool(db.session.execute(
+        select(exists().where(
+            Follow.follower_id == follower_id,
+            Follow.followed_id == followed_id
+        ))
+    ).scalar())
+
+
 class FollowRequest(db.Model):
     __tablename__ = 'follow_requests'
     id = db.Column(db.Integer, primary_key=True)
@@ -5569,6 +6041,155 @@ def ensure_background_jobs_schema():
         logger.error(f"[JOB QUEUE] Schema error: {str(e)}")
 
 
+# PERF: Secondary indexes for hot query paths (no migrations folder - applied at startup).
+# Each entry: (index name, CREATE INDEX statement, postgres_only)
+_PERFORMANCE_INDEXES = [
+    # Circle recommendations: random same-city sampler over active users
+    ('ix_user_city_active',
+     "CREATE INDEX IF NOT EXISTS ix_user_city_active ON users (selected_city) WHERE is_active",
+     False),
+    # save_feed_entry upsert target: one feed entry per user per date (stored at midnight)
+    ('ux_posts_user_created',
+     "CREATE UNIQUE INDEX IF NOT EXISTS ux_posts_user_created ON posts (user_id, created_at)",
+     True),
+    # Feed date listings GROUP BY date(created_at) per user
+    ('ix_posts_user_day',
+     "CREATE INDEX IF NOT EXISTS ix_posts_user_day ON posts (user_id, (date(created_at)))",
+     True),
+    # Feed hot predicates: own published posts newest-first, visibility-filtered listings
+    ('ix_posts_feed',
+     "CREATE INDEX IF NOT EXISTS ix_posts_feed ON posts (user_id, is_published, created_at DESC)",
+     False),
+    ('ix_posts_visibility',
+     "CREATE INDEX IF NOT EXISTS ix_posts_visibility ON posts (user_id, visibility, created_at DESC)",
+     False),
+    # Batched like/comment counts and viewer-liked lookups (_batch_post_counts / _batch_liked_post_ids)
+    ('ix_reactions_post_type',
+     "CREATE INDEX IF NOT EXISTS ix_reactions_post_type ON reactions (post_id, type)",
+     False),
+    ('ix_reactions_user_post_type',
+     "CREATE INDEX IF NOT EXISTS ix_reactions_user_post_type ON reactions (user_id, post_id, type)",
+     False),
+    ('ix_comments_post',
+     "CREATE INDEX IF NOT EXISTS ix_comments_post ON comments (post_id)",
+     False),
+    # Follower fan-out (feed alerts, follower counts); follower_id is covered by unique_follow
+    ('ix_follows_followed',
+     "CREATE INDEX IF NOT EXISTS ix_follows_followed ON follows (followed_id)",
+     False),
+    # Diary lookups / upserts by (user_id, date). Same name as the model's _user_date_uc
+    # constraint, so this is a no-op where the constraint exists and backfills it on legacy
+    # tables created before the constraint was added to the model.
+    ('_user_date_uc',
+     "CREATE UNIQUE INDEX IF NOT EXISTS _user_date_uc ON saved_parameters (user_id, date)",
+     True),
+    # Diary/progress/report reads (should_redirect_to_diary, get_progress, get_week_data,
+    # /api/parameters/dates): (user_id, date) range scans that read only the ratings - INCLUDE
+    # makes them index-only scans that never visit the heap (PostgreSQL 11+)
+    ('ix_saved_parameters_user_date_ratings',
+     "CREATE INDEX IF NOT EXISTS ix_saved_parameters_user_date_ratings ON saved_parameters "
+     "(user_id, date) INCLUDE (mood, energy, sleep_quality, physical_activity, anxiety, "
+     "social_belonging, created_at)",
+     True),
+    # Hierarchical feed keyset pagination on (created_at, id) per author
+    ('ix_posts_user_created_id',
+     "CREATE INDEX IF NOT EXISTS ix_posts_user_created_id ON posts (user_id, created_at DESC, id DESC)",
+     False),
+    # process_background_jobs claim: pending jobs in (priority DESC, created_at) order, so the
+    # LIMIT-ed claim is an index range scan instead of a sort of the whole pending set
+    ('ix_bgjob_claim',
+     "CREATE INDEX IF NOT EXISTS ix_bgjob_claim ON background_jobs (priority DESC, created_at) "
+     "WHERE status = 'pending'",
+     False),
+    # Job cleanup (status IN (completed, failed) AND completed_at < cutoff) and 24h stats
+    ('ix_bgjob_status_completed',
+     "CREATE INDEX IF NOT EXISTS ix_bgjob_status_completed ON background_jobs (status, completed_at)",
+     False),
+    # Trigger job debounce: at most one PENDING trigger_processing job per user
+    # (enqueue_trigger_processing_job upserts against it)
+    ('ux_bgjob_pending_trigger_user',
+     "CREATE UNIQUE INDEX IF NOT EXISTS ux_bgjob_pending_trigger_user ON background_jobs "
+     "((payload->>'user_id')) WHERE status = 'pending' AND job_type = 'trigger_processing'",
+     True),
+    # Trigger alert duplicate checks: (watcher, pattern_key) equality lookups
+    ('ix_alerts_trigger_pattern',
+     "CREATE INDEX IF NOT EXISTS ix_alerts_trigger_pattern ON alerts (user_id, pattern_key) "
+     "WHERE alert_type = 'trigger'",
+     False),
+    # Per-watcher alert scans by type in a time window (trigger duplicate windows, alert
+    # listings) - an index range scan instead of filtering every alert of the user
+    ('ix_alerts_user_type_created',
+     "CREATE INDEX IF NOT EXISTS ix_alerts_user_type_created ON alerts (user_id, alert_type, created_at)",
+     False),
+    # process_parameter_triggers_async: active triggers watching the saved user
+    ('ix_param_triggers_watched_active',
+     "CREATE INDEX IF NOT EXISTS ix_param_triggers_watched_active ON parameter_triggers (watched_id) "
+     "WHERE is_active",
+     False),
+]
+
+
+def _collapse_duplicate_pending_trigger_jobs(connection):
+    """Leave at most one pending trigger_processing job per user so that
+    ux_bgjob_pending_trigger_user can be built. Each user's newest pending job is kept and
+    marked coalesced (it now stands for the older saves too); the older ones are completed."""
+    connection.execute(text(
+        "UPDATE background_jobs k "
+        "SET payload = (k.payload::jsonb || CAST(:merge AS jsonb))::json "
+        "WHERE k.status = 'pending' AND k.job_type = 'trigger_processing' "
+        "AND EXISTS (SELECT 1 FROM background_jobs d WHERE d.status = 'pending' "
+        "  AND d.job_type = 'trigger_processing' "
+        "  AND d.payload->>'user_id' = k.payload->>'user_id' AND d.id < k.id) "
+        "AND NOT EXISTS (SELECT 1 FROM background_jobs n WHERE n.status = 'pending' "
+        "  AND n.job_type = 'trigger_processing' "
+        "  AND n.payload->>'user_id' = k.payload->>'user_id' AND n.id > k.id)"
+    ), {'merge': json.dumps({'coalesced': True, 'changed': list(_PARAM_FIELDS + _PRIVACY_FIELDS)})})
+    collapsed = connection.execute(text(
+        "UPDATE background_jobs d SET status = 'completed', completed_at = CURRENT_TIMESTAMP "
+        "WHERE d.status = 'pending' AND d.job_type = 'trigger_processing' "
+        "AND EXISTS (SELECT 1 FROM background_jobs n WHERE n.status = 'pending' "
+        "  AND n.job_type = 'trigger_processing' "
+        "  AND n.payload->>'user_id' = d.payload->>'user_id' AND n.id > d.id)"
+    )).rowcount
+    if collapsed:
+        logger.info(f"[PERF INDEX] Collapsed {collapsed} duplicate pending trigger jobs")
+
+
+def ensure_performance_indexes():
+    """Create the secondary indexes in _PERFORMANCE_INDEXES if they are missing"""
+    # Guard: Skip if already run in this process
+    if hasattr(ensure_performance_indexes, '_completed'):
+        return
+
+    try:
+        is_postgres = 'postgresql' in str(db.engine.url)
+        with db.engine.connect() as connection:
+            if is_postgres:
+                # T15a: Prevent indefinite blocking during rolling deploys
+                try:
+                    connection.execute(text("SET lock_timeout = '5s'"))
+                except Exception:
+                    pass
+
+            for index_name, ddl, postgres_only in _PERFORMANCE_INDEXES:
+                if postgres_only and not is_postgres:
+                    continue
+                try:
+                    if index_name == 'ux_bgjob_pending_trigger_user':
+                        _collapse_duplicate_pending_trigger_jobs(connection)
+                    connection.execute(text(ddl))
+                    connection.commit()
+                except Exception as e:
+                    connection.rollback()
+                    logger.error(f"[PERF INDEX] Error creating {index_name}: {e}")
+
+        ensure_performance_indexes._completed = True
+        logger.info(f"[PERF INDEX] Ensured {len(_PERFORMANCE_INDEXES)} performance indexes")
+
+    except Exception as e:
+        logger.error(f"[PERF INDEX] Error ensuring performance indexes: {str(e)}")
+
+
 # =====================
 # DATABASE INITIALIZATION
 # =====================
@@ -5586,10 +6207,12 @@ def init_database():
                 db.create_all()
                 ensure_database_schema()
                 ensure_saved_parameters_schema()  # ← ADDED
+                ensure_alerts_schema()  # ← PERF: alerts.pattern_key
                 ensure_notification_settings_schema()  # ← ADDED for email notification columns
                 ensure_privacy_schema()  # ← PL405: Privacy columns
                 ensure_user_consents_schema()  # ← QA FIX: GDPR consent columns
                 ensure_background_jobs_schema()  # ← ADDED for job queue
+                ensure_performance_indexes()  # ← PERF: hot-path secondary indexes
                 ensure_professional_schema()  # ← L170: Professional account tables
                 ensure_objective_group_schema()  # ← G27: Objective group tables
                 logger.info("Database schema created successfully")
@@ -5606,10 +6229,12 @@ def init_database():
                 fix_all_schema_issues()
                 ensure_database_schema()
                 ensure_saved_parameters_schema()  # ← ADDED
+                ensure_alerts_schema()  # ← PERF: alerts.pattern_key
                 ensure_notification_settings_schema()  # ← ADDED for email notification columns
                 ensure_privacy_schema()  # ← PL405: Privacy columns
                 ensure_user_consents_schema()  # ← QA FIX: GDPR consent columns
                 ensure_background_jobs_schema()  # ← ADDED for job queue
+                ensure_performance_indexes()  # ← PERF: hot-path secondary indexes
                 ensure_professional_schema()  # ← L170: Professional account tables
                 ensure_objective_group_schema()  # ← G27: Objective group tables
                 create_system_operators()  # L60: Create operator accounts from env vars
@@ -5674,10 +6299,12 @@ def init_database():
                 db.create_all()
                 logger.info("Created database tables as fallback")
                 ensure_saved_parameters_schema()  # ← ADDED
+                ensure_alerts_schema()  # ← PERF: alerts.pattern_key
                 ensure_notification_settings_schema()  # ← ADDED for email notification columns
                 ensure_privacy_schema()  # ← PL405: Privacy columns
                 ensure_user_consents_schema()  # ← QA FIX: GDPR consent columns
                 ensure_background_jobs_schema()  # ← ADDED for job queue
+                ensure_performance_indexes()  # ← PERF: hot-path secondary indexes
                 ensure_professional_schema()  # ← L170: Professional account tables
                 ensure_objective_group_schema()  # ← G27: Objective group tables
                 create_admin_user()
@@ -6311,6 +6938,7 @@ def create_test_users():
                 if existing_user.username != user_data['username']:
                     logger.info(f"Repairing username: {existing_user.username} -> {user_data['username']}")
                     existing_user.username = user_data['username']
+                    _invalidate_username(existing_user.id)
 
         if created_count > 0:
             db.session.commit()
@@ -7352,6 +7980,7 @@ def register():
         # Log user in
         session['user_id'] = user.id
         session['username'] = user.username
+        session['preferred_language'] = user.preferred_language or 'en'  # read by get_progress
         session.permanent = True
         
         # FIX: Set flag for one-time diary redirect check after registration
@@ -7447,6 +8076,7 @@ def login():
         # Create session
         session['user_id'] = user.id
         session['username'] = user.username
+        session['preferred_language'] = user.preferred_language or 'en'  # read by get_progress
         session['role'] = user.role
         session.permanent = True
         
@@ -7584,6 +8214,7 @@ def get_current_user():
                 if existing:
                     return jsonify({'error': 'Username already taken'}), 400
                 user.username = new_username
+                _invalidate_username(user.id)
         
         if 'selected_city' in data:
             user.selected_city = sanitize_input(data['selected_city'].strip())[:100]
@@ -7647,6 +8278,7 @@ def update_user_language():
                     # FIXED: Use correct column name 'preferred_language'
                     user.preferred_language = language
                     db.session.commit()
+                    session['preferred_language'] = language
 
                     logger.info(f"[LANG API DEBUG] SUCCESS: Updated language for user {user_id}: {old_language} -> {language}")
                     logger.info("[LANG API DEBUG] ========================================")
@@ -7865,6 +8497,7 @@ def verify_magic_link():
 
         session['user_id'] = user.id
         session['username'] = user.username
+        session['preferred_language'] = user.preferred_language or 'en'  # read by get_progress
         session['role'] = user.role
         session.permanent = True
         
@@ -7921,6 +8554,7 @@ def set_username():
 
         user.username = new_username
         session['username'] = new_username
+        _invalidate_username(user.id)
         db.session.commit()
 
         return jsonify({'success': True, 'username': new_username}), 200
@@ -7959,6 +8593,7 @@ def save_consent():
             if not existing:
                 user.username = username
                 session['username'] = username
+                _invalidate_username(user.id)
 
         # PJ6001: Handle birth_year
         birth_year = data.get('birth_year')
@@ -8220,6 +8855,7 @@ def confirm_delete_account():
             AuditLog.__table__.update().where(AuditLog.user_id == user.id).values(user_id=None)
         )
 
+        _invalidate_username(user.id)
         db.session.delete(user)
         db.session.commit()
 
@@ -9440,6 +10076,7 @@ def oauth_callback(provider):
         # Create session (same as regular login)
         session['user_id'] = user.id
         session['username'] = user.username
+        session['preferred_language'] = user.preferred_language or 'en'  # read by get_progress
         session['role'] = user.role
         session.permanent = True
         session['diary_redirect_pending'] = True
@@ -9652,6 +10289,7 @@ def profile():
             user = db.session.get(User, user_id)
             if user and data['preferred_language'] in ['en', 'he', 'ar', 'ru']:
                 user.preferred_language = data['preferred_language']
+                session['preferred_language'] = user.preferred_language
 
         # PJ6001: Update birth_year if provided
         if 'birth_year' in data:
@@ -9686,10 +10324,7 @@ def get_user_profile(user_id):
 
         # ST10T1: Check if target user has added current user to their connections
         # (target follows current user = target has consented to share data with current user)
-        is_following = Follow.query.filter_by(
-            follower_id=user_id,
-            followed_id=current_user_id
-        ).first() is not None
+        is_following = _follow_exists(user_id, current_user_id)
 
         # PJ401: Also check if current user is in target user's circles
         is_in_circle = Circle.query.filter_by(
@@ -9708,10 +10343,7 @@ def get_user_profile(user_id):
                 return jsonify({'error': 'User not found'}), 404
             profile = user.profile if user.profile else None
             # T800q: Check if current user already connected TO this user or has pending request
-            current_user_follows = Follow.query.filter_by(
-                follower_id=current_user_id,
-                followed_id=user_id
-            ).first() is not None
+            current_user_follows = _follow_exists(current_user_id, user_id)
             current_user_in_circle = Circle.query.filter_by(
                 user_id=current_user_id,
                 circle_user_id=user_id
@@ -9768,10 +10400,7 @@ def get_user_posts(user_id):
         current_user_id = session.get('user_id')
 
         # ST10T1: Check if target user has added current user to their connections
-        is_following = Follow.query.filter_by(
-            follower_id=user_id,
-            followed_id=current_user_id
-        ).first() is not None
+        is_following = _follow_exists(user_id, current_user_id)
 
         # PJ401: Also check if current user is in target user's circles
         membership = Circle.query.filter_by(
@@ -9789,26 +10418,18 @@ def get_user_posts(user_id):
             posts = Post.query.filter_by(user_id=user_id).order_by(Post.created_at.desc()).all()
 
             # Calculate likes and comments for each post
+            # PERF: viewer's liked post ids fetched once into a set (was a full Reaction row
+            # SELECT per post); like/comment counts batched the same way
+            post_ids = [post.id for post in posts]
+            like_counts = _batch_post_counts(Reaction, post_ids, type='like')
+            comment_counts = _batch_post_counts(Comment, post_ids)
+            liked_ids = _batch_liked_post_ids(post_ids, current_user_id)
+
             posts_data = []
             for post in posts:
-                # Count likes from Reaction table
-                likes_count = db.session.execute(
-                    select(func.count(Reaction.id)).filter_by(post_id=post.id, type='like')
-                ).scalar() or 0
-
-                # Count comments
-                comments_count = db.session.execute(
-                    select(func.count(Comment.id)).filter_by(post_id=post.id)
-                ).scalar() or 0
-
-                # Check if current user liked this post
-                user_liked = db.session.execute(
-                    select(Reaction).filter_by(
-                        post_id=post.id,
-                        user_id=current_user_id,
-                        type='like'
-                    )
-                ).scalar_one_or_none() is not None
+                likes_count = like_counts.get(post.id, 0)
+                comments_count = comment_counts.get(post.id, 0)
+                user_liked = post.id in liked_ids
 
                 posts_data.append({
                     'id': post.id,
@@ -9826,9 +10447,9 @@ def get_user_posts(user_id):
         # Determine which visibility levels current user can see
         visible_levels = ['general']  # Everyone can see public
         if membership:
-            if membership.circle_type in ['class_a', 'family']:
+            if membership.circle_type in _FAMILY_TIER:
                 visible_levels = ['general', 'close_friends', 'family']
-            elif membership.circle_type in ['class_b', 'close_friends']:
+            elif membership.circle_type in _CLOSE_FRIENDS_TIER:
                 visible_levels = ['general', 'close_friends']
 
         # Get posts filtered by visible visibility levels
@@ -9838,26 +10459,18 @@ def get_user_posts(user_id):
         ).order_by(Post.created_at.desc()).all()
 
         # Calculate likes and comments for each post
+        # PERF: viewer's liked post ids fetched once into a set (was a full Reaction row
+        # SELECT per post); like/comment counts batched the same way
+        post_ids = [post.id for post in posts]
+        like_counts = _batch_post_counts(Reaction, post_ids, type='like')
+        comment_counts = _batch_post_counts(Comment, post_ids)
+        liked_ids = _batch_liked_post_ids(post_ids, current_user_id)
+
         posts_data = []
         for post in posts:
-            # Count likes from Reaction table
-            likes_count = db.session.execute(
-                select(func.count(Reaction.id)).filter_by(post_id=post.id, type='like')
-            ).scalar() or 0
-
-            # Count comments
-            comments_count = db.session.execute(
-                select(func.count(Comment.id)).filter_by(post_id=post.id)
-            ).scalar() or 0
-
-            # Check if current user liked this post
-            user_liked = db.session.execute(
-                select(Reaction).filter_by(
-                    post_id=post.id,
-                    user_id=current_user_id,
-                    type='like'
-                )
-            ).scalar_one_or_none() is not None
+            likes_count = like_counts.get(post.id, 0)
+            comments_count = comment_counts.get(post.id, 0)
+            user_liked = post.id in liked_ids
 
             posts_data.append({
                 'id': post.id,
@@ -9883,10 +10496,7 @@ def get_user_circles(user_id):
         current_user_id = session.get('user_id')
 
         # ST10T1: Check if target user has added current user to their connections
-        is_following = Follow.query.filter_by(
-            follower_id=user_id,
-            followed_id=current_user_id
-        ).first() is not None
+        is_following = _follow_exists(user_id, current_user_id)
 
         # PJ401: Also check if current user is in target user's circles
         is_in_circle = Circle.query.filter_by(
@@ -9950,7 +10560,7 @@ def get_user_circles(user_id):
                     'user_privacy': privacy_level  # ADDED
                 })
 
-            if privacy_level == 'class_b' and viewer_circle_type not in ['class_a', 'class_b']:
+            if privacy_level == 'class_b' and viewer_circle_type not in _CLASS_AB:
                 return jsonify({
                     'private': True,
                     'message': 'Circles set to private',
@@ -10029,10 +10639,7 @@ def get_user_parameters(user_id):
 
         if not is_professional_viewer:
             # ST10T1: Check if target user has added current user to their connections
-            is_following = Follow.query.filter_by(
-                follower_id=user_id,
-                followed_id=current_user_id
-            ).first() is not None
+            is_following = _follow_exists(user_id, current_user_id)
 
             # PJ401: Also check if current user is in target user's circles
             is_in_circle = Circle.query.filter_by(
@@ -10631,6 +11238,7 @@ def notification_settings():
                             priority=2  # Higher priority than triggers
                         )
                         db.session.add(job)
+                        _notify_job_queue()
                         db.session.commit()
                         emails_queued = True
                         logger.info(f"[G60] Queued batch alert email job for user {user_id}")
@@ -11002,7 +11610,7 @@ def circles():
 
                 # If circles are private AND viewing someone else's, return empty
                 if circles_privacy == 'private':
-                    return jsonify({
+                    return ojsonify({
                         'public': [],
                         'class_b': [],
                         'class_a': [],
@@ -11032,6 +11640,16 @@ def circles():
                     viewer_circle_level = 'public'
 
                 logger.info(f"Viewer {user_id} is in '{viewer_circle_level}' circle for user {target_user_id}")
+
+                # PERF: reject restricted viewers before running the three circle queries below
+                if (circles_privacy == 'class_b' and viewer_circle_level not in _CLASS_AB) or \
+                        (circles_privacy == 'class_a' and viewer_circle_level != 'class_a'):
+                    return ojsonify({
+                        'public': [],
+                        'class_b': [],
+                        'class_a': [],
+                        'private': True
+                    })
             else:
                 viewer_circle_level = None  # Not used when viewing own
 
@@ -11104,7 +11722,7 @@ def circles():
 
                 elif circles_privacy == 'class_b':
                     # Only Class B and Class A members can see
-                    if viewer_circle_level in ['class_b', 'class_a']:
+                    if viewer_circle_level in _CLASS_AB:
                         result['class_b'] = [info for c in class_b if (info := get_user_info(c))]
                         result['class_a'] = [info for c in class_a if (info := get_user_info(c))]
                         result['public'] = [info for c in public if (info := get_user_info(c))]
@@ -11122,7 +11740,7 @@ def circles():
                         # viewer is not in class_a, can't see anything
                         result['private'] = True
 
-            return jsonify(result)
+            return ojsonify(result)
 
         except Exception as e:
             logger.error(f"Get circles error: {str(e)}")
@@ -11149,27 +11767,57 @@ def circles():
             if circle_type not in ['public', 'class_b', 'class_a']:
                 return jsonify({'error': 'Invalid circle type'}), 400
 
-            # Check if user exists
-            if not db.session.get(User, circle_user_id):
-                return jsonify({'error': 'User not found'}), 404
+            # circle_user_id is nullable, so a missing id would pass both the FK and
+            # _user_circle_uc (NULLs never conflict) - validate it before inserting
+            if isinstance(circle_user_id, str) and circle_user_id.isdigit():
+                circle_user_id = int(circle_user_id)
+            if isinstance(circle_user_id, bool) or not isinstance(circle_user_id, int) or circle_user_id <= 0:
+                return jsonify({'error': 'Invalid user_id'}), 400
+
+            if 'postgresql' in str(db.engine.url):
+                # PERF: single INSERT ... ON CONFLICT DO NOTHING against _user_circle_uc replaces the
+                # user-exists SELECT + already-in-circle SELECT + INSERT (3 round-trips -> 1).
+                # A missing user surfaces as an FK violation on circle_user_id.
+                from sqlalchemy.dialects.postgresql import insert as pg_insert
+                insert_stmt = pg_insert(Circle).values(
+                    user_id=user_id,
+                    circle_user_id=circle_user_id,
+                    circle_type=circle_type,
+                    created_at=datetime.utcnow()
+                ).on_conflict_do_nothing(
+                    index_elements=['user_id', 'circle_user_id', 'circle_type']
+                ).returning(Circle.id)
+                try:
+                    inserted_id = db.session.execute(insert_stmt).scalar()
+                except IntegrityError as e:
+                    db.session.rollback()
+                    if getattr(e.orig, 'pgcode', None) == '23503':  # foreign_key_violation
+                        return jsonify({'error': 'User not found'}), 404
+                    raise
 
-            # Check if already in circle - SQLAlchemy 2.0 style
-            existing_stmt = select(Circle).filter_by(
-                user_id=user_id,
-                circle_user_id=circle_user_id,
-                circle_type=circle_type
-            )
-            existing = db.session.execute(existing_stmt).scalar_one_or_none()
+                if inserted_id is None:
+                    return jsonify({'error': 'User already in this circle'}), 400
+            else:
+                # SQLite does not enforce FKs by default - keep the explicit checks
+                if not db.session.get(User, circle_user_id):
+                    return jsonify({'error': 'User not found'}), 404
 
-            if existing:
-                return jsonify({'error': 'User already in this circle'}), 400
+                existing_stmt = select(Circle).filter_by(
+                    user_id=user_id,
+                    circle_user_id=circle_user_id,
+                    circle_type=circle_type
+                )
+                existing = db.session.execute(existing_stmt).scalar_one_or_none()
 
-            circle = Circle(
-                user_id=user_id,
-                circle_user_id=circle_user_id,
-                circle_type=circle_type
-            )
-            db.session.add(circle)
+                if existing:
+                    return jsonify({'error': 'User already in this circle'}), 400
+
+                circle = Circle(
+                    user_id=user_id,
+                    circle_user_id=circle_user_id,
+                    circle_type=circle_type
+                )
+                db.session.add(circle)
 
             # T2: Auto-accept any pending follow request from this user when adding to circle
             pending_request = FollowRequest.query.filter_by(
@@ -11481,31 +12129,13 @@ def get_my_circles():
                 }
                 viewer_circle_type = type_mapping.get(viewer_circle.circle_type, 'public')
 
-            # Apply privacy filtering with consistent response format
-            if privacy_level == 'private':
-                return jsonify({
-                    'private': True,
-                    'message': 'Circles set to private',
-                    'public': [],
-                    'class_b': [],
-                    'class_a': [],
-                    'viewer_circle_type': viewer_circle_type,
-                    'viewing_user_id': target_user_id
-                })
-
-            if privacy_level == 'class_a' and viewer_circle_type != 'class_a':
-                return jsonify({
-                    'private': True,
-                    'message': 'Circles set to private',
-                    'public': [],
-                    'class_b': [],
-                    'class_a': [],
-                    'viewer_circle_type': viewer_circle_type,
-                    'viewing_user_id': target_user_id
-                })
-
-            if privacy_level == 'class_b' and viewer_circle_type not in ['class_a', 'class_b']:
-                return jsonify({
+            # Apply privacy filtering with consistent response format.
+            # PERF: decide access from the viewer's rank before touching the owner's circle list,
+            # so denied requests never issue the main Circle SELECT.
+            required_rank = _CIRCLE_RANK.get(privacy_level, 0)
+            viewer_rank = _CIRCLE_RANK.get(viewer_circle_type, -1) if viewer_circle_type else -1
+            if privacy_level == 'private' or (required_rank > 0 and viewer_rank < required_rank):
+                return ojsonify({
                     'private': True,
                     'message': 'Circles set to private',
                     'public': [],
@@ -11554,7 +12184,7 @@ def get_my_circles():
             result['viewer_circle_type'] = viewer_circle_type
             result['viewing_user_id'] = target_user_id
 
-        return jsonify(result)
+        return ojsonify(result)
 
     except Exception as e:
         logger.error(f"Get my circles error: {str(e)}")
@@ -11650,14 +12280,18 @@ def get_circle_recommendations():
         ).scalars().all()
         logger.info(f"[CIRCLE RECS] Users I follow: {len(my_following_ids)}")
 
-        # Get users who follow me
+        following_count = len(my_following_ids)
+
+        # Get users who follow me - one id fetch gives both the count and the mutual set
         my_follower_ids = db.session.execute(
-            select(Follow.follower_id).filter_by(followed_id=user_id)
+            select(Follow.follower_id).where(Follow.followed_id == user_id)
         ).scalars().all()
-        logger.info(f"[CIRCLE RECS] Users following me: {len(my_follower_ids)}")
+        followers_count = len(my_follower_ids)
+        logger.info(f"[CIRCLE RECS] Users following me: {followers_count}")
 
         # Find mutual connections
-        mutual_ids = set(my_following_ids) & set(my_follower_ids)
+        my_following_set = set(my_following_ids)
+        mutual_ids = {fid for fid in my_follower_ids if fid in my_following_set}
         logger.info(f"[CIRCLE RECS] Mutual connections: {len(mutual_ids)}")
 
         for mutual_id in mutual_ids:
@@ -11725,16 +12359,23 @@ def get_circle_recommendations():
         # PRIORITY 4: Same city users (not following yet) - LIKE "WHO TO FOLLOW"
         if user.selected_city and len(recommendations) < 20:
             logger.info(f"[CIRCLE RECS] Looking for same city users in: {user.selected_city}")
-            same_city_users = User.query.filter(
-                User.selected_city == user.selected_city,
-                User.id != user_id,
-                User.is_active == True
-            ).limit(30).all()
+            # PERF: exclude already-seen users in SQL and sample randomly (served by
+            # ix_user_city_active) instead of always returning the 30 lowest ids.
+            # NULL circle_user_id rows must not reach NOT IN - "id NOT IN (..., NULL)" is
+            # never true and would exclude everyone
+            excluded_ids = [seen_id for seen_id in seen_ids if seen_id is not None]
+            same_city_users = db.session.execute(
+                select(User).where(
+                    User.selected_city == user.selected_city,
+                    User.is_active == True,
+                    User.id.notin_(excluded_ids)
+                ).order_by(func.random()).limit(20 - len(recommendations))
+            ).scalars().all()
             
             logger.info(f"[CIRCLE RECS] Found {len(same_city_users)} users in same city")
             
             for city_user in same_city_users:
-                if city_user.id in seen_ids or len(recommendations) >= 20:
+                if len(recommendations) >= 20:
                     continue
                     
                 seen_ids.add(city_user.id)
@@ -11787,12 +12428,12 @@ def get_circle_recommendations():
 
         logger.info(f"[CIRCLE RECS] Final count: {len(recommendations)} recommendations")
         
-        return jsonify({
+        return ojsonify({
             'recommendations': recommendations[:20],
             'debug': {
                 'user_city': user.selected_city,
-                'following_count': len(my_following_ids),
-                'followers_count': len(my_follower_ids),
+                'following_count': following_count,
+                'followers_count': followers_count,
                 'mutual_count': len(mutual_ids),
                 'in_circles_count': len(existing_circle_users)
             }
@@ -11808,6 +12449,58 @@ def get_circle_recommendations():
 # =====================
 # FEED & POSTS ROUTES
 # =====================
+def _jittered_ttl(base_ttl, spread=0.1):
+    """PERF: Randomize a cache TTL by +/- spread so keys written together don't expire together."""
+    delta = int(base_ttl * spread)
+    return base_ttl + random.randint(-delta, delta)
+
+
+def _invalidate_feed_cache(user_id):
+    """PERF: Invalidate every cached feed page for user_id with one INCR of its version counter.
+    Feed cache keys embed the version, so old pages simply age out via their TTL (no SCAN)."""
+    if not redis_client:
+        return
+    try:
+        redis_client.incr(f'feedver:{user_id}')
+        logger.debug(f'Invalidated feed cache for user {user_id}')
+    except Exception as e:
+        logger.warning(f'Feed cache invalidation failed: {e}')
+
+
+def _day_bounds(day):
+    """PERF: Half-open [start, next day) datetime range for a 'YYYY-MM-DD' string or date.
+    Filtering created_at by range keeps its btree index usable (date(created_at) = ... does not).
+    Raises ValueError on a malformed date string."""
+    if isinstance(day, str):
+        day = datetime.strptime(day, '%Y-%m-%d').date()
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+def _batch_post_counts(model, post_ids, **filters):
+    """PERF: Return {post_id: row_count} for Reaction/Comment rows in ONE grouped query
+    (replaces a per-post SELECT COUNT). Extra keyword filters are applied via filter_by."""
+    if not post_ids:
+        return {}
+    stmt = select(model.post_id, func.count(model.id)).where(
+        model.post_id.in_(post_ids)
+    ).filter_by(**filters).group_by(model.post_id)
+    return dict(db.session.execute(stmt).all())
+
+
+def _batch_liked_post_ids(post_ids, user_id):
+    """PERF: Return the set of post ids (among post_ids) that user_id has liked - one query."""
+    if not post_ids:
+        return set()
+    return set(db.session.execute(
+        select(Reaction.post_id).where(
+            Reaction.post_id.in_(post_ids),
+            Reaction.user_id == user_id,
+            Reaction.type == 'like'
+        )
+    ).scalars().all())
+
+
 @app.route('/api/feed', methods=['GET'])
 @login_required
 @rate_limit_endpoint(max_requests=60, window=60)  # 60 requests per minute
@@ -11818,42 +12511,68 @@ def get_feed():
         page = request.args.get('page', 1, type=int)
 
         # Try cache first
-        cache_key = f'feed:{user_id}:{page}'
-        if REDIS_URL:
+        # PERF: keys embed a per-user version (feedver:<id>) bumped on like/comment
+        r = None
+        holds_lock = False
+        if redis_client:
             try:
-                r = redis.from_url(REDIS_URL)
+                r = redis_client
+                cache_version = int(r.get(f'feedver:{user_id}') or 0)
+                cache_key = f'feed:{user_id}:v{cache_version}:{page}'
                 cached_feed = r.get(cache_key)
                 if cached_feed:
                     logger.debug(f'Cache hit for feed:{user_id}:{page}')
-                    return jsonify(json.loads(cached_feed))
+                    return json_bytes_response(cached_feed)
+
+                stale_key = f'{cache_key}:stale'
+                lock_key = f'lock:{cache_key}'
+
+                # PERF: single-flight - only one request rebuilds a missing page. Others serve the
+                # stale copy if there is one, otherwise wait briefly for the rebuild to land.
+                holds_lock = bool(r.set(lock_key, '1', nx=True, px=5000))
+                if not holds_lock:
+                    stale_feed = r.get(stale_key)
+                    if stale_feed:
+                        logger.debug(f'Serving stale feed:{user_id}:{page} while it is rebuilt')
+                        return json_bytes_response(stale_feed)
+                    for _ in range(20):
+                        time.sleep(0.05)
+                        cached_feed = r.get(cache_key)
+                        if cached_feed:
+                            return json_bytes_response(cached_feed)
             except Exception as e:
                 logger.warning(f'Cache read failed: {e}')
+                r = None
 
         # Get ONLY own posts for Feed page
-        posts_stmt = select(Post).filter(
+        # PERF: select only the response columns (no ORM hydration); ORDER BY ... LIMIT 50 is a
+        # top-K walk of ix_posts_feed (user_id, is_published, created_at DESC) with no sort step.
+        # Every post here belongs to the viewer, so the author is resolved once, not per post.
+        posts_stmt = select(
+            Post.id, Post.content, Post.likes, Post.created_at
+        ).filter(
             Post.user_id == user_id,
             Post.is_published == True
         ).order_by(desc(Post.created_at)).limit(50)
 
-        posts = db.session.execute(posts_stmt).scalars().all()
+        posts = db.session.execute(posts_stmt).all()
+        author_username = _get_username(user_id) if posts else None
+
+        # PERF: reaction/comment counts for all posts in two grouped queries (was 2 per post)
+        post_ids = [post.id for post in posts]
+        reaction_counts = _batch_post_counts(Reaction, post_ids)
+        comment_counts = _batch_post_counts(Comment, post_ids)
 
         feed = []
         for post in posts:
-            # Count reactions
-            reactions_count = db.session.execute(
-                select(func.count(Reaction.id)).filter_by(post_id=post.id)
-            ).scalar() or 0
-
-            # Count comments
-            comments_count = db.session.execute(
-                select(func.count(Comment.id)).filter_by(post_id=post.id)
-            ).scalar() or 0
+            reactions_count = reaction_counts.get(post.id, 0)
+            comments_count = comment_counts.get(post.id, 0)
 
             feed.append({
                 'id': post.id,
                 'content': post.content,
-                'author': post.author.username,
-                'author_id': post.author.id,
+                'author': author_username,
+                'author_id': user_id,
                 'likes': post.likes,
                 'reactions_count': reactions_count,
                 'comments_count': comments_count,
@@ -11861,17 +12580,24 @@ def get_feed():
             })
 
         result = {'posts': feed}
+        # PERF: encode once - the same bytes are cached and returned, and cache hits are served
+        # as-is (no json.loads + jsonify re-encode round trip)
+        payload = json_dumps_bytes(result)
 
-        # Cache result for 5 minutes
-        if REDIS_URL:
+        # Cache result for 5 minutes, plus a longer-lived stale copy for single-flight losers
+        if r is not None:
             try:
-                r = redis.from_url(REDIS_URL)
-                r.setex(cache_key, 300, json.dumps(result))
+                pipe = r.pipeline()
+                pipe.setex(cache_key, _jittered_ttl(300), payload)
+                pipe.setex(stale_key, _jittered_ttl(600), payload)
+                if holds_lock:
+                    pipe.delete(lock_key)
+                pipe.execute()
                 logger.debug(f'Cached feed:{user_id}:{page}')
             except Exception as e:
                 logger.warning(f'Cache write failed: {e}')
 
-        return jsonify(result)
+        return json_bytes_response(payload)
 
     except Exception as e:
         logger.error(f"Feed error: {str(e)}")
@@ -11890,71 +12616,79 @@ def get_hierarchical_feed():
         page = request.args.get('page', 1, type=int)
         per_page = 20
 
-        # Get all posts the user can see
-        visible_posts = []
+        # PERF: keyset pagination - ?cursor=<iso created_at>,<post id> seeks straight to the
+        # next page on (created_at, id) instead of skipping OFFSET rows. ?page= still works.
+        cursor_ts = cursor_id = None
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor_ts_str, cursor_id_str = cursor.rsplit(',', 1)
+                cursor_ts = datetime.fromisoformat(cursor_ts_str)
+                cursor_id = int(cursor_id_str)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+
+        # PERF: visibility hierarchy evaluated in SQL - only the requested page is loaded.
+        # A post is visible if it is the user's own, or its author has the user in a circle
+        # whose level allows the post's visibility (EXISTS avoids duplicates when the user
+        # is in several of the author's circles).
+        in_allowed_circle = exists().where(
+            Circle.user_id == Post.user_id,
+            Circle.circle_user_id == user_id,
+            or_(
+                Post.visibility == 'public',
+                and_(Post.visibility == 'class_b', Circle.circle_type.in_(['class_b', 'class_a'])),
+                and_(Post.visibility == 'class_a', Circle.circle_type == 'class_a')
+            )
+        )
+        feed_stmt = select(Post).where(
+            Post.is_published == True,
+            or_(Post.user_id == user_id, in_allowed_circle)
+        ).order_by(desc(Post.created_at), desc(Post.id))
+        if cursor_ts is not None:
+            feed_stmt = feed_stmt.where(or_(
+                Post.created_at < cursor_ts,
+                and_(Post.created_at == cursor_ts, Post.id < cursor_id)
+            ))
+        else:
+            feed_stmt = feed_stmt.offset((page - 1) * per_page)
+        rows = db.session.execute(feed_stmt.limit(per_page + 1)).scalars().all()
 
-        # 1. User's own posts (all visible)
-        own_posts = Post.query.filter_by(user_id=user_id, is_published=True).all()
-        visible_posts.extend(own_posts)
+        has_more = len(rows) > per_page
+        paginated_posts = rows[:per_page]
+        next_cursor = None
+        if has_more and paginated_posts:
+            last_post = paginated_posts[-1]
+            next_cursor = f"{last_post.created_at.isoformat()},{last_post.id}"
 
-        # 2. Check circles user belongs to for other users' posts
-        # Get circles where current user is a member
-        circles_in = db.session.execute(
-            select(Circle).filter_by(circle_user_id=user_id)
-        ).scalars().all()
+        # PERF: author usernames for the page from the username cache (one query for misses)
+        author_names = _get_usernames({post.user_id for post in paginated_posts})
 
-        for circle in circles_in:
-            # Get posts from this circle owner
-            owner_posts = Post.query.filter_by(
-                user_id=circle.user_id,
-                is_published=True
-            ).all()
-
-            for post in owner_posts:
-                # Apply hierarchy rules
-                if post.visibility == 'public':
-                    # Public posts visible to all circle members
-                    if post not in visible_posts:
-                        visible_posts.append(post)
-                elif post.visibility == 'class_b':
-                    # Class B posts visible to Class B and Class A members
-                    if circle.circle_type in ['class_b', 'class_a']:
-                        if post not in visible_posts:
-                            visible_posts.append(post)
-                elif post.visibility == 'class_a':
-                    # Class A posts only visible to Class A members
-                    if circle.circle_type == 'class_a':
-                        if post not in visible_posts:
-                            visible_posts.append(post)
-
-        # Sort by created_at descending
-        visible_posts.sort(key=lambda x: x.created_at, reverse=True)
-
-        # Paginate
-        start = (page - 1) * per_page
-        end = start + per_page
-        paginated_posts = visible_posts[start:end]
+        # PERF: comment counts for the page in one grouped query (len(post.comments) lazy-loaded
+        # every Comment row of every post just to count them)
+        comment_counts = _batch_post_counts(Comment, [post.id for post in paginated_posts])
 
         # Format response
         posts_data = []
         for post in paginated_posts:
-            author = db.session.get(User, post.user_id)
+            author_name = author_names.get(post.user_id)
             posts_data.append({
                 'id': post.id,
                 'author': {
-                    'id': author.id,
-                    'username': author.username
-                } if author else None,
+                    'id': post.user_id,
+                    'username': author_name
+                } if author_name is not None else None,
                 'content': post.content,
                 'visibility': post.visibility,
                 'created_at': post.created_at.isoformat(),
                 'likes': post.likes,
-                'comments_count': len(post.comments)
+                'comments_count': comment_counts.get(post.id, 0)
             })
 
         return jsonify({
             'posts': posts_data,
-            'has_more': len(visible_posts) > end
+            'has_more': has_more,
+            'next_cursor': next_cursor
         })
 
     except Exception as e:
@@ -12031,8 +12765,14 @@ def get_feed_saved_dates():
     try:
         user_id = session['user_id']
 
-        # Get all posts for this user
-        posts = Post.query.filter_by(user_id=user_id).all()
+        # PERF: let the DB return only distinct (date, visibility) pairs instead of hydrating
+        # every Post row and deduplicating in Python
+        date_rows = db.session.execute(
+            select(func.date(Post.created_at), Post.visibility)
+            .where(Post.user_id == user_id)
+            .distinct()
+            .order_by(func.date(Post.created_at))
+        ).all()
 
         # Organize dates by visibility
         dates_by_visibility = {
@@ -12042,13 +12782,17 @@ def get_feed_saved_dates():
             'private': []
         }
 
-        for post in posts:
-            date_str = post.created_at.strftime('%Y-%m-%d')
-            visibility = post.visibility or 'private'  # Default to private if null
+        # O(1) dedup via a set of (visibility, date) pairs - NULL and 'private' visibility
+        # can both map to 'private' for the same date
+        seen_pairs = set()
+        for post_day, post_visibility in date_rows:
+            # date() comes back as a string on SQLite and a date on PostgreSQL
+            date_str = post_day if isinstance(post_day, str) else post_day.strftime('%Y-%m-%d')
+            visibility = post_visibility or 'private'  # Default to private if null
 
-            if visibility in dates_by_visibility:
-                if date_str not in dates_by_visibility[visibility]:
-                    dates_by_visibility[visibility].append(date_str)
+            if visibility in dates_by_visibility and (visibility, date_str) not in seen_pairs:
+                seen_pairs.add((visibility, date_str))
+                dates_by_visibility[visibility].append(date_str)
 
         # For backward compatibility, also return combined dates
         all_dates = set()
@@ -12104,9 +12848,9 @@ def get_user_feed_dates(user_id):
         # Determine which visibility levels current user can see
         visible_levels = ['general']  # Everyone can see public
         if membership:
-            if membership.circle_type in ['class_a', 'family']:
+            if membership.circle_type in _FAMILY_TIER:
                 visible_levels = ['general', 'close_friends', 'family']
-            elif membership.circle_type in ['class_b', 'close_friends']:
+            elif membership.circle_type in _CLOSE_FRIENDS_TIER:
                 visible_levels = ['general', 'close_friends']
 
         # Get posts filtered by visible visibility levels
@@ -12149,39 +12893,29 @@ def get_user_feed_by_date(user_id, date):
         from datetime import datetime, timedelta
         feed_date = datetime.fromisoformat(date).date()
 
-        # Get start and end of the day
-        start_datetime = datetime.combine(feed_date, datetime.min.time())
-        end_datetime = datetime.combine(feed_date, datetime.max.time())
+        # Get start of the day and start of the next day (half-open range)
+        start_datetime, end_datetime = _day_bounds(feed_date)
 
         # If viewing own posts, return all for that date
         if user_id == current_user_id:
             posts = Post.query.filter(
                 Post.user_id == user_id,
                 Post.created_at >= start_datetime,
-                Post.created_at <= end_datetime
+                Post.created_at < end_datetime
             ).order_by(Post.created_at.desc()).all()
 
             # Calculate likes and comments for each post
+            # PERF: likes, comments and viewer-liked flags in three batched queries (was 3 per post)
+            post_ids = [post.id for post in posts]
+            like_counts = _batch_post_counts(Reaction, post_ids, type='like')
+            comment_counts = _batch_post_counts(Comment, post_ids)
+            liked_ids = _batch_liked_post_ids(post_ids, current_user_id)
+
             posts_data = []
             for post in posts:
-                # Count likes from Reaction table
-                likes_count = db.session.execute(
-                    select(func.count(Reaction.id)).filter_by(post_id=post.id, type='like')
-                ).scalar() or 0
-
-                # Count comments
-                comments_count = db.session.execute(
-                    select(func.count(Comment.id)).filter_by(post_id=post.id)
-                ).scalar() or 0
-
-                # Check if current user liked this post
-                user_liked = db.session.execute(
-                    select(Reaction).filter_by(
-                        post_id=post.id,
-                        user_id=current_user_id,
-                        type='like'
-                    )
-                ).scalar_one_or_none() is not None
+                likes_count = like_counts.get(post.id, 0)
+                comments_count = comment_counts.get(post.id, 0)
+                user_liked = post.id in liked_ids
 
                 posts_data.append({
                     'id': post.id,
@@ -12196,10 +12930,7 @@ def get_user_feed_by_date(user_id, date):
             return jsonify({'posts': posts_data})
 
         # ST10T1: Check if target user has added current user to their connections
-        is_following = Follow.query.filter_by(
-            follower_id=user_id,
-            followed_id=current_user_id
-        ).first() is not None
+        is_following = _follow_exists(user_id, current_user_id)
 
         if not is_following:
             return jsonify({'error': 'Must be connected with this user to view posts'}), 403
@@ -12211,9 +12942,9 @@ def get_user_feed_by_date(user_id, date):
         # Determine which visibility levels current user can see
         visible_levels = ['general']  # Everyone can see public
         if membership:
-            if membership.circle_type in ['class_a', 'family']:
+            if membership.circle_type in _FAMILY_TIER:
                 visible_levels = ['general', 'close_friends', 'family']
-            elif membership.circle_type in ['class_b', 'close_friends']:
+            elif membership.circle_type in _CLOSE_FRIENDS_TIER:
                 visible_levels = ['general', 'close_friends']
 
         # Get posts filtered by visible visibility levels for that date
@@ -12221,33 +12952,24 @@ def get_user_feed_by_date(user_id, date):
             Post.user_id == user_id,
             Post.visibility.in_(visible_levels),
             Post.created_at >= start_datetime,
-            Post.created_at <= end_datetime
+            Post.created_at < end_datetime
         ).order_by(Post.created_at.desc()).all()
 
         if not posts:
             return jsonify({'error': 'This update is not available to you based on your circle membership'}), 403
 
         # Calculate likes and comments for each post
+        # PERF: likes, comments and viewer-liked flags in three batched queries (was 3 per post)
+        post_ids = [post.id for post in posts]
+        like_counts = _batch_post_counts(Reaction, post_ids, type='like')
+        comment_counts = _batch_post_counts(Comment, post_ids)
+        liked_ids = _batch_liked_post_ids(post_ids, current_user_id)
+
         posts_data = []
         for post in posts:
-            # Count likes from Reaction table
-            likes_count = db.session.execute(
-                select(func.count(Reaction.id)).filter_by(post_id=post.id, type='like')
-            ).scalar() or 0
-
-            # Count comments
-            comments_count = db.session.execute(
-                select(func.count(Comment.id)).filter_by(post_id=post.id)
-            ).scalar() or 0
-
-            # Check if current user liked this post
-            user_liked = db.session.execute(
-                select(Reaction).filter_by(
-                    post_id=post.id,
-                    user_id=current_user_id,
-                    type='like'
-                )
-            ).scalar_one_or_none() is not None
+            likes_count = like_counts.get(post.id, 0)
+            comments_count = comment_counts.get(post.id, 0)
+            user_liked = post.id in liked_ids
 
             posts_data.append({
                 'id': post.id,
@@ -12265,6 +12987,34 @@ def get_user_feed_by_date(user_id, date):
         logger.error(f"Error getting user feed by date: {e}")
         return jsonify({'error': str(e)}), 500
 
+def create_feed_post_alerts(user_id):
+    """PJ401: Create a 'new post' alert for every follower of user_id.
+    Runs from the background job queue (job_type='feed_alerts'), not the request path."""
+    username = _get_username(user_id) or 'Someone'
+
+    # Get all followers of this user (ids only - no Follow ORM objects)
+    follower_ids = db.session.execute(
+        select(Follow.follower_id).where(Follow.followed_id == user_id)
+    ).scalars().all()
+
+    # PERF: one executemany INSERT instead of a unit-of-work add() per follower
+    if follower_ids:
+        db.session.execute(insert(Alert), [
+            {
+                'user_id': follower_id,
+                'title': f"New post from {username}",
+                'content': f"{username} shared a new feed post",
+                'alert_type': 'feed',
+                'source_user_id': user_id,  # source_user_id for filtering
+                'alert_category': 'feed'
+            }
+            for follower_id in follower_ids
+        ])
+        db.session.commit()
+    logger.info(f"Created feed alerts for {len(follower_ids)} followers")
+    return len(follower_ids)
+
+
 @app.route('/api/posts', methods=['POST'])
 @login_required
 @rate_limit_endpoint(max_requests=30, window=60, endpoint_name='create_post')
@@ -12306,52 +13056,71 @@ def save_feed_entry():
         # REMOVED: Map visibility to circle_id - no longer needed
         # We now use visibility field directly instead of circle_id
 
-        # Delete any existing posts for this date first
-        Post.query.filter_by(user_id=user_id).filter(
-            db.func.date(Post.created_at) == post_date
-        ).delete()
+        post_values = {
+            'user_id': user_id,
+            'content': sanitize_input(content),  # CHANGE 14: Ensure sanitization
+            'circle_id': None,  # CHANGED: Always None, use visibility instead
+            'visibility': visibility,  # ADDED: Store visibility directly
+            'created_at': parsed_date,
+            'updated_at': datetime.utcnow(),
+            'is_published': True
+        }
 
-        # Create a SINGLE post with visibility field
-        new_post = Post(
-            user_id=user_id,
-            content=sanitize_input(content),  # CHANGE 14: Ensure sanitization
-            circle_id=None,  # CHANGED: Always None, use visibility instead
-            visibility=visibility,  # ADDED: Store visibility directly
-            created_at=datetime.strptime(post_date, '%Y-%m-%d'),
-            updated_at=datetime.utcnow(),
-            is_published=True
-        )
-        db.session.add(new_post)
+        # PERF: One entry per user per date - every entry is stored at the date's midnight, so on
+        # PostgreSQL a single INSERT ... ON CONFLICT (user_id, created_at) DO UPDATE replaces the
+        # DELETE + INSERT pair. Falls back to delete + insert if ux_posts_user_created is missing
+        # (SQLite, or legacy duplicate rows prevented the unique index from being built).
+        upserted = False
+        if 'postgresql' in str(db.engine.url):
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+            upsert_stmt = pg_insert(Post).values(**post_values)
+            upsert_stmt = upsert_stmt.on_conflict_do_update(
+                index_elements=['user_id', 'created_at'],
+                set_={
+                    'content': upsert_stmt.excluded.content,
+                    'circle_id': None,
+                    'visibility': upsert_stmt.excluded.visibility,
+                    'updated_at': upsert_stmt.excluded.updated_at,
+                    'is_published': True
+                }
+            )
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(upsert_stmt)
+                upserted = True
+            except SQLAlchemyError as upsert_error:
+                logger.warning(f"Feed upsert unavailable, using delete + insert: {upsert_error}")
+
+        if not upserted:
+            # Delete any existing posts for this date first
+            day_start, day_end = _day_bounds(parsed_date.date())
+            Post.query.filter_by(user_id=user_id).filter(
+                Post.created_at >= day_start,
+                Post.created_at < day_end
+            ).delete()
+
+            # Create a SINGLE post with visibility field
+            db.session.add(Post(**post_values))
 
         db.session.commit()
         
         # PJ401: Create feed alerts for followers (only for public/general visibility posts)
+        # PERF: fan-out is queued as a background job so the POST returns in constant time
+        # regardless of follower count (see create_feed_post_alerts)
         if visibility == 'general':
             try:
-                user = User.query.get(user_id)
-                username = user.username if user else 'Someone'
-                
-                # Get all followers of this user
-                followers = Follow.query.filter_by(followed_id=user_id).all()
-                
-                for follower in followers:
-                    # Create alert with source_user_id for filtering
-                    alert = Alert(
-                        user_id=follower.follower_id,
-                        title=f"New post from {username}",
-                        content=f"{username} shared a new feed post",
-                        alert_type='feed',
-                        source_user_id=user_id,
-                        alert_category='feed'
-                    )
-                    db.session.add(alert)
-                
+                db.session.add(BackgroundJob(
+                    job_type='feed_alerts',
+                    payload={'user_id': user_id},
+                    priority=0
+                ))
+                _notify_job_queue()
                 db.session.commit()
-                logger.info(f"Created feed alerts for {len(followers)} followers")
             except Exception as alert_error:
-                logger.warning(f"Failed to create feed alerts: {alert_error}")
+                db.session.rollback()
+                logger.warning(f"Failed to queue feed alerts: {alert_error}")
                 # Don't fail the main operation
-        
+
         visibility_display = visibility.replace("_", " ").title()
         return jsonify({'success': True, 'message': f'Feed saved for {visibility_display} on {post_date}'})
 
@@ -12388,16 +13157,7 @@ def like_post(post_id):
             db.session.commit()
 
             # Invalidate feed cache for the post owner
-            if REDIS_URL:
-                try:
-                    r = redis.from_url(REDIS_URL)
-                    # Clear all pages of the post owner's feed
-                    pattern = f'feed:{post.user_id}:*'
-                    for key in r.scan_iter(match=pattern):
-                        r.delete(key)
-                    logger.debug(f'Invalidated feed cache for user {post.user_id}')
-                except Exception as e:
-                    logger.warning(f'Feed cache invalidation failed: {e}')
+            _invalidate_feed_cache(post.user_id)
 
             # Get updated count
             likes_count = db.session.execute(
@@ -12423,16 +13183,7 @@ def like_post(post_id):
             db.session.commit()
 
             # Invalidate feed cache for the post owner
-            if REDIS_URL:
-                try:
-                    r = redis.from_url(REDIS_URL)
-                    # Clear all pages of the post owner's feed
-                    pattern = f'feed:{post.user_id}:*'
-                    for key in r.scan_iter(match=pattern):
-                        r.delete(key)
-                    logger.debug(f'Invalidated feed cache for user {post.user_id}')
-                except Exception as e:
-                    logger.warning(f'Feed cache invalidation failed: {e}')
+            _invalidate_feed_cache(post.user_id)
 
             # Get updated count
             likes_count = db.session.execute(
@@ -12468,17 +13219,18 @@ def get_post_comments(post_id):
         comments = db.session.execute(
             select(Comment).filter_by(post_id=post_id).order_by(Comment.created_at.asc())
         ).scalars().all()
+        # PERF: comment author usernames from the username cache (one query for misses)
+        author_names = _get_usernames({comment.user_id for comment in comments})
 
         comments_data = []
         for comment in comments:
-            author = db.session.get(User, comment.user_id)
             comments_data.append({
                 'id': comment.id,
                 'content': comment.content,
                 'created_at': comment.created_at.isoformat(),
                 'author': {
-                    'id': author.id,
-                    'username': author.username
+                    'id': comment.user_id,
+                    'username': author_names.get(comment.user_id)
                 }
             })
 
@@ -12516,16 +13268,7 @@ def add_comment(post_id):
         db.session.commit()
 
         # Invalidate feed cache for the post owner
-        if REDIS_URL:
-            try:
-                r = redis.from_url(REDIS_URL)
-                # Clear all pages of the post owner's feed
-                pattern = f'feed:{post.user_id}:*'
-                for key in r.scan_iter(match=pattern):
-                    r.delete(key)
-                logger.debug(f'Invalidated feed cache for user {post.user_id}')
-            except Exception as e:
-                logger.warning(f'Feed cache invalidation failed: {e}')
+        _invalidate_feed_cache(post.user_id)
 
         # Get author information
         author = db.session.get(User, user_id)
@@ -12562,12 +13305,18 @@ def load_feed_by_date(date_str):
         user_id = session['user_id']
         visibility = request.args.get('visibility', 'general')
 
+        try:
+            day_start, day_end = _day_bounds(date_str)
+        except ValueError:
+            return jsonify({'error': 'Invalid date format'}), 400
+
         # Get the post for this date that matches the requested visibility
         post = Post.query.filter_by(
             user_id=user_id,
             visibility=visibility  # Match by visibility field, not circle_id
         ).filter(
-            db.func.date(Post.created_at) == date_str
+            Post.created_at >= day_start,
+            Post.created_at < day_end
         ).first()
 
         if post:
@@ -12593,6 +13342,76 @@ def load_feed_by_date(date_str):
 # =====================
 # PARAMETERS ROUTES (Therapy Companion)
 # =====================
+# Encouragement messages returned by save_parameters (module-level: built once, not per request)
+_ENCOURAGEMENTS = (
+    "Great job tracking your well-being today! 🌟",
+    "Your consistency is inspiring! Keep it up! 💪",
+    "Every check-in is a step forward! 🚀",
+    "Thank you for taking care of yourself! ❤️",
+    "Your commitment to well-being is admirable! 🌈"
+)
+
+# Tracked diary parameters and the accepted privacy levels (module-level: no per-request
+# list rebuilds, O(1) membership checks on the save path)
+_PARAM_FIELDS = ('mood', 'energy', 'sleep_quality', 'physical_activity', 'anxiety', 'social_belonging')
+_PRIVACY_FIELDS = tuple(f"{field}_privacy" for field in _PARAM_FIELDS)
+_PRIVACY_VALUES = frozenset({'public', 'class_a', 'class_b', 'private'})
+
+# PERF: typed schema for the POST /api/parameters body (ratings 1-4, known privacy levels).
+# Fields default to UNSET so "absent" stays distinct from an explicit null. A body that does
+# not validate falls back to the lenient per-field loop in save_parameters, which skips bad
+# values instead of rejecting the request - so behaviour is unchanged either way.
+if MSGSPEC_AVAILABLE:
+    from typing import Annotated, Literal, Union
+    _RatingField = Union[Annotated[int, msgspec.Meta(ge=1, le=4)], None, msgspec.UnsetType]
+    _PrivacyField = Union[Literal['public', 'class_a', 'class_b', 'private'], None, msgspec.UnsetType]
+    _OptionalStr = Union[str, None, msgspec.UnsetType]
+    SaveParamsBody = msgspec.defstruct('SaveParamsBody', [
+        ('date', _OptionalStr, msgspec.UNSET),
+        *[(field, _RatingField, msgspec.UNSET) for field in _PARAM_FIELDS],
+        *[(pf, _PrivacyField, msgspec.UNSET) for pf in _PRIVACY_FIELDS],
+        ('notes', _OptionalStr, msgspec.UNSET),
+        ('notes_privacy', _PrivacyField, msgspec.UNSET),
+    ])
+    _save_params_decoder = msgspec.json.Decoder(SaveParamsBody, strict=False)
+
+
+def _decode_save_params_body():
+    """Decode + validate the save_parameters JSON body with msgspec.
+    Returns a dict of the fields present in the body, or None if msgspec is unavailable,
+    the request is not JSON, or the body does not match SaveParamsBody."""
+    if not MSGSPEC_AVAILABLE or not request.is_json:
+        return None
+    try:
+        body = _save_params_decoder.decode(request.get_data(cache=True))
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+    return {f: v for f in body.__struct_fields__
+            if (v := getattr(body, f)) is not msgspec.UNSET}
+
+
+@lru_cache(maxsize=1)
+def _today_iso(minute):
+    """Local today as 'YYYY-MM-DD', computed once per minute bucket.
+    Call as _today_iso(int(time.time()) // 60); day boundaries fall on minute boundaries,
+    so the cached value never outlives the date."""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+# GET /api/parameters payload for a date with no entry
+_DEFAULT_PARAMS_PAYLOAD = {
+    'parameters': {field: 0 for field in _PARAM_FIELDS},
+    **{pf: 'private' for pf in _PRIVACY_FIELDS},
+    'notes': '',
+    'notes_privacy': 'private'  # NP1
+}
+
+
+def _param_values(params):
+    """The six diary ratings of a SavedParameters row as ints (unset -> 0)."""
+    return {field: int(getattr(params, field) or 0) for field in _PARAM_FIELDS}
+
+
 # app.py - Fix for /api/parameters GET endpoint
 # Location: Replace lines 3189-3235 in app.py
 
@@ -12605,59 +13424,25 @@ def get_parameters():
         date_str = request.args.get('date')
 
         if not date_str:
-            date_str = datetime.now().strftime('%Y-%m-%d')
-
-        params = SavedParameters.query.filter_by(
-            user_id=user_id,
-            date=date_str
-        ).first()
-
-        if params:
-            return jsonify({
-                'success': True,
-                'data': {
-                    'parameters': {
-                        'mood': int(params.mood) if params.mood else 0,
-                        'energy': int(params.energy) if params.energy else 0,
-                        'sleep_quality': int(params.sleep_quality) if params.sleep_quality else 0,
-                        'physical_activity': int(params.physical_activity) if params.physical_activity else 0,
-                        'anxiety': int(params.anxiety) if params.anxiety else 0,
-                        'social_belonging': int(params.social_belonging) if params.social_belonging else 0
-                    },
-                    # ADD ALL PRIVACY SETTINGS HERE
-                    'mood_privacy': params.mood_privacy or 'private',
-                    'energy_privacy': params.energy_privacy or 'private',
-                    'sleep_quality_privacy': params.sleep_quality_privacy or 'private',
-                    'physical_activity_privacy': params.physical_activity_privacy or 'private',
-                    'anxiety_privacy': params.anxiety_privacy or 'private',
-                    'social_belonging_privacy': params.social_belonging_privacy or 'private',
-                    'notes': params.notes or '',
+            date_str = _today_iso(int(time.time()) // 60)
+
+        data = _get_cached_params_payload(user_id, date_str)
+        if data is None:
+            params = _get_params_cached(user_id, date_str)
+
+            if params:
+                # Values are already coalesced by the SELECT - no per-field casts here
+                data = {
+                    'parameters': {field: getattr(params, field) for field in _PARAM_FIELDS},
+                    **{pf: getattr(params, pf) for pf in _PRIVACY_FIELDS},
+                    'notes': params.notes,
                     'notes_privacy': _get_notes_privacy(params.id)  # NP1
                 }
-            })
-        else:
-            return jsonify({
-                'success': True,
-                'data': {
-                    'parameters': {
-                        'mood': 0,
-                        'energy': 0,
-                        'sleep_quality': 0,
-                        'physical_activity': 0,
-                        'anxiety': 0,
-                        'social_belonging': 0
-                    },
-                    # ADD DEFAULT PRIVACY SETTINGS
-                    'mood_privacy': 'private',
-                    'energy_privacy': 'private',
-                    'sleep_quality_privacy': 'private',
-                    'physical_activity_privacy': 'private',
-                    'anxiety_privacy': 'private',
-                    'social_belonging_privacy': 'private',
-                    'notes': '',
-                    'notes_privacy': 'private'  # NP1
-                }
-            })
+            else:
+                data = _DEFAULT_PARAMS_PAYLOAD  # read-only: serialized, never mutated
+            _set_cached_params_payload(user_id, date_str, data)
+
+        return conditional_ojsonify({'success': True, 'data': data})
 
     except Exception as e:
         logger.error(f"Get parameters error: {str(e)}")
@@ -12669,16 +13454,18 @@ def get_parameters():
 def save_parameters():
     """Save user parameters with privacy settings"""
     try:
-        data = request.get_json()
+        # PERF: schema-validated fast path; None -> lenient per-field validation below
+        validated = _decode_save_params_body()
+        data = validated if validated is not None else request.get_json()
         user_id = session.get('user_id')
         date_str = data.get('date')
         
         # CHANGE 10: Define limits for wellness data (Ethics: Data protection)
         MAX_NOTES_LENGTH = 2000
         
-        # PJ809: Add logging to confirm save_parameters is called
-        logger.info(f"[SAVE PARAMS] ========================================")
-        logger.info(f"[SAVE PARAMS] save_parameters called for user_id={user_id}, date={date_str}")
+        # PJ809: confirm save_parameters is called (PERF: DEBUG + lazy %-formatting - no string
+        # building or handler I/O on the hot write path unless debug logging is enabled)
+        logger.debug('[SAVE PARAMS] save_parameters called for user_id=%s, date=%s', user_id, date_str)
 
         if not date_str:
             return jsonify({'error': 'Date is required'}), 400
@@ -12698,98 +13485,174 @@ def save_parameters():
         except ValueError:
             return jsonify({'error': 'Invalid date format'}), 400
 
-        # Find or create parameter entry
-        params = SavedParameters.query.filter_by(
-            user_id=user_id,
-            date=date_str
-        ).first()
-
-        if not params:
-            params = SavedParameters(
-                user_id=user_id,
-                date=date_str
-            )
-            # C15 FIX: Carry forward privacy settings from most recent entry
-            # so quick check-in from home page doesn't reset privacy to 'private'
-            try:
-                recent = SavedParameters.query.filter_by(user_id=user_id)\
-                    .order_by(SavedParameters.date.desc()).first()
-                if recent:
-                    _carried = {}
-                    for _pf in ['mood_privacy', 'energy_privacy', 'sleep_quality_privacy',
-                                'physical_activity_privacy', 'anxiety_privacy',
-                                'social_belonging_privacy']:
-                        _pv = getattr(recent, _pf, None)
-                        if _pv:
-                            setattr(params, _pf, _pv)
-                            _carried[_pf] = _pv
-                    logger.info(f"[C15/B7] Carried forward privacy from {recent.date} for new entry {date_str}: {_carried}")
-                else:
-                    logger.info(f"[C15/B7] No previous entry found for user {user_id} — using ORM defaults")
-            except Exception as pf_err:
-                logger.warning(f"[C15] Could not carry forward privacy: {pf_err}")
-
-        # Update values - ENSURE INTEGER CONVERSION
-        for field in ['mood', 'energy', 'sleep_quality', 'physical_activity', 'anxiety', 'social_belonging']:
-            if field in data:
-                value = data[field]
-                if value is not None:
-                    try:
-                        # Convert to integer
-                        int_value = int(value)
-                        if 1 <= int_value <= 4:
-                            setattr(params, field, int_value)
-                    except (ValueError, TypeError):
-                        pass  # Skip invalid values
-
-            # Handle privacy settings
-            privacy_field = f"{field}_privacy"
-            if privacy_field in data:
-                privacy_value = data[privacy_field]
-                if privacy_value in ['public', 'class_a', 'class_b', 'private']:
-                    setattr(params, privacy_field, privacy_value)
+        # Validate incoming values once - both the upsert and the ORM path use them
+        if validated is not None:
+            # Every present value already passed the schema (int 1-4 / known privacy level)
+            new_values = {f: v for f, v in validated.items()
+                          if v is not None and (f in _PARAM_FIELDS or f in _PRIVACY_FIELDS)}
+        else:
+            new_values = {}
+            # Update values - ENSURE INTEGER CONVERSION
+            for field in _PARAM_FIELDS:
+                if field in data:
+                    value = data[field]
+                    if value is not None:
+                        try:
+                            # Convert to integer
+                            int_value = int(value)
+                            if 1 <= int_value <= 4:
+                                new_values[field] = int_value
+                        except (ValueError, TypeError):
+                            pass  # Skip invalid values
+
+                # Handle privacy settings
+                privacy_field = f"{field}_privacy"
+                if privacy_field in data:
+                    privacy_value = data[privacy_field]
+                    if privacy_value in _PRIVACY_VALUES:
+                        new_values[privacy_field] = privacy_value
 
         if 'notes' in data:
-            params.notes = data['notes']
+            new_values['notes'] = data['notes']
 
         # B7: Log whether privacy fields were included (helps diagnose reset reports)
-        _has_privacy_in_request = any(f'{p}_privacy' in data for p in ['mood','energy','sleep_quality','physical_activity','anxiety','social_belonging'])
-        logger.info(f"[SAVE PARAMS/B7] privacy_in_request={_has_privacy_in_request}, notes_privacy_in_request={'notes_privacy' in data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('[SAVE PARAMS/B7] privacy_in_request=%s, notes_privacy_in_request=%s',
+                         any(pf in data for pf in _PRIVACY_FIELDS), 'notes_privacy' in data)
 
         # NP1: Save notes_privacy via raw SQL (column not in ORM)
         # Always attempt the save - don't rely on startup flag which may be stale
         _np_priv_to_save = None
         if 'notes_privacy' in data:
             notes_priv = data['notes_privacy']
-            if notes_priv in ['public', 'class_a', 'class_b', 'private']:
+            if notes_priv in _PRIVACY_VALUES:
                 _np_priv_to_save = notes_priv
 
-        params.updated_at = datetime.utcnow()
-        db.session.add(params)
-        db.session.commit()
+        now_utc = datetime.utcnow()
+        new_values['updated_at'] = now_utc
+
+        # PERF: values/privacy that trigger processing depends on - if none of them changed
+        # on an existing entry (e.g. notes-only edit or identical re-save), no job is queued
+        _trigger_fields = _PARAM_FIELDS + _PRIVACY_FIELDS
+        old_trigger_values = None  # None = new entry
+
+        upserted = False
+        if 'postgresql' in str(db.engine.url):
+            # PERF: single INSERT ... ON CONFLICT (user_id, date) DO UPDATE replaces the
+            # SELECT + INSERT/UPDATE pair. Only fields sent in the request are overwritten on
+            # conflict. For a new row, C15 privacy carry-forward from the most recent entry is
+            # done with scalar subqueries inside the same statement.
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            def _carried_privacy(column):
+                return func.coalesce(
+                    select(column).where(
+                        SavedParameters.user_id == user_id
+                    ).order_by(SavedParameters.date.desc()).limit(1).scalar_subquery(),
+                    'private'
+                )
 
-        if _np_priv_to_save:
+            insert_values = {
+                'user_id': user_id,
+                'date': date_str,
+                'created_at': now_utc,
+                **{pf: _carried_privacy(getattr(SavedParameters, pf))
+                   for pf in _PRIVACY_FIELDS if pf not in new_values},
+                **new_values
+            }
+            # The CTE reads the pre-upsert row from the statement snapshot, so RETURNING can
+            # report the old trigger-relevant values without a separate SELECT
+            sp_columns = SavedParameters.__table__.c
+            old_row = select(*[sp_columns[f] for f in _trigger_fields]).where(
+                SavedParameters.user_id == user_id,
+                SavedParameters.date == date_str
+            ).cte('old_params')
+            upsert_stmt = pg_insert(SavedParameters).values(**insert_values)
+            upsert_stmt = upsert_stmt.on_conflict_do_update(
+                index_elements=['user_id', 'date'],
+                set_={k: upsert_stmt.excluded[k] for k in new_values}
+            ).add_cte(old_row).returning(
+                *sp_columns,
+                select(func.count()).select_from(old_row).scalar_subquery().label('had_row'),
+                *[select(old_row.c[f]).scalar_subquery().label(f'old_{f}') for f in _trigger_fields]
+            )
+            # SAVEPOINT: on legacy tables where _user_date_uc could not be built (e.g. duplicate
+            # rows) ON CONFLICT has no arbiter index - fall back to the select + insert/update
             try:
-                db.session.execute(
-                    text("UPDATE saved_parameters SET notes_privacy = :np WHERE id = :pid"),
-                    {'np': _np_priv_to_save, 'pid': params.id}
+                with db.session.begin_nested():
+                    params = db.session.execute(upsert_stmt).one()
+                upserted = True
+                if params.had_row:
+                    old_trigger_values = {f: getattr(params, f'old_{f}') for f in _trigger_fields}
+            except SQLAlchemyError as upsert_error:
+                logger.warning(f"Parameters upsert unavailable, using select + insert/update: {upsert_error}")
+
+        if not upserted:
+            # Find or create parameter entry
+            params = SavedParameters.query.filter_by(
+                user_id=user_id,
+                date=date_str
+            ).first()
+
+            if params:
+                old_trigger_values = {f: getattr(params, f) for f in _trigger_fields}
+            else:
+                params = SavedParameters(
+                    user_id=user_id,
+                    date=date_str
                 )
-                db.session.commit()
-                logger.info(f"[NP1] Saved notes_privacy={_np_priv_to_save} for params id={params.id}")
-            except Exception as np_err:
-                logger.warning(f"[NP1] Could not save notes_privacy: {np_err}")
+                # C15 FIX: Carry forward privacy settings from most recent entry
+                # so quick check-in from home page doesn't reset privacy to 'private'
                 try:
-                    db.session.rollback()
-                except Exception:
-                    pass
+                    recent = SavedParameters.query.filter_by(user_id=user_id)\
+                        .order_by(SavedParameters.date.desc()).first()
+                    if recent:
+                        _carried = {}
+                        for _pf in _PRIVACY_FIELDS:
+                            _pv = getattr(recent, _pf, None)
+                            if _pv:
+                                setattr(params, _pf, _pv)
+                                _carried[_pf] = _pv
+                        logger.debug('[C15/B7] Carried forward privacy from %s for new entry %s: %s',
+                                     recent.date, date_str, _carried)
+                    else:
+                        logger.debug('[C15/B7] No previous entry found for user %s — using ORM defaults', user_id)
+                except Exception as pf_err:
+                    logger.warning(f"[C15] Could not carry forward privacy: {pf_err}")
+                # Only new rows need add(); a queried row is already in the session. Added after
+                # the C15 lookup so autoflush cannot make the new row its own "most recent" entry
+                db.session.add(params)
+
+            for field, value in new_values.items():
+                setattr(params, field, value)
+            db.session.flush()  # assign params.id for the notes_privacy update below
+
+        # NP1: notes_privacy is written/read via raw SQL inside a SAVEPOINT so a missing
+        # column cannot abort the surrounding transaction
+        current_notes_privacy = _np_priv_to_save or 'private'
+        try:
+            with db.session.begin_nested():
+                if _np_priv_to_save:
+                    db.session.execute(
+                        text("UPDATE saved_parameters SET notes_privacy = :np WHERE id = :pid"),
+                        {'np': _np_priv_to_save, 'pid': params.id}
+                    )
+                    logger.debug('[NP1] Saved notes_privacy=%s for params id=%s', _np_priv_to_save, params.id)
+                else:
+                    current_notes_privacy = db.session.execute(
+                        text("SELECT notes_privacy FROM saved_parameters WHERE id = :pid"),
+                        {'pid': params.id}
+                    ).scalar() or 'private'
+        except Exception as np_err:
+            logger.warning(f"[NP1] Could not save notes_privacy: {np_err}")
         
         # PJ809: Log parameter values before trigger check
-        logger.info(f"[SAVE PARAMS] Saved: mood={params.mood}, energy={params.energy}, sleep={params.sleep_quality}, activity={params.physical_activity}, anxiety={params.anxiety}, belonging={getattr(params, 'social_belonging', None)}")
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('[SAVE PARAMS] Saved: %s',
+                         {f: getattr(params, f, None) for f in _PARAM_FIELDS})
+
         # PJ6006: Run trigger processing in background thread to avoid blocking response
         # This prevents the 5+ second delay when multiple alert emails need to be sent
-        logger.info(f"[SAVE PARAMS] Creating background job for trigger processing user_id={user_id}")
-        
         # Create a copy of param values for the background job
         # PJ6016 FIX: Convert date to ISO string for JSON serialization
         param_snapshot = {
@@ -12805,57 +13668,48 @@ def save_parameters():
             'physical_activity_privacy': getattr(params, 'physical_activity_privacy', 'private'),
             'anxiety_privacy': getattr(params, 'anxiety_privacy', 'private'),
             'social_belonging_privacy': getattr(params, 'social_belonging_privacy', 'private'),  # C15
-            'notes_privacy': _get_notes_privacy(params.id),  # NP1
+            'notes_privacy': current_notes_privacy,  # NP1
             'date': str(params.date) if params.date else None,  # C20 FIX: date is String(10), no .isoformat()
             'notes': params.notes
         }
         
-        # Create a background job instead of spawning a thread
-        # This provides: persistence, retries, and prevents thread exhaustion
-        try:
-            job = BackgroundJob(
-                job_type='trigger_processing',
-                payload={
-                    'user_id': user_id,
-                    'param_snapshot': param_snapshot
-                },
-                priority=1  # Normal priority
-            )
-            db.session.add(job)
-            db.session.commit()
-            logger.info(f"[SAVE PARAMS] Created background job {job.id} for trigger processing")
-        except Exception as job_err:
-            logger.error(f"[SAVE PARAMS] Failed to create background job: {str(job_err)}")
-            # Don't fail the save if job creation fails - it's not critical
-            db.session.rollback()
+        if old_trigger_values is None:
+            changed_fields = list(_trigger_fields)
+        else:
+            changed_fields = [f for f in _trigger_fields if param_snapshot.get(f) != old_trigger_values.get(f)]
 
-        import random
-        encouragements = [
-            "Great job tracking your well-being today! 🌟",
-            "Your consistency is inspiring! Keep it up! 💪",
-            "Every check-in is a step forward! 🚀",
-            "Thank you for taking care of yourself! ❤️",
-            "Your commitment to well-being is admirable! 🌈"
-        ]
+        if not changed_fields:
+            db.session.commit()
+            logger.debug('[SAVE PARAMS] No trigger-relevant change for user %s on %s - skipping trigger job',
+                         user_id, date_str)
+        else:
+            # Create a background job instead of spawning a thread
+            # This provides: persistence, retries, and prevents thread exhaustion
+            # PERF: the job is written in the SAME transaction as the parameters (one COMMIT /
+            # WAL flush instead of three); a failed save never leaves an orphan job and a
+            # successful save never loses its job
+            # PERF: debounced - repeated saves while a job is still pending fold into that job
+            job_id = enqueue_trigger_processing_job(user_id, {
+                'user_id': user_id,
+                'param_snapshot': param_snapshot,
+                'changed': changed_fields
+            })
+            _notify_job_queue(job_id)  # delivered on commit - wakes the scheduler immediately
+            db.session.commit()
+            logger.debug('[SAVE PARAMS] Queued background job %s for trigger processing', job_id)
+        _invalidate_params_cache(user_id, date_str)
 
         # Return consistent format
-        return jsonify({
+        return ojsonify({
             'success': True,
             'message': 'Parameters saved successfully',
-            'encouragement': random.choice(encouragements),
+            'encouragement': random.choice(_ENCOURAGEMENTS),
             'data': {
-                'parameters': {
-                    'mood': int(params.mood) if params.mood else 0,
-                    'energy': int(params.energy) if params.energy else 0,
-                    'sleep_quality': int(params.sleep_quality) if params.sleep_quality else 0,
-                    'physical_activity': int(params.physical_activity) if params.physical_activity else 0,
-                    'anxiety': int(params.anxiety) if params.anxiety else 0,
-                    'social_belonging': int(params.social_belonging) if params.social_belonging else 0
-                },
+                'parameters': _param_values(params),
                 'notes': params.notes or '',
-                'notes_privacy': _get_notes_privacy(params.id)  # NP1
+                'notes_privacy': current_notes_privacy  # NP1
             }
-        }), 200
+        })
 
     except Exception as e:
         logger.error(f"Error saving parameters: {str(e)}")
@@ -12894,6 +13748,7 @@ def save_notes():
 
         entry.notes = notes
         db.session.commit()
+        _invalidate_params_cache(user_id, date_str)
         logger.info(f"[K3] Updated notes for user {user_id} date {date_str} (reflection save)")
         return jsonify({'success': True})
 
@@ -12937,6 +13792,7 @@ def set_default_privacy():
                     {'priv': privacy, 'uid': user_id}
                 )
                 db.session.commit()
+                _invalidate_params_cache(user_id)
                 rows_updated = result.rowcount
                 logger.info(f"[T30] Set notes_privacy={privacy} for user {user_id}, {rows_updated} rows updated")
             except Exception as np_err:
@@ -12950,6 +13806,7 @@ def set_default_privacy():
                 {'priv': privacy, 'uid': user_id}
             )
             db.session.commit()
+            _invalidate_params_cache(user_id)
             rows_updated = result.rowcount
             logger.info(f"[T30] Set {privacy_col}={privacy} for user {user_id}, {rows_updated} rows updated")
 
@@ -12980,6 +13837,242 @@ def set_default_privacy():
 # BACKGROUND JOB QUEUE SYSTEM
 # =============================================================================
 
+# PERF: a batch's jobs run concurrently on this many threads. Each thread holds at most one
+# pooled connection, well inside the engine's pool_size
+_JOB_WORKERS = 8
+# A 'processing' job whose lock is older than this was claimed by a worker that died
+_JOB_STALE_LOCK_MINUTES = 15
+
+
+def enqueue_trigger_processing_job(user_id, payload):
+    """Queue a 'trigger_processing' job for user_id in the current transaction; returns its id.
+    PERF: debounced per user on PostgreSQL - if a job for the user is still pending, this save
+    folds into it (INSERT ... ON CONFLICT on the ux_bgjob_pending_trigger_user partial unique
+    index) instead of queueing another full 30-day trigger scan. The folded job takes the
+    latest snapshot and moves to the back of the queue; it is marked 'coalesced' and its
+    'changed' list becomes every trigger field, since the saves it absorbed may have touched
+    other fields or dates."""
+    if 'postgresql' in str(db.engine.url):
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        try:
+            with db.session.begin_nested():
+                now = datetime.utcnow()
+                job_stmt = pg_insert(BackgroundJob).values(
+                    job_type='trigger_processing', payload=payload, status='pending',
+                    priority=1, attempts=0, max_attempts=3, created_at=now
+                )
+                job_stmt = job_stmt.on_conflict_do_update(
+                    index_elements=[literal_column("(payload->>'user_id')")],
+                    index_where=and_(
+                        BackgroundJob.status == 'pending',
+                        BackgroundJob.job_type == 'trigger_processing'
+                    ),
+                    set_={
+                        'payload': {**payload, 'changed': list(_PARAM_FIELDS + _PRIVACY_FIELDS),
+                                    'coalesced': True},
+                        'created_at': now
+                    }
+                ).returning(BackgroundJob.id)
+                return db.session.execute(job_stmt).scalar()
+        except Exception as e:
+            # e.g. the partial unique index is missing - fall back to a plain insert
+            logger.warning(f"[JOB QUEUE] Debounced enqueue failed, inserting job directly: {e}")
+
+    job = BackgroundJob(
+        job_type='trigger_processing',
+        payload=payload,
+        priority=1  # Normal priority
+    )
+    db.session.add(job)
+    db.session.flush()
+    return job.id
+
+
+def _run_background_job(job_type, payload):
+    """Execute one claimed job's handler. Runs on a worker thread, so it pushes its own app
+    context - and with it its own scoped DB session (no identity map shared across threads),
+    removed on teardown. Raises on failure; the caller records retries/failures.
+    send_consolidated_wellness_alert_email() returns False for both opt-outs and send
+    failures, so a False result is logged rather than retried."""
+    with app.app_context():
+        if job_type == 'send_email':
+            if payload.get('kind') == 'consolidated_wellness_alert':
+                _sent = send_consolidated_wellness_alert_email(
+                    payload['watcher_id'],
+                    payload['watched_username'],
+                    payload['triggered_params'],
+                    payload.get('user_language', 'en')
+                )
+                logger.info(f"[JOB QUEUE] send_email delivered: sent={_sent}")
+            else:
+                raise ValueError(f"Invalid payload for send_email: {payload}")
+        
+        elif job_type == 'trigger_processing':
+            user_id = payload.get('user_id')
+            param_snapshot = payload.get('param_snapshot')
+
+            if user_id and param_snapshot:
+                # PERF: an all-clear save cannot create a streak - skip the 30-day scan and only
+                # clean up stale alerts. A coalesced job stands for several saves, so it always
+                # runs the full scan
+                if payload.get('coalesced') or _snapshot_can_trigger(param_snapshot):
+                    process_parameter_triggers_async(user_id, param_snapshot)
+                else:
+                    logger.info(f"[JOB QUEUE] Saved values for user {user_id} cannot trigger - skipping streak scan")
+                cleanup_stale_trigger_alerts_for_user(user_id)
+            else:
+                raise ValueError(f"Invalid payload for trigger_processing: {payload}")
+
+        elif job_type == 'feed_alerts':
+            _feed_user_id = payload.get('user_id')
+            if _feed_user_id:
+                create_feed_post_alerts(_feed_user_id)
+            else:
+                raise ValueError(f"Invalid payload for feed_alerts: {payload}")
+
+
+        elif job_type == 'send_batch_alert_emails':
+            # G60: Send existing unread alerts as emails when email_on_alert is turned ON
+            _user_id = payload.get('user_id')
+            if _user_id:
+                _user = db.session.get(User, _user_id)
+                if _user and _user.email:
+                    _unread = Alert.query.filter(
+                        Alert.user_id == _user_id,
+                        Alert.is_read == False,
+                        Alert.alert_category != 'trigger'
+                    ).order_by(Alert.created_at.desc()).limit(50).all()
+                    _lang = _user.preferred_language or 'en'
+                    _sent = 0
+                    for _alert in _unread:
+                        try:
+                            _title = _alert.title
+                            try:
+                                _td = json.loads(_alert.title)
+                                if isinstance(_td, dict) and 'key' in _td:
+                                    _title = _td.get('params', {}).get('username', 'Alert')
+                                    if 'new_message' in _td.get('key', ''):
+                                        _title = f"New message from {_title}"
+                                    elif 'started_following' in _td.get('key', ''):
+                                        _title = f"{_title} accepted your connection request"
+                                    elif 'invitation' in _td.get('key', '').lower():
+                                        _title = "New invitation"
+                            except Exception:
+                                pass
+                            send_alert_notification_email(_user.email, _title, _alert.content or '', _lang)
+                            _sent += 1
+                        except Exception as _email_err:
+                            logger.error(f"[JOB QUEUE] Alert email error: {_email_err}")
+                            continue
+                    logger.info(f"[JOB QUEUE] Sent {_sent} batch alert emails for user {_user_id}")
+                else:
+                    logger.warning(f"[JOB QUEUE] User {_user_id} not found or no email")
+            else:
+                raise ValueError(f"Invalid payload for send_batch_alert_emails: {payload}")
+
+        else:
+            logger.warning(f"[JOB QUEUE] Unknown job type: {job_type}")
+
+
+# Retry UPDATE for PostgreSQL: a failed trigger job whose user already has a pending trigger
+# job is left out - that job re-scans the same data, and requeueing this one would violate the
+# one-pending-job-per-user index. The test is part of the UPDATE itself, so an enqueue landing
+# between a separate check and the write cannot slip in.
+_REQUEUE_JOBS_SQL = text(
+    "UPDATE background_jobs SET status = 'pending', locked_by = NULL, locked_at = NULL "
+    "WHERE id IN :ids AND NOT (job_type = 'trigger_processing' AND EXISTS ("
+    "  SELECT 1 FROM background_jobs p WHERE p.status = 'pending' "
+    "  AND p.job_type = 'trigger_processing' "
+    "  AND p.payload->>'user_id' = background_jobs.payload->>'user_id')) "
+    "RETURNING id"
+).bindparams(bindparam('ids', expanding=True))
+
+
+def _write_job_outcomes(completed_ids, retry_ids, failed_jobs):
+    """Write job outcomes back and commit; returns the number of jobs requeued for a retry.
+    A retry that is superseded by a newer pending job for the same user is marked completed."""
+    if retry_ids and 'postgresql' in str(db.engine.url):
+        requeued = set(db.session.execute(_REQUEUE_JOBS_SQL, {'ids': retry_ids}).scalars())
+    elif retry_ids:
+        db.session.execute(
+            update(BackgroundJob).where(BackgroundJob.id.in_(retry_ids)).values(
+                status='pending', locked_by=None, locked_at=None
+            ).execution_options(synchronize_session=False)
+        )
+        requeued = set(retry_ids)
+    else:
+        requeued = set()
+    completed_ids = list(completed_ids) + [jid for jid in retry_ids if jid not in requeued]
+    if completed_ids:
+        db.session.execute(
+            update(BackgroundJob).where(BackgroundJob.id.in_(completed_ids)).values(
+                status='completed', completed_at=datetime.utcnow(),
+                locked_by=None, locked_at=None
+            ).execution_options(synchronize_session=False)
+        )
+    if failed_jobs:
+        # Bulk UPDATE by primary key (executemany) - each row keeps its own error message
+        db.session.execute(
+            update(BackgroundJob),
+            [{**fj, 'status': 'failed', 'locked_by': None, 'locked_at': None} for fj in failed_jobs]
+        )
+    db.session.commit()
+    return len(requeued)
+
+
+def _record_job_outcomes(completed_ids, retry_ids, failed_jobs):
+    """Write a batch's outcomes in one transaction; returns the number of jobs requeued.
+    If the bulk write fails, each job's outcome is written on its own, so one bad row cannot
+    leave the whole batch stuck in 'processing'."""
+    try:
+        return _write_job_outcomes(completed_ids, retry_ids, failed_jobs)
+    except Exception as status_err:
+        logger.error(f"[JOB QUEUE] Could not record job outcomes in bulk, writing them per job: {status_err}")
+        db.session.rollback()
+
+    requeued = 0
+    outcomes = ([(jid, ([jid], [], [])) for jid in completed_ids]
+                + [(jid, ([], [jid], [])) for jid in retry_ids]
+                + [(fj['id'], ([], [], [fj])) for fj in failed_jobs])
+    for job_id, outcome in outcomes:
+        try:
+            requeued += _write_job_outcomes(*outcome)
+            continue
+        except Exception as job_err:
+            db.session.rollback()
+            if not outcome[1]:
+                logger.error(f"[JOB QUEUE] Could not record outcome for job {job_id}: {job_err}")
+                continue
+        # The requeue lost a race with a new pending job for the same user, which
+        # supersedes this one
+        try:
+            _write_job_outcomes([job_id], [], [])
+        except Exception as job_err:
+            db.session.rollback()
+            logger.error(f"[JOB QUEUE] Could not record outcome for job {job_id}: {job_err}")
+    return requeued
+
+
+def _recover_stale_job_locks(now):
+    """Release 'processing' jobs whose lock is older than _JOB_STALE_LOCK_MINUTES. Only the
+    scheduler holding the job-queue advisory lock processes jobs, and a batch is settled
+    within one run, so such a lock belongs to a worker that is gone."""
+    stale = db.session.execute(select(
+        BackgroundJob.id, BackgroundJob.attempts, BackgroundJob.max_attempts
+    ).where(
+        BackgroundJob.status == 'processing',
+        BackgroundJob.locked_at < now - timedelta(minutes=_JOB_STALE_LOCK_MINUTES)
+    )).all()
+    if not stale:
+        return
+    retry_ids = [job.id for job in stale if (job.attempts or 0) < (job.max_attempts or 3)]
+    failed_jobs = [{'id': job.id, 'error_message': 'Worker lock expired'}
+                   for job in stale if (job.attempts or 0) >= (job.max_attempts or 3)]
+    logger.warning(f"[JOB QUEUE] Recovering {len(stale)} jobs with expired locks "
+                   f"({len(retry_ids)} retried, {len(failed_jobs)} failed)")
+    _record_job_outcomes([], retry_ids, failed_jobs)
+
+
 def process_background_jobs(batch_size=10):
     """
     Process pending background jobs from the database queue.
@@ -12993,135 +14086,128 @@ def process_background_jobs(batch_size=10):
     
     Args:
         batch_size: Maximum number of jobs to process per run
+
+    Returns:
+        Number of claimed jobs settled (completed, failed or superseded). A full batch means
+        more may be waiting; retried jobs are not counted, since they go straight back to the
+        front of the queue and must not be re-claimed without a wait
     """
     import uuid
     worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+    now = datetime.utcnow()  # one timestamp for the batch's claim and cleanup cutoff
     
     try:
         logger.info(f"[JOB QUEUE] Processing background jobs (worker: {worker_id})")
         
+        # Jobs left in 'processing' by a worker that died mid-batch would never run again (the
+        # claim below only selects 'pending') - retry them, or fail them if out of attempts
+        _recover_stale_job_locks(now)
+        
         # Lock and fetch pending jobs
-        jobs = BackgroundJob.query.filter(
-            BackgroundJob.status == 'pending',
-            # Don't pick up jobs that are locked (being processed by another worker)
-            db.or_(
-                BackgroundJob.locked_at.is_(None),
-                BackgroundJob.locked_at < datetime.utcnow() - timedelta(minutes=5)  # Stale lock
-            )
+        # PERF: plain column rows (not ORM instances) - they are not expired by the commits
+        # made inside job handlers, so reading job fields never triggers a reload
+        jobs = db.session.execute(select(
+            BackgroundJob.id, BackgroundJob.job_type, BackgroundJob.payload,
+            BackgroundJob.attempts, BackgroundJob.max_attempts
+        ).where(
+            # Claimed jobs leave 'pending' in the same transaction (and retries clear the
+            # lock), so status alone excludes jobs owned by another worker. The predicate
+            # and ordering match the ix_bgjob_claim partial index
+            BackgroundJob.status == 'pending'
         ).order_by(
             BackgroundJob.priority.desc(),
             BackgroundJob.created_at.asc()
-        ).limit(batch_size).all()
+        ).limit(batch_size).with_for_update(skip_locked=True)).all()
+        # PERF: FOR UPDATE SKIP LOCKED (PostgreSQL; SQLite renders no locking clause) - rows
+        # are claimed atomically with the fetch, held until the claim UPDATE below commits,
+        # and concurrent workers skip them instead of blocking or double-processing
         
         if not jobs:
             logger.debug(f"[JOB QUEUE] No pending jobs")
-            return
+            return 0
         
         logger.info(f"[JOB QUEUE] Found {len(jobs)} pending jobs")
-        
+
+        # PERF: mark the whole batch claimed with ONE UPDATE in the same transaction as the
+        # SELECT ... FOR UPDATE and ONE COMMIT (was one commit per job), and
+        # record outcomes in memory to write back with bulk UPDATEs after the loop
+        lock_time = now
+        db.session.execute(
+            update(BackgroundJob).where(
+                BackgroundJob.id.in_([job.id for job in jobs])
+            ).values(
+                status='processing',
+                locked_by=worker_id,
+                locked_at=lock_time,
+                started_at=lock_time,
+                attempts=func.coalesce(BackgroundJob.attempts, 0) + 1
+            ).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        completed_ids = []
+        retry_ids = []
+        failed_jobs = []  # [{'id': ..., 'error_message': ...}]
+
+        def _record_failure(job, attempts, e):
+            # Handle retry or failure
+            if attempts >= (job.max_attempts or 3):
+                failed_jobs.append({'id': job.id, 'error_message': str(e)[:1000]})  # Truncate error message
+                logger.error(f"[JOB QUEUE] Job {job.id} permanently failed after {attempts} attempts")
+            else:
+                retry_ids.append(job.id)  # Will be retried
+                logger.info(f"[JOB QUEUE] Job {job.id} will be retried (attempt {attempts}/{job.max_attempts})")
+
+        # PERF: handlers are I/O-bound (SMTP round-trips, per-user trigger scans) - run the
+        # claimed batch on a thread pool instead of one job after another. Each handler gets
+        # its own app context / scoped session; outcomes are collected here and written
+        # back in bulk below
+        # Trigger jobs for the same user must not run concurrently: both would load the same
+        # duplicate-alert index before either commits and insert the same alerts and emails.
+        # A batch can hold several (SQLite, or the direct-insert enqueue fallback when
+        # ux_bgjob_pending_trigger_user is missing) - only the newest runs, as a coalesced
+        # scan standing for the older saves too, and the older jobs are superseded by it
+        trigger_jobs_by_user = {}
         for job in jobs:
-            try:
-                # Lock the job
-                job.locked_by = worker_id
-                job.locked_at = datetime.utcnow()
-                job.status = 'processing'
-                job.started_at = datetime.utcnow()
-                job.attempts += 1
-                db.session.commit()
-                
-                logger.info(f"[JOB QUEUE] Processing job {job.id} type={job.job_type} attempt={job.attempts}")
-                
-                # Execute the job based on type
-                if job.job_type == 'trigger_processing':
-                    user_id = job.payload.get('user_id')
-                    param_snapshot = job.payload.get('param_snapshot')
-                    
-                    if user_id and param_snapshot:
-                        process_parameter_triggers_async(user_id, param_snapshot)
-                        cleanup_stale_trigger_alerts_for_user(user_id)
-                    else:
-                        raise ValueError(f"Invalid payload for trigger_processing: {job.payload}")
-                
-                elif job.job_type == 'send_email':
-                    # Future: Handle email sending jobs
-                    email_data = job.payload
-                    # send_email_from_job(email_data)
-                    logger.info(f"[JOB QUEUE] Email job type - placeholder for future implementation")
-                
-                elif job.job_type == 'send_batch_alert_emails':
-                    # G60: Send existing unread alerts as emails when email_on_alert is turned ON
-                    _user_id = job.payload.get('user_id')
-                    if _user_id:
-                        _user = db.session.get(User, _user_id)
-                        if _user and _user.email:
-                            _unread = Alert.query.filter(
-                                Alert.user_id == _user_id,
-                                Alert.is_read == False,
-                                Alert.alert_category != 'trigger'
-                            ).order_by(Alert.created_at.desc()).limit(50).all()
-                            _lang = _user.preferred_language or 'en'
-                            _sent = 0
-                            for _alert in _unread:
-                                try:
-                                    _title = _alert.title
-                                    try:
-                                        _td = json.loads(_alert.title)
-                                        if isinstance(_td, dict) and 'key' in _td:
-                                            _title = _td.get('params', {}).get('username', 'Alert')
-                                            if 'new_message' in _td.get('key', ''):
-                                                _title = f"New message from {_title}"
-                                            elif 'started_following' in _td.get('key', ''):
-                                                _title = f"{_title} accepted your connection request"
-                                            elif 'invitation' in _td.get('key', '').lower():
-                                                _title = "New invitation"
-                                    except Exception:
-                                        pass
-                                    send_alert_notification_email(_user.email, _title, _alert.content or '', _lang)
-                                    _sent += 1
-                                except Exception as _email_err:
-                                    logger.error(f"[JOB QUEUE] Alert email error: {_email_err}")
-                                    continue
-                            logger.info(f"[JOB QUEUE] Sent {_sent} batch alert emails for user {_user_id}")
-                        else:
-                            logger.warning(f"[JOB QUEUE] User {_user_id} not found or no email")
-                    else:
-                        raise ValueError(f"Invalid payload for send_batch_alert_emails: {job.payload}")
-                
-                else:
-                    logger.warning(f"[JOB QUEUE] Unknown job type: {job.job_type}")
-                
-                # Mark job as completed
-                job.status = 'completed'
-                job.completed_at = datetime.utcnow()
-                job.locked_by = None
-                job.locked_at = None
-                db.session.commit()
-                
-                logger.info(f"[JOB QUEUE] Job {job.id} completed successfully")
-                
-            except Exception as e:
-                logger.error(f"[JOB QUEUE] Job {job.id} failed: {str(e)}")
-                logger.error(f"[JOB QUEUE] Traceback: {traceback.format_exc()}")
-                
-                # Handle retry or failure
-                if job.attempts >= job.max_attempts:
-                    job.status = 'failed'
-                    job.error_message = str(e)[:1000]  # Truncate error message
-                    logger.error(f"[JOB QUEUE] Job {job.id} permanently failed after {job.attempts} attempts")
-                else:
-                    job.status = 'pending'  # Will be retried
-                    logger.info(f"[JOB QUEUE] Job {job.id} will be retried (attempt {job.attempts}/{job.max_attempts})")
-                
-                job.locked_by = None
-                job.locked_at = None
-                
+            if job.job_type == 'trigger_processing' and isinstance(job.payload, dict):
+                trigger_jobs_by_user.setdefault(str(job.payload.get('user_id')), []).append(job)
+        run_payloads = {job.id: job.payload for job in jobs}
+        for user_jobs in trigger_jobs_by_user.values():
+            if len(user_jobs) > 1:
+                newest = user_jobs[-1]  # claim order is created_at ASC within a priority
+                run_payloads[newest.id] = {**newest.payload, 'coalesced': True,
+                                           'changed': list(_PARAM_FIELDS + _PRIVACY_FIELDS)}
+                for older in user_jobs[:-1]:
+                    del run_payloads[older.id]
+                    completed_ids.append(older.id)
+                    logger.info(f"[JOB QUEUE] Job {older.id} superseded by job {newest.id} for the same user")
+
+        with ThreadPoolExecutor(max_workers=min(_JOB_WORKERS, len(jobs))) as pool:
+            futures = {}
+            for job in jobs:
+                if job.id not in run_payloads:
+                    continue
+                attempts = (job.attempts or 0) + 1
+                logger.info(f"[JOB QUEUE] Processing job {job.id} type={job.job_type} attempt={attempts}")
+                futures[pool.submit(_run_background_job, job.job_type, run_payloads[job.id])] = (job, attempts)
+            for future in as_completed(futures):
+                job, attempts = futures[future]
                 try:
-                    db.session.commit()
-                except:
-                    db.session.rollback()
+                    future.result()
+                    # Mark job as completed (written in bulk after the loop)
+                    completed_ids.append(job.id)
+                    logger.info(f"[JOB QUEUE] Job {job.id} completed successfully")
+                except Exception as e:
+                    logger.error(f"[JOB QUEUE] Job {job.id} failed: {str(e)}")
+                    logger.error(f"[JOB QUEUE] Traceback: {''.join(traceback.format_exception(type(e), e, e.__traceback__))}")
+                    _record_failure(job, attempts, e)
+
+        # PERF: write back all outcomes in one transaction - one UPDATE per outcome
+        # instead of a commit per job
+        requeued = _record_job_outcomes(completed_ids, retry_ids, failed_jobs)
         
         # Cleanup old completed jobs (older than 24 hours)
-        cleanup_cutoff = datetime.utcnow() - timedelta(hours=24)
+        cleanup_cutoff = now - timedelta(hours=24)
         old_jobs = BackgroundJob.query.filter(
             BackgroundJob.status.in_(['completed', 'failed']),
             BackgroundJob.completed_at < cleanup_cutoff
@@ -13130,6 +14216,8 @@ def process_background_jobs(batch_size=10):
         if old_jobs > 0:
             db.session.commit()
             logger.info(f"[JOB QUEUE] Cleaned up {old_jobs} old jobs")
+
+        return len(jobs) - requeued
         
     except Exception as e:
         logger.error(f"[JOB QUEUE] Error in job processor: {str(e)}")
@@ -13138,6 +14226,7 @@ def process_background_jobs(batch_size=10):
             db.session.rollback()
         except:
             pass
+        return 0
 
 
 def get_job_queue_stats():
@@ -13148,24 +14237,133 @@ def get_job_queue_stats():
         Dict with queue statistics
     """
     try:
-        stats = {
-            'pending': BackgroundJob.query.filter_by(status='pending').count(),
-            'processing': BackgroundJob.query.filter_by(status='processing').count(),
-            'completed_24h': BackgroundJob.query.filter(
-                BackgroundJob.status == 'completed',
-                BackgroundJob.completed_at >= datetime.utcnow() - timedelta(hours=24)
-            ).count(),
-            'failed_24h': BackgroundJob.query.filter(
-                BackgroundJob.status == 'failed',
-                BackgroundJob.completed_at >= datetime.utcnow() - timedelta(hours=24)
-            ).count()
-        }
-        return stats
+        # PERF: one scan with conditional aggregates (COUNT(*) FILTER (WHERE ...)) instead
+        # of four separate COUNT queries
+        cutoff = datetime.utcnow() - timedelta(hours=24)
+        row = db.session.execute(select(
+            func.count().filter(BackgroundJob.status == 'pending').label('pending'),
+            func.count().filter(BackgroundJob.status == 'processing').label('processing'),
+            func.count().filter(
+                BackgroundJob.status == 'completed', BackgroundJob.completed_at >= cutoff
+            ).label('completed_24h'),
+            func.count().filter(
+                BackgroundJob.status == 'failed', BackgroundJob.completed_at >= cutoff
+            ).label('failed_24h')
+        )).one()
+        return dict(row._mapping)
     except Exception as e:
         logger.error(f"[JOB QUEUE] Error getting stats: {str(e)}")
         return {'error': str(e)}
 
 
+def _entry_day(date_val):
+    """(date, day ordinal) for a SavedParameters.date value, or (None, None) if it can't be parsed."""
+    try:
+        entry_date = date.fromisoformat(str(date_val)[:10])
+    except ValueError:
+        return None, None
+    return entry_date, entry_date.toordinal()
+
+
+def _trigger_number(val):
+    """Trigger value as a float; None for missing, hidden or non-numeric values."""
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    if isinstance(val, str):
+        if val.lower() in ('private', 'hidden', 'none', ''):
+            return None
+        try:
+            return float(val)
+        except ValueError:
+            return None
+    return None
+
+
+def _trigger_is_low(val):
+    num = _trigger_number(val)
+    return num is not None and num <= 2
+
+
+def _trigger_is_high(val):
+    num = _trigger_number(val)
+    return num is not None and num >= 3
+
+
+def _can_see_trigger_parameter(param_privacy, watcher_circles_set):
+    """Whether a watcher in watcher_circles_set may see a value with param_privacy.
+    U5: multi-circle visibility - 'public' needs membership in any circle."""
+    if param_privacy == 'private':
+        return False
+    elif param_privacy == 'class_a':
+        return 'class_a' in watcher_circles_set
+    elif param_privacy == 'class_b':
+        return 'class_b' in watcher_circles_set
+    elif param_privacy == 'public':
+        return len(watcher_circles_set) > 0
+    return False
+
+
+# PERF: privacy visibility depends only on (in class_a, in class_b, in any circle), so the
+# levels a watcher can see are precomputed once for all eight combinations; hot loops
+# test membership in the looked-up tuple instead of re-running the if/elif chain per row.
+_PRIVACY_LEVELS = ('public', 'class_a', 'class_b', 'private')
+_PRIVACY_VISIBILITY_TABLE = {
+    (in_a, in_b, in_any): tuple(
+        level for level in _PRIVACY_LEVELS
+        if _can_see_trigger_parameter(
+            level, ({'class_a'} if in_a else set()) | ({'class_b'} if in_b else set())
+                   | ({'public'} if in_any else set())))
+    for in_a in (False, True) for in_b in (False, True) for in_any in (False, True)
+}
+
+
+def _visible_privacy_levels(watcher_circles_set):
+    """Privacy levels (in _PRIVACY_LEVELS order) a watcher in watcher_circles_set may see."""
+    return _PRIVACY_VISIBILITY_TABLE[('class_a' in watcher_circles_set,
+                                      'class_b' in watcher_circles_set,
+                                      bool(watcher_circles_set))]
+
+
+# Trigger parameter checks: parameter -> (value attr, alert param name, privacy attr, concern test).
+# Low mood/energy/sleep/activity is a concern; for anxiety a HIGH value is.
+_TRIGGER_PARAM_CHECKS = {
+    'mood': ('mood', 'mood', 'mood_privacy', _trigger_is_low),
+    'energy': ('energy', 'energy', 'energy_privacy', _trigger_is_low),
+    'sleep_quality': ('sleep_quality', 'sleep_quality', 'sleep_quality_privacy', _trigger_is_low),
+    'physical_activity': ('physical_activity', 'physical_activity', 'physical_activity_privacy', _trigger_is_low),
+    'anxiety': ('anxiety', 'anxiety', 'anxiety_privacy', _trigger_is_high),
+}
+# New-schema ParameterTrigger boolean flag -> parameter name, in check order
+_TRIGGER_ALERT_FLAGS = (
+    ('mood_alert', 'mood'),
+    ('energy_alert', 'energy'),
+    ('sleep_alert', 'sleep_quality'),
+    ('physical_alert', 'physical_activity'),
+    ('anxiety_alert', 'anxiety'),
+)
+# PERF: the new-schema flags folded into one int in SQL - bit i is _TRIGGER_ALERT_FLAGS[i] -
+# so a trigger row's schema and parameters come from a single column
+_TRIGGER_ALERT_BITS = tuple((1 << i, name) for i, (_flag, name) in enumerate(_TRIGGER_ALERT_FLAGS))
+_TRIGGER_ALERT_MASK = sum(
+    case((getattr(ParameterTrigger, flag).is_(True), 1 << i), else_=0)
+    for i, (flag, _name) in enumerate(_TRIGGER_ALERT_FLAGS)
+).label('alert_mask')
+
+
+def _snapshot_can_trigger(param_snapshot):
+    """Whether the saved day's values can be part of a trigger streak. A day with no concerning
+    value cannot end, extend or start a streak, so saving it can only make alerts stale."""
+    return any(check(param_snapshot.get(attr))
+               for attr, _name, _privacy, check in _TRIGGER_PARAM_CHECKS.values())
+
+
+def _min_trigger_days(triggers):
+    """Shortest streak (enforced consecutive_days) any of the trigger rows can fire on."""
+    return min(max(t.consecutive_days or MINIMUM_TRIGGER_DAYS, MINIMUM_TRIGGER_DAYS) for t in triggers)
+
+
 def process_parameter_triggers_async(user_id, param_snapshot):
     """
     PJ6007: Async trigger processing with CONSOLIDATED emails.
@@ -13178,13 +14376,25 @@ def process_parameter_triggers_async(user_id, param_snapshot):
         user_id: The user ID whose parameters were saved
         param_snapshot: Dict containing parameter values (since ORM objects can't cross threads)
     """
+    # One timestamp per call: the duplicate-check window is computed once, in UTC like
+    # Alert.created_at (the per-check datetime.now() cutoff mixed local time and UTC)
+    now = datetime.utcnow()
+    dup_cutoff = now - timedelta(hours=24)
     try:
         logger.info(f"[TRIGGER PROCESS ASYNC] ========================================")
         logger.info(f"[TRIGGER PROCESS ASYNC] PJ6008: Starting with fixed date parsing for user_id={user_id}")
         
         # Find all ACTIVE triggers where someone is watching this user
         # PJ6019 FIX: Added is_active=True filter to exclude "deleted" triggers
-        all_triggers = ParameterTrigger.query.filter_by(watched_id=user_id, is_active=True).all()
+        # PERF: read-only pass - the trigger and user columns it needs come back as plain Rows
+        # (no ORM instances, identity-map entries or autoflush checks on attribute access)
+        all_triggers = db.session.execute(
+            select(
+                ParameterTrigger.watcher_id, ParameterTrigger.consecutive_days,
+                ParameterTrigger.parameter_name,
+                *[getattr(ParameterTrigger, flag) for flag, _ in _TRIGGER_ALERT_FLAGS]
+            ).where(ParameterTrigger.watched_id == user_id, ParameterTrigger.is_active == True)
+        ).all()
         logger.info(f"[TRIGGER PROCESS ASYNC] Found {len(all_triggers)} active trigger rows watching user {user_id}")
         
         if len(all_triggers) == 0:
@@ -13192,7 +14402,9 @@ def process_parameter_triggers_async(user_id, param_snapshot):
             logger.info(f"[TRIGGER PROCESS ASYNC] ========================================")
             return
         
-        watched_user = User.query.get(user_id)
+        watched_user = db.session.execute(
+            select(User.id, User.username).where(User.id == user_id)
+        ).first()
         if not watched_user:
             logger.error(f"[TRIGGER PROCESS ASYNC] Watched user {user_id} not found")
             return
@@ -13216,42 +14428,64 @@ def process_parameter_triggers_async(user_id, param_snapshot):
                         return None
             return None
         
-        # Helper function to check privacy permissions
-        # U5: Updated for multi-circle visibility
-        def can_see_parameter(param_privacy, watcher_circles_set):
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circles_set
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circles_set
-            elif param_privacy == 'public':
-                return len(watcher_circles_set) > 0
-            return False
-        
-        # Helper to safely convert values to numbers
-        def to_number(val):
-            if val is None:
-                return None
-            if isinstance(val, (int, float)):
-                return float(val)
-            if isinstance(val, str):
-                if val.lower() in ['private', 'hidden', 'none', '']:
-                    return None
-                try:
-                    return float(val)
-                except ValueError:
-                    return None
-            return None
-        
         # Get last 30 days of parameters from DB
         thirty_days_ago = datetime.now().date() - timedelta(days=30)
-        all_params = SavedParameters.query.filter(
-            SavedParameters.user_id == user_id,
-            SavedParameters.date >= str(thirty_days_ago)  # PJ6008: Convert to string for comparison
-        ).order_by(SavedParameters.date.asc()).all()
+        # PERF: only the columns the streak check reads, as plain Rows (no ORM instances).
+        # date is a 'YYYY-MM-DD' String(10) column, so the ISO-string bound compares correctly
+        # and the (user_id, date) index serves the range
+        sp_columns = SavedParameters.__table__.c
+        all_params = db.session.execute(
+            select(
+                sp_columns.date,
+                *[sp_columns[f] for f in _PARAM_FIELDS],
+                *[sp_columns[pf] for pf in _PRIVACY_FIELDS]
+            ).where(
+                sp_columns.user_id == user_id,
+                sp_columns.date >= thirty_days_ago.isoformat()  # PJ6008: string column
+            ).order_by(sp_columns.date.asc())
+        ).all()
         
         logger.info(f"[TRIGGER PROCESS ASYNC] Found {len(all_params)} parameter entries in last 30 days")
+
+        # PERF: no trigger can fire on fewer entries than the shortest streak any watcher asked
+        # for - return before the circle, duplicate-index and column work (the common case for
+        # users with little recent data)
+        min_consecutive = _min_trigger_days(all_triggers)
+        if len(all_params) < min_consecutive:
+            logger.info(f"[TRIGGER PROCESS ASYNC] Skipping - not enough params ({len(all_params)} < {min_consecutive})")
+            return
+
+        # PERF: parse every entry date ONCE (was once per watcher x parameter). Undated rows
+        # are skipped and a repeated day is counted once, as the per-row scan did
+        dated_params = []
+        entry_dates = []
+        for param_entry in all_params:
+            # PJ6008: Parse date properly
+            entry_date = parse_date(param_entry.date)
+            if entry_date is None:
+                logger.warning(f"[TRIGGER PROCESS ASYNC] Could not parse date: {param_entry.date}")
+                continue
+            if entry_dates and entry_date == entry_dates[-1]:
+                continue  # Same day, skip
+            dated_params.append(param_entry)
+            entry_dates.append(entry_date)
+        day_numbers = [d.toordinal() for d in entry_dates]
+
+        # PERF: per-parameter (concern, privacy) columns, built once per parameter and reused
+        # for every watcher - only the watcher's privacy mask differs
+        param_columns = {}
+        streak_cache = {}  # (param_attr, visible_levels, min_len) -> [(start, end), ...]
+
+        def _param_column(param_attr, privacy_attr, condition_func):
+            key = (param_attr, privacy_attr)
+            if key not in param_columns:
+                concern = [(v := getattr(e, param_attr, None)) is not None and bool(condition_func(v))
+                           for e in dated_params]
+                privacy = [getattr(e, privacy_attr, None) or 'private' for e in dated_params]
+                if NUMPY_AVAILABLE:
+                    concern, privacy = np.array(concern, dtype=bool), np.array(privacy)
+                param_columns[key] = (concern, privacy)
+            return param_columns[key]
         
         # PJ6007: Collect triggered params per watcher for consolidated email
         # Key: watcher_id, Value: list of {'param_name', 'days', 'date_range'}
@@ -13260,6 +14494,63 @@ def process_parameter_triggers_async(user_id, param_snapshot):
         alerts_created = 0
         alerts_skipped_duplicate = 0
         
+        # PERF: every watcher's circle membership for this user in ONE query (was one
+        # get_watcher_all_circles() query per trigger row, repeated for duplicate watchers)
+        try:
+            circles_by_watcher = _get_members_circle_types(user_id, {t.watcher_id for t in all_triggers})
+        except Exception as e:
+            logger.error(f"[TRIGGER PROCESS ASYNC] Could not load watcher circles for user {user_id}: {e}")
+            db.session.rollback()
+            circles_by_watcher = {}
+
+        # PERF: ONE query for this user's existing trigger alerts across all watchers; the
+        # duplicate check per streak is then an in-memory pattern_key lookup instead of 1-2
+        # ILIKE scans
+        existing_alerts = load_trigger_alert_index(
+            {t.watcher_id for t in all_triggers}, watched_user.id, watched_user.username,
+            dup_cutoff=dup_cutoff
+        )
+        pending_alerts = []
+
+        def _emit_streak_alert(watcher_id, param_name, start_date, end_date, days):
+            """Create the alert for a completed streak unless it was already seen in this run
+            or already exists (PJ6018 duplicate rules), and queue it for the consolidated email."""
+            nonlocal alerts_created, alerts_skipped_duplicate
+            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
+            if pattern_key in patterns_seen:
+                return
+            patterns_seen.add(pattern_key)
+            start_str = start_date.strftime('%b %d')
+            end_str = end_date.strftime('%b %d')
+            date_pattern = f"({start_str} - {end_str})"
+
+            alert_key = _trigger_pattern_key(watched_user.id, param_name, start_date, end_date)
+            if check_duplicate_alert_cached(existing_alerts, watcher_id, watched_user.username,
+                                            param_name, date_pattern, alert_key):
+                alerts_skipped_duplicate += 1
+                return
+
+            content = f"{watched_user.username}'s {param_name} has been at low levels for {days} consecutive days {date_pattern}"
+            logger.info(f"[TRIGGER PROCESS ASYNC] Creating alert: {content}")
+            # PERF: collected here, inserted in ONE executemany INSERT after the loop (was an
+            # ORM add() + flush per alert via create_alert_no_email)
+            pending_alerts.append({
+                'user_id': watcher_id,
+                'title': f"Well-Being Alert for {watched_user.username}",
+                'content': content,
+                'alert_type': 'trigger',
+                'source_user_id': watched_user.id,
+                'alert_category': 'trigger',
+                'pattern_key': alert_key
+            })
+            existing_alerts[0].add((watcher_id, alert_key))
+            alerts_created += 1
+            watcher_triggered_params[watcher_id].append({
+                'param_name': param_name,
+                'days': days,
+                'date_range': f"{start_str} - {end_str}"
+            })
+
         # Process each trigger row
         for trigger in all_triggers:
             watcher_id = trigger.watcher_id
@@ -13273,7 +14564,7 @@ def process_parameter_triggers_async(user_id, param_snapshot):
                 logger.info(f"[TRIGGER PROCESS ASYNC] Skipping - not enough params ({len(all_params)} < {consecutive_days})")
                 continue
             
-            watcher_circle = get_watcher_all_circles(user_id, watcher_id)
+            watcher_circle = circles_by_watcher.get(watcher_id)
             if not watcher_circle:
                 logger.info(f"[TRIGGER PROCESS ASYNC] Skipping - watcher {watcher_id} not in any circle")
                 continue
@@ -13282,243 +14573,88 @@ def process_parameter_triggers_async(user_id, param_snapshot):
             if watcher_id not in watcher_triggered_params:
                 watcher_triggered_params[watcher_id] = []
             
-            # Determine which schema this trigger uses
-            has_new_schema = any([
-                trigger.mood_alert, trigger.energy_alert, trigger.sleep_alert,
-                trigger.physical_alert, trigger.anxiety_alert
-            ])
-            has_old_schema = trigger.parameter_name is not None
-            
-            # Build list of parameters to check
-            param_checks = []
-            
-            if has_new_schema:
-                if trigger.mood_alert:
-                    param_checks.append(('mood', 'mood', 'mood_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.energy_alert:
-                    param_checks.append(('energy', 'energy', 'energy_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.sleep_alert:
-                    param_checks.append(('sleep_quality', 'sleep_quality', 'sleep_quality_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.physical_alert:
-                    param_checks.append(('physical_activity', 'physical_activity', 'physical_activity_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.anxiety_alert:
-                    param_checks.append(('anxiety', 'anxiety', 'anxiety_privacy', lambda x: to_number(x) is not None and to_number(x) >= 3))
-            elif has_old_schema:
-                param_mapping = {
-                    'mood': ('mood', 'mood', 'mood_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'energy': ('energy', 'energy', 'energy_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'sleep_quality': ('sleep_quality', 'sleep_quality', 'sleep_quality_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'physical_activity': ('physical_activity', 'physical_activity', 'physical_activity_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'anxiety': ('anxiety', 'anxiety', 'anxiety_privacy', lambda x: to_number(x) is not None and to_number(x) >= 3)
-                }
-                if trigger.parameter_name in param_mapping:
-                    param_checks.append(param_mapping[trigger.parameter_name])
+            # Determine which schema this trigger uses and build the list of parameters to
+            # check from the module-level _TRIGGER_PARAM_CHECKS table (no per-row allocation)
+            new_schema_params = [name for flag, name in _TRIGGER_ALERT_FLAGS if getattr(trigger, flag)]
+            if new_schema_params:
+                param_checks = [_TRIGGER_PARAM_CHECKS[name] for name in new_schema_params]
+            elif trigger.parameter_name in _TRIGGER_PARAM_CHECKS:  # old schema
+                param_checks = [_TRIGGER_PARAM_CHECKS[trigger.parameter_name]]
+            else:
+                param_checks = []
             
             logger.info(f"[TRIGGER PROCESS ASYNC] Checking {len(param_checks)} parameters for watcher {watcher_id}")
             
-            # Check each parameter for consecutive day streaks
+            # Check each parameter for consecutive day streaks: a streak is a run of
+            # consecutive days where the value meets the concern condition AND the watcher can
+            # see it (an entry the watcher cannot see ends the streak)
+            visible_levels = _visible_privacy_levels(watcher_circle)
             for param_attr, param_name, privacy_attr, condition_func in param_checks:
-                streak_dates = []
-                last_date = None
-                
-                for param_entry in all_params:
-                    param_value = getattr(param_entry, param_attr, None)
-                    param_privacy = getattr(param_entry, privacy_attr, 'private')
-                    # PJ6008: Parse date properly
-                    entry_date = parse_date(param_entry.date)
-                    
-                    if entry_date is None:
-                        logger.warning(f"[TRIGGER PROCESS ASYNC] Could not parse date: {param_entry.date}")
-                        continue
-                    
-                    # Check privacy - process streak if long enough before reset
-                    if not can_see_parameter(param_privacy, watcher_circle):
-                        if len(streak_dates) >= consecutive_days:
-                            start_date = streak_dates[0]
-                            end_date = streak_dates[-1]
-                            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                            
-                            if pattern_key not in patterns_seen:
-                                patterns_seen.add(pattern_key)
-                                start_str = start_date.strftime('%b %d')
-                                end_str = end_date.strftime('%b %d')
-                                date_pattern = f"({start_str} - {end_str})"
-                                
-                                # Check for DB duplicate - PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                
-                                if not existing:
-                                    content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                    logger.info(f"[TRIGGER PROCESS ASYNC] Creating alert: {content}")
-                                    alert = create_alert_no_email(
-                                        user_id=watcher_id,
-                                        title=f"Well-Being Alert for {watched_user.username}",
-                                        content=content,
-                                        alert_type='trigger',
-                                        source_user_id=watched_user.id,
-                                        alert_category='trigger'
-                                    )
-                                    if alert:
-                                        alerts_created += 1
-                                        watcher_triggered_params[watcher_id].append({
-                                            'param_name': param_name,
-                                            'days': len(streak_dates),
-                                            'date_range': f"{start_str} - {end_str}"
-                                        })
-                                else:
-                                    alerts_skipped_duplicate += 1
-                        
-                        streak_dates = []
-                        last_date = None
-                        continue
-                    
-                    if param_value is not None and condition_func(param_value):
-                        if last_date is None:
-                            streak_dates = [entry_date]
-                            last_date = entry_date
-                        elif (entry_date - last_date).days == 1:
-                            streak_dates.append(entry_date)
-                            last_date = entry_date
-                        elif (entry_date - last_date).days == 0:
-                            continue  # Same day, skip
-                        else:
-                            # Gap in streak - process if long enough
-                            if len(streak_dates) >= consecutive_days:
-                                start_date = streak_dates[0]
-                                end_date = streak_dates[-1]
-                                pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                                
-                                if pattern_key not in patterns_seen:
-                                    patterns_seen.add(pattern_key)
-                                    start_str = start_date.strftime('%b %d')
-                                    end_str = end_date.strftime('%b %d')
-                                    date_pattern = f"({start_str} - {end_str})"
-                                    
-                                    # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                    existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                    
-                                    if not existing:
-                                        content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                        logger.info(f"[TRIGGER PROCESS ASYNC] Creating alert: {content}")
-                                        alert = create_alert_no_email(
-                                            user_id=watcher_id,
-                                            title=f"Well-Being Alert for {watched_user.username}",
-                                            content=content,
-                                            alert_type='trigger',
-                                            source_user_id=watched_user.id,
-                                            alert_category='trigger'
-                                        )
-                                        if alert:
-                                            alerts_created += 1
-                                            watcher_triggered_params[watcher_id].append({
-                                                'param_name': param_name,
-                                                'days': len(streak_dates),
-                                                'date_range': f"{start_str} - {end_str}"
-                                            })
-                                    else:
-                                        alerts_skipped_duplicate += 1
-                            
-                            # Start new streak
-                            streak_dates = [entry_date]
-                            last_date = entry_date
+                # PERF: watchers with the same visibility and minimum length see the same
+                # streaks - scan each (parameter, visibility, length) combination once
+                streak_key = (param_attr, visible_levels, consecutive_days)
+                streaks = streak_cache.get(streak_key)
+                if streaks is None:
+                    concern, privacy = _param_column(param_attr, privacy_attr, condition_func)
+                    if NUMPY_AVAILABLE:
+                        flags = concern & np.isin(privacy, visible_levels)
                     else:
-                        # Condition not met - process streak if long enough
-                        if len(streak_dates) >= consecutive_days:
-                            start_date = streak_dates[0]
-                            end_date = streak_dates[-1]
-                            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                            
-                            if pattern_key not in patterns_seen:
-                                patterns_seen.add(pattern_key)
-                                start_str = start_date.strftime('%b %d')
-                                end_str = end_date.strftime('%b %d')
-                                date_pattern = f"({start_str} - {end_str})"
-                                
-                                # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                
-                                if not existing:
-                                    content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                    logger.info(f"[TRIGGER PROCESS ASYNC] Creating alert: {content}")
-                                    alert = create_alert_no_email(
-                                        user_id=watcher_id,
-                                        title=f"Well-Being Alert for {watched_user.username}",
-                                        content=content,
-                                        alert_type='trigger',
-                                        source_user_id=watched_user.id,
-                                        alert_category='trigger'
-                                    )
-                                    if alert:
-                                        alerts_created += 1
-                                        watcher_triggered_params[watcher_id].append({
-                                            'param_name': param_name,
-                                            'days': len(streak_dates),
-                                            'date_range': f"{start_str} - {end_str}"
-                                        })
-                                else:
-                                    alerts_skipped_duplicate += 1
-                        
-                        streak_dates = []
-                        last_date = None
-                
-                # Check final streak at end of loop
-                if len(streak_dates) >= consecutive_days:
-                    start_date = streak_dates[0]
-                    end_date = streak_dates[-1]
-                    pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                    
-                    if pattern_key not in patterns_seen:
-                        patterns_seen.add(pattern_key)
-                        start_str = start_date.strftime('%b %d')
-                        end_str = end_date.strftime('%b %d')
-                        date_pattern = f"({start_str} - {end_str})"
-                        
-                        # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                        existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                        
-                        if not existing:
-                            content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                            logger.info(f"[TRIGGER PROCESS ASYNC] Creating alert: {content}")
-                            alert = create_alert_no_email(
-                                user_id=watcher_id,
-                                title=f"Well-Being Alert for {watched_user.username}",
-                                content=content,
-                                alert_type='trigger',
-                                source_user_id=watched_user.id,
-                                alert_category='trigger'
-                            )
-                            if alert:
-                                alerts_created += 1
-                                watcher_triggered_params[watcher_id].append({
-                                    'param_name': param_name,
-                                    'days': len(streak_dates),
-                                    'date_range': f"{start_str} - {end_str}"
-                                })
-                        else:
-                            alerts_skipped_duplicate += 1
-        
-        # Commit alerts to DB
+                        flags = [c and p in visible_levels for c, p in zip(concern, privacy)]
+                    streaks = streak_cache[streak_key] = _find_day_streaks(flags, day_numbers, consecutive_days)
+                for start, end in streaks:
+                    _emit_streak_alert(watcher_id, param_name, entry_dates[start], entry_dates[end], end - start + 1)
+        
+        # PERF: the reads above, the alert INSERT and the email jobs below all run in ONE
+        # session transaction - one pooled connection held for the whole call and a single
+        # COMMIT at the end (was a commit after the alerts and another after the email jobs,
+        # each returning the connection and checking out a new one)
         try:
-            db.session.commit()
-        except:
+            if pending_alerts:
+                db.session.execute(insert(Alert), pending_alerts)
+        except Exception as insert_err:
+            logger.error(f"[TRIGGER PROCESS ASYNC] Could not insert {len(pending_alerts)} alerts: {insert_err}")
             db.session.rollback()
+            alerts_created = 0
+            watcher_triggered_params = {}  # nothing was stored - don't email about it
         
         # PJ6007: Send ONE consolidated email per watcher (instead of many individual emails)
-        emails_sent = 0
-        for watcher_id, triggered_params in watcher_triggered_params.items():
-            if triggered_params:  # Only send if there are triggered params
-                watcher = User.query.get(watcher_id)
-                user_language = watcher.preferred_language if watcher else 'en'
-                
-                logger.info(f"[TRIGGER PROCESS ASYNC] Sending consolidated email to watcher {watcher_id} with {len(triggered_params)} params")
-                
-                if send_consolidated_wellness_alert_email(watcher_id, watched_user.username, triggered_params, user_language):
-                    emails_sent += 1
-        
+        # PERF: SMTP is not done here - each email becomes its own 'send_email' job, so a slow
+        # or unavailable SMTP server neither stalls trigger processing nor shares its retries
+        emails_queued = 0
+        try:
+            # SAVEPOINT on the same connection: a failed enqueue keeps the alerts just inserted
+            with db.session.begin_nested():
+                # PERF: every recipient's language in ONE query instead of a User load per watcher
+                _email_watcher_ids = [w for w, tp in watcher_triggered_params.items() if tp]
+                watcher_languages = dict(db.session.execute(
+                    select(User.id, User.preferred_language).where(User.id.in_(_email_watcher_ids))
+                ).all()) if _email_watcher_ids else {}
+                for watcher_id, triggered_params in watcher_triggered_params.items():
+                    if triggered_params:  # Only send if there are triggered params
+                        user_language = watcher_languages.get(watcher_id) or 'en'
+                        db.session.add(BackgroundJob(
+                            job_type='send_email',
+                            payload={
+                                'kind': 'consolidated_wellness_alert',
+                                'watcher_id': watcher_id,
+                                'watched_username': watched_user.username,
+                                'triggered_params': triggered_params,
+                                'user_language': user_language
+                            },
+                            priority=0  # after trigger_processing jobs
+                        ))
+                        emails_queued += 1
+                if emails_queued:
+                    _notify_job_queue()
+        except Exception as queue_err:
+            logger.error(f"[TRIGGER PROCESS ASYNC] Could not queue consolidated emails: {queue_err}")
+            emails_queued = 0  # only the SAVEPOINT was rolled back
+        db.session.commit()
+
         logger.info(f"[TRIGGER PROCESS ASYNC] PJ6008 Completed:")
         logger.info(f"[TRIGGER PROCESS ASYNC]   - {alerts_created} alerts created in DB")
         logger.info(f"[TRIGGER PROCESS ASYNC]   - {alerts_skipped_duplicate} duplicates skipped")
-        logger.info(f"[TRIGGER PROCESS ASYNC]   - {emails_sent} consolidated emails sent")
+        logger.info(f"[TRIGGER PROCESS ASYNC]   - {emails_queued} consolidated emails queued")
         logger.info(f"[TRIGGER PROCESS ASYNC] ========================================")
         
     except Exception as e:
@@ -13546,7 +14682,12 @@ def process_parameter_triggers(user_id, params):
         
         # Find all ACTIVE triggers where someone is watching this user
         # PJ6019 FIX: Added is_active=True filter to exclude "deleted" triggers
-        all_triggers = ParameterTrigger.query.filter_by(watched_id=user_id, is_active=True).all()
+        all_triggers = db.session.execute(
+            select(
+                ParameterTrigger.watcher_id, ParameterTrigger.consecutive_days,
+                ParameterTrigger.parameter_name, _TRIGGER_ALERT_MASK
+            ).where(ParameterTrigger.watched_id == user_id, ParameterTrigger.is_active == True)
+        ).all()
         logger.info(f"[TRIGGER PROCESS] Found {len(all_triggers)} active trigger rows watching user {user_id}")
         
         if len(all_triggers) == 0:
@@ -13559,28 +14700,9 @@ def process_parameter_triggers(user_id, params):
             watcher = User.query.get(t.watcher_id)
             watcher_name = watcher.username if watcher else f"user_{t.watcher_id}"
             # Check both new and old schema
-            flags = []
-            if t.mood_alert: flags.append('mood')
-            if t.energy_alert: flags.append('energy')
-            if t.sleep_alert: flags.append('sleep')
-            if t.physical_alert: flags.append('activity')
-            if t.anxiety_alert: flags.append('anxiety')
+            flags = [name for bit, name in _TRIGGER_ALERT_BITS if t.alert_mask & bit]
             logger.info(f"[TRIGGER PROCESS] Trigger {i+1}: watcher={watcher_name}, days={t.consecutive_days}, new_flags={flags}, old_param={t.parameter_name}")
         
-        # PJ815: Helper function to check privacy permissions
-        # U5: Updated for multi-circle visibility
-        def can_see_parameter(param_privacy, watcher_circles_set):
-            """Check if watcher can see this parameter based on privacy and circle level"""
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circles_set
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circles_set
-            elif param_privacy == 'public':
-                return len(watcher_circles_set) > 0
-            return False
-        
         # PJ815: Track patterns already alerted to prevent duplicates
         # Key = (watcher_id, param_name, start_date_iso, end_date_iso)
         patterns_seen = set()
@@ -13592,16 +14714,116 @@ def process_parameter_triggers(user_id, params):
         watchers_processed = set()
 
         watched_user = User.query.get(user_id)
+        # PERF: read once per run - the streak helper below used the ORM attributes on every
+        # alert; the duplicate window (UTC, like Alert.created_at) is likewise computed once
+        username = watched_user.username
+        watched_id = watched_user.id
+        dup_cutoff = datetime.utcnow() - timedelta(hours=24)
+
+        pending_alerts = []
+
+        def _alert_streak(watcher_id, param_name, streak_dates):
+            """Queue the alert for a completed streak unless this run already handled it or a
+            duplicate exists (PJ6018 rules, via the prefetched index)."""
+            nonlocal alerts_created, alerts_skipped_duplicate
+            start_date = streak_dates[0]
+            end_date = streak_dates[-1]
+            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
+            if pattern_key in patterns_seen:
+                return
+            patterns_seen.add(pattern_key)
+            start_str = start_date.strftime('%b %d')
+            end_str = end_date.strftime('%b %d')
+            date_pattern = f"({start_str} - {end_str})"
+
+            alert_key = _trigger_pattern_key(watched_id, param_name, start_date, end_date)
+            if check_duplicate_alert_cached(existing_alerts, watcher_id, username,
+                                            param_name, date_pattern, alert_key):
+                alerts_skipped_duplicate += 1
+                return
+
+            content = f"{username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
+            # PERF: collected here, inserted in ONE executemany INSERT after the loop (was a
+            # create_alert_with_email() add + flush per alert). Trigger alerts never send an
+            # individual email there (PJ6009), so there is no email work to defer
+            pending_alerts.append({
+                'user_id': watcher_id,
+                'title': f"Well-Being Alert for {username}",
+                'content': content,
+                'alert_type': 'trigger',
+                'source_user_id': watched_id,
+                'alert_category': 'trigger',
+                'pattern_key': alert_key
+            })
+            alerts_created += 1
+            logger.info(f"[TRIGGER PROCESS] ✅ Queued alert for {param_name} {date_pattern}")
         
         # Get last 30 days of parameters
         thirty_days_ago = datetime.now().date() - timedelta(days=30)
-        all_params = SavedParameters.query.filter(
-            SavedParameters.user_id == user_id,
-            SavedParameters.date >= thirty_days_ago
-        ).order_by(SavedParameters.date.asc()).all()  # ASC for proper streak detection
+        # PERF: only the date and the checked value/privacy columns, as plain Rows (no ORM
+        # entities for columns the scan never reads)
+        sp_columns = SavedParameters.__table__.c
+        all_params = db.session.execute(
+            select(
+                sp_columns.date,
+                *[sp_columns[attr] for attr, _name, _privacy, _check in _TRIGGER_PARAM_CHECKS.values()],
+                *[sp_columns[privacy] for _attr, _name, privacy, _check in _TRIGGER_PARAM_CHECKS.values()]
+            ).where(
+                sp_columns.user_id == user_id,
+                sp_columns.date >= thirty_days_ago.isoformat()  # PJ6008: string column
+            ).order_by(sp_columns.date.asc())  # ASC for proper streak detection
+        ).all()
 
         logger.info(f"[TRIGGER PROCESS] Found {len(all_params)} parameter entries in last 30 days")
 
+        # PERF: no trigger can fire on fewer entries than the shortest streak any watcher asked
+        # for - return before the duplicate-index, column and circle work
+        min_consecutive = _min_trigger_days(all_triggers)
+        if len(all_params) < min_consecutive:
+            logger.info(f"[TRIGGER PROCESS] Skipping - not enough params ({len(all_params)} < {min_consecutive})")
+            return
+
+        # PERF: ONE query for this user's existing trigger alerts across all watchers; each
+        # streak's duplicate check is then an in-memory lookup (was a check_duplicate_alert()
+        # ILIKE query per streak, in four copies of the alert block below)
+        existing_alerts = load_trigger_alert_index(
+            {t.watcher_id for t in all_triggers}, watched_id, username, dup_cutoff=dup_cutoff
+        )
+
+        # PERF: project each row ONCE - parsed date, per-parameter concern test result and
+        # privacy level - instead of getattr()/number conversion on every (watcher x
+        # parameter) pass over all_params. Stored as per-parameter columns (NumPy arrays when
+        # available) so each streak scan is a few vector ops in _find_day_streaks
+        entry_dates = []
+        concern_columns = {attr: [] for attr in _TRIGGER_PARAM_CHECKS}
+        privacy_columns = {attr: [] for attr in _TRIGGER_PARAM_CHECKS}
+        for param_entry in all_params:
+            try:
+                entry_date = date.fromisoformat(str(param_entry.date)[:10])
+            except ValueError:
+                logger.warning(f"[TRIGGER PROCESS] Could not parse date: {param_entry.date}")
+                continue
+            if entry_dates and entry_date == entry_dates[-1]:
+                continue  # Same day
+            entry_dates.append(entry_date)
+            for attr, _name, privacy_attr, check in _TRIGGER_PARAM_CHECKS.values():
+                concern_columns[attr].append(check(getattr(param_entry, attr, None)))
+                privacy_columns[attr].append(getattr(param_entry, privacy_attr, None) or 'private')
+        day_numbers = [d.toordinal() for d in entry_dates]
+        streak_cache = {}  # (param_attr, visible_levels, min_len) -> [(start, end), ...]
+        if NUMPY_AVAILABLE:
+            concern_columns = {a: np.array(c, dtype=bool) for a, c in concern_columns.items()}
+            privacy_columns = {a: np.array(p) for a, p in privacy_columns.items()}
+
+        # PERF: every watcher's circle membership for this user in ONE query (was one
+        # get_watcher_all_circles() query per trigger row)
+        try:
+            circles_by_watcher = _get_members_circle_types(user_id, {t.watcher_id for t in all_triggers})
+        except Exception as e:
+            logger.error(f"[TRIGGER PROCESS] Could not load watcher circles for user {user_id}: {e}")
+            db.session.rollback()
+            circles_by_watcher = {}
+
         # PJ815: Process each trigger row individually
         for trigger in all_triggers:
             watcher_id = trigger.watcher_id
@@ -13614,231 +14836,58 @@ def process_parameter_triggers(user_id, params):
             if len(all_params) < consecutive_days:
                 continue
             
-            # Get watcher's circle level for privacy check
-            # U5: Use ALL circle memberships
-            watcher_circle = get_watcher_all_circles(user_id, watcher_id)
-            if not watcher_circle:
-                logger.info(f"[TRIGGER PROCESS] Skipping watcher {watcher_id} - not in any circle")
-                continue
-            
-            watchers_processed.add(watcher_id)
-            
-            # Determine which schema this trigger uses
-            has_new_schema = any([
-                trigger.mood_alert,
-                trigger.energy_alert,
-                trigger.sleep_alert,
-                trigger.physical_alert,
-                trigger.anxiety_alert
-            ])
-            
-            has_old_schema = trigger.parameter_name is not None
-            
-            logger.info(f"[TRIGGER PROCESS] Processing watcher {watcher_id}: new_schema={has_new_schema}, old_schema={has_old_schema}")
-            
-            # PJ817: Helper to safely convert values to numbers (fixes TypeError with string comparisons)
-            def to_number(val):
-                """Convert value to number, handling string/int/float/None cases"""
-                if val is None:
-                    return None
-                if isinstance(val, (int, float)):
-                    return float(val)
-                if isinstance(val, str):
-                    if val.lower() in ['private', 'hidden', 'none', '']:
-                        return None
-                    try:
-                        return float(val)
-                    except ValueError:
-                        return None
-                return None
-            
-            # Build list of parameters to check
-            param_checks = []
-            
-            if has_new_schema:
-                # PJ817: Fixed lambdas to use to_number() to handle string values from database
-                if trigger.mood_alert:
-                    param_checks.append(('mood', 'mood', 'mood_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.energy_alert:
-                    param_checks.append(('energy', 'energy', 'energy_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.sleep_alert:
-                    param_checks.append(('sleep_quality', 'sleep_quality', 'sleep_quality_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.physical_alert:
-                    param_checks.append(('physical_activity', 'physical_activity', 'physical_activity_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2))
-                if trigger.anxiety_alert:
-                    param_checks.append(('anxiety', 'anxiety', 'anxiety_privacy', lambda x: to_number(x) is not None and to_number(x) >= 3))
-            elif has_old_schema:
-                # Old schema - single parameter from trigger.parameter_name
-                # PJ817: Fixed lambdas to use to_number() to handle string values from database
-                param_mapping = {
-                    'mood': ('mood', 'mood', 'mood_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'energy': ('energy', 'energy', 'energy_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'sleep_quality': ('sleep_quality', 'sleep_quality', 'sleep_quality_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'physical_activity': ('physical_activity', 'physical_activity', 'physical_activity_privacy', lambda x: to_number(x) is not None and to_number(x) <= 2),
-                    'anxiety': ('anxiety', 'anxiety', 'anxiety_privacy', lambda x: to_number(x) is not None and to_number(x) >= 3)
-                }
-                if trigger.parameter_name in param_mapping:
-                    param_checks.append(param_mapping[trigger.parameter_name])
-            
-            logger.info(f"[TRIGGER PROCESS] Watcher {watcher_id} checking {len(param_checks)} parameters")
-            
-            # Check each parameter
-            for param_attr, param_name, privacy_attr, condition_func in param_checks:
-                # Find all consecutive streaks
-                streak_dates = []
-                last_date = None
-                
-                for param_entry in all_params:
-                    param_value = getattr(param_entry, param_attr, None)
-                    param_privacy = getattr(param_entry, privacy_attr, 'private')
-                    
-                    # Check privacy
-                    if not can_see_parameter(param_privacy, watcher_circle):
-                        # Save streak if long enough before resetting
-                        if len(streak_dates) >= consecutive_days:
-                            start_date = streak_dates[0]
-                            end_date = streak_dates[-1]
-                            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                            
-                            if pattern_key not in patterns_seen:
-                                patterns_seen.add(pattern_key)
-                                # Create alert for this pattern
-                                start_str = start_date.strftime('%b %d')
-                                end_str = end_date.strftime('%b %d')
-                                date_pattern = f"({start_str} - {end_str})"
-                                
-                                # Check for DB duplicate - PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                
-                                if not existing:
-                                    content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                    alert = create_alert_with_email(
-                                        user_id=watcher_id,
-                                        title=f"Well-Being Alert for {watched_user.username}",
-                                        content=content,
-                                        alert_type='trigger',
-                                        source_user_id=watched_user.id,
-                                        alert_category='trigger'
-                                    )
-                                    if alert:
-                                        alerts_created += 1
-                                        logger.info(f"[TRIGGER PROCESS] ✅ Created alert for {param_name} {date_pattern}")
-                                else:
-                                    alerts_skipped_duplicate += 1
-                        
-                        streak_dates = []
-                        last_date = None
-                        continue
-                    
-                    if param_value is not None and condition_func(param_value):
-                        # Condition met
-                        if last_date is None:
-                            streak_dates = [param_entry.date]
-                            last_date = param_entry.date
-                        elif (param_entry.date - last_date).days == 1:
-                            streak_dates.append(param_entry.date)
-                            last_date = param_entry.date
-                        elif (param_entry.date - last_date).days == 0:
-                            continue  # Same day
-                        else:
-                            # Gap - save and start new
-                            if len(streak_dates) >= consecutive_days:
-                                start_date = streak_dates[0]
-                                end_date = streak_dates[-1]
-                                pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                                
-                                if pattern_key not in patterns_seen:
-                                    patterns_seen.add(pattern_key)
-                                    start_str = start_date.strftime('%b %d')
-                                    end_str = end_date.strftime('%b %d')
-                                    date_pattern = f"({start_str} - {end_str})"
-                                    
-                                    # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                    existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                    
-                                    if not existing:
-                                        content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                        alert = create_alert_with_email(
-                                            user_id=watcher_id,
-                                            title=f"Well-Being Alert for {watched_user.username}",
-                                            content=content,
-                                            alert_type='trigger',
-                                            source_user_id=watched_user.id,
-                                            alert_category='trigger'
-                                        )
-                                        if alert:
-                                            alerts_created += 1
-                                            logger.info(f"[TRIGGER PROCESS] ✅ Created alert for {param_name} {date_pattern}")
-                                    else:
-                                        alerts_skipped_duplicate += 1
-                            
-                            streak_dates = [param_entry.date]
-                            last_date = param_entry.date
-                    else:
-                        # Condition not met - save streak if long enough
-                        if len(streak_dates) >= consecutive_days:
-                            start_date = streak_dates[0]
-                            end_date = streak_dates[-1]
-                            pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                            
-                            if pattern_key not in patterns_seen:
-                                patterns_seen.add(pattern_key)
-                                start_str = start_date.strftime('%b %d')
-                                end_str = end_date.strftime('%b %d')
-                                date_pattern = f"({start_str} - {end_str})"
-                                
-                                # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                                existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                                
-                                if not existing:
-                                    content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                                    alert = create_alert_with_email(
-                                        user_id=watcher_id,
-                                        title=f"Well-Being Alert for {watched_user.username}",
-                                        content=content,
-                                        alert_type='trigger',
-                                        source_user_id=watched_user.id,
-                                        alert_category='trigger'
-                                    )
-                                    if alert:
-                                        alerts_created += 1
-                                        logger.info(f"[TRIGGER PROCESS] ✅ Created alert for {param_name} {date_pattern}")
-                                else:
-                                    alerts_skipped_duplicate += 1
-                        
-                        streak_dates = []
-                        last_date = None
-                
-                # Don't forget the last streak
-                if len(streak_dates) >= consecutive_days:
-                    start_date = streak_dates[0]
-                    end_date = streak_dates[-1]
-                    pattern_key = (watcher_id, param_name, start_date.isoformat(), end_date.isoformat())
-                    
-                    if pattern_key not in patterns_seen:
-                        patterns_seen.add(pattern_key)
-                        start_str = start_date.strftime('%b %d')
-                        end_str = end_date.strftime('%b %d')
-                        date_pattern = f"({start_str} - {end_str})"
-                        
-                        # PJ6018: Uses helper that respects ALERT_EMAIL_MODE
-                        existing = check_duplicate_alert(watcher_id, watched_user.username, param_name, date_pattern)
-                        
-                        if not existing:
-                            content = f"{watched_user.username}'s {param_name} has been at low levels for {len(streak_dates)} consecutive days {date_pattern}"
-                            alert = create_alert_with_email(
-                                user_id=watcher_id,
-                                title=f"Well-Being Alert for {watched_user.username}",
-                                content=content,
-                                alert_type='trigger',
-                                source_user_id=watched_user.id,
-                                alert_category='trigger'
-                            )
-                            if alert:
-                                alerts_created += 1
-                                logger.info(f"[TRIGGER PROCESS] ✅ Created alert for {param_name} {date_pattern}")
-                        else:
-                            alerts_skipped_duplicate += 1
+            # Get watcher's circle level for privacy check
+            # U5: Use ALL circle memberships
+            watcher_circle = circles_by_watcher.get(watcher_id)
+            if not watcher_circle:
+                logger.info(f"[TRIGGER PROCESS] Skipping watcher {watcher_id} - not in any circle")
+                continue
+            
+            watchers_processed.add(watcher_id)
+            
+            # Determine which schema this trigger uses
+            alert_mask = trigger.alert_mask or 0
+            has_new_schema = alert_mask != 0
+            
+            has_old_schema = trigger.parameter_name is not None
+            
+            logger.info(f"[TRIGGER PROCESS] Processing watcher {watcher_id}: new_schema={has_new_schema}, old_schema={has_old_schema}")
+            
+            # Parameters to check, from the module-level _TRIGGER_PARAM_CHECKS table (PJ817
+            # string-safe concern tests; no per-trigger closures)
+            if has_new_schema:
+                param_checks = [_TRIGGER_PARAM_CHECKS[name] for bit, name in _TRIGGER_ALERT_BITS
+                                if alert_mask & bit]
+            elif has_old_schema and trigger.parameter_name in _TRIGGER_PARAM_CHECKS:
+                # Old schema - single parameter from trigger.parameter_name
+                param_checks = [_TRIGGER_PARAM_CHECKS[trigger.parameter_name]]
+            else:
+                param_checks = []
+            
+            logger.info(f"[TRIGGER PROCESS] Watcher {watcher_id} checking {len(param_checks)} parameters")
+            
+            # Check each parameter: a streak is a run of consecutive days where the value meets
+            # the concern condition AND the watcher can see it (a hidden entry ends the streak)
+            visible_levels = _visible_privacy_levels(watcher_circle)
+            for param_attr, param_name, _privacy_attr, _condition_func in param_checks:
+                # PERF: watchers with the same visibility and minimum length see the same
+                # streaks - scan each (parameter, visibility, length) combination once
+                streak_key = (param_attr, visible_levels, consecutive_days)
+                streaks = streak_cache.get(streak_key)
+                if streaks is None:
+                    concern = concern_columns[param_attr]
+                    privacy = privacy_columns[param_attr]
+                    if NUMPY_AVAILABLE:
+                        flags = concern & np.isin(privacy, visible_levels)
+                    else:
+                        flags = [c and p in visible_levels for c, p in zip(concern, privacy)]
+                    streaks = streak_cache[streak_key] = _find_day_streaks(flags, day_numbers, consecutive_days)
+                for start, end in streaks:
+                    _alert_streak(watcher_id, param_name, entry_dates[start:end + 1])
+
+        if pending_alerts:
+            db.session.execute(insert(Alert), pending_alerts)
+            db.session.commit()
 
         logger.info(f"[TRIGGER PROCESS] ========================================")
         logger.info(f"[TRIGGER PROCESS] process_parameter_triggers completed for user {user_id}")
@@ -13860,19 +14909,6 @@ def cleanup_stale_trigger_alerts_for_user(affected_user_id):
         affected_user_id: The user whose parameters were just updated
     """
     try:
-        # Helper function to check privacy permissions
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            """Check if watcher can see this parameter based on privacy and circle level"""
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
-
         # Get the user who was just updated
         affected_user = User.query.get(affected_user_id)
         if not affected_user:
@@ -13882,18 +14918,29 @@ def cleanup_stale_trigger_alerts_for_user(affected_user_id):
         # PJ6019 FIX: Added is_active=True filter
         triggers = ParameterTrigger.query.filter_by(watched_id=affected_user_id, is_active=True).all()
 
+        # PERF: all watchers' circle levels in ONE query instead of one per trigger
+        circles_by_watcher = _get_members_circle_types(affected_user_id, {t.watcher_id for t in triggers})
+
+        # PERF: trigger alerts about the user are matched on the indexed source_user_id column
+        # (PJ401, set on every trigger alert) instead of a leading-wildcard LIKE over content;
+        # only legacy rows without a source_user_id still fall back to the content match
+        about_affected_user = or_(
+            Alert.source_user_id == affected_user_id,
+            and_(Alert.source_user_id.is_(None), Alert.content.like(f"%{affected_user.username}%"))
+        )
+
         for trigger in triggers:
             watcher_id = trigger.watcher_id
 
             # Get watcher's circle level
-            watcher_circle = get_watcher_all_circles(affected_user_id, watcher_id)
+            watcher_circle = circles_by_watcher.get(watcher_id, set())
 
             if not watcher_circle:
                 # Watcher not in any circle - remove all their alerts for this user
                 alerts_to_remove = Alert.query.filter(
                     Alert.user_id == watcher_id,
                     Alert.alert_type == 'trigger',
-                    Alert.content.like(f"%{affected_user.username}%")
+                    about_affected_user
                 ).all()
 
                 for alert in alerts_to_remove:
@@ -13925,7 +14972,7 @@ def cleanup_stale_trigger_alerts_for_user(affected_user_id):
             watcher_alerts = Alert.query.filter(
                 Alert.user_id == watcher_id,
                 Alert.alert_type == 'trigger',
-                Alert.content.like(f"%{affected_user.username}%")
+                about_affected_user
             ).all()
 
             for alert in watcher_alerts:
@@ -13945,7 +14992,7 @@ def cleanup_stale_trigger_alerts_for_user(affected_user_id):
                 param_privacy = getattr(recent_param, privacy_attr, 'private')
 
                 # Check if watcher should still see this alert
-                if not can_see_parameter(param_privacy, watcher_circle):
+                if param_privacy not in _visible_privacy_levels(watcher_circle):
                     db.session.delete(alert)
                     logger.info(
                         f"Auto-cleanup: Removed alert {alert.id} for watcher {watcher_id} - {param_privacy} vs {watcher_circle}")
@@ -14101,21 +15148,12 @@ def cleanup_all_stale_trigger_alerts():
     try:
         logger.info("Starting global trigger alerts cleanup...")
 
-        # Helper function to check privacy permissions
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            """Check if watcher can see this parameter based on privacy and circle level"""
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
-
         # Get all trigger alerts
-        all_trigger_alerts = Alert.query.filter_by(alert_type='trigger').all()
+        # PERF: only the columns the check reads, as plain Rows - nothing is loaded into the
+        # identity map just to be deleted one object at a time
+        all_trigger_alerts = db.session.execute(
+            select(Alert.id, Alert.user_id, Alert.content).where(Alert.alert_type == 'trigger')
+        ).all()
 
         total_checked = len(all_trigger_alerts)
         removed_count = 0
@@ -14131,6 +15169,34 @@ def cleanup_all_stale_trigger_alerts():
             'energy': 'energy_privacy'
         }
 
+        # PERF: resolve every watched username, then every (watched, watcher) circle set, up
+        # front - two queries instead of a User lookup and a circle query per alert
+        usernames = {(a.content or "").split("'s ")[0] for a in all_trigger_alerts if "'s " in (a.content or "")}
+        user_ids_by_name = dict(db.session.execute(
+            select(User.username, User.id).where(User.username.in_(list(usernames)))
+        ).all()) if usernames else {}
+        circles_by_pair = _get_circle_types_by_pair(
+            set(user_ids_by_name.values()), {a.user_id for a in all_trigger_alerts}
+        )
+
+        # PERF: every watched user's most recently updated SavedParameters privacy settings in
+        # ONE windowed query (was an ORDER BY updated_at DESC LIMIT 1 query per alert)
+        privacy_fields = sorted(set(param_keywords.values()))
+        recent_privacy = {}
+        if user_ids_by_name:
+            sp_columns = SavedParameters.__table__.c
+            ranked = select(
+                sp_columns.user_id,
+                *[sp_columns[f] for f in privacy_fields],
+                func.row_number().over(
+                    partition_by=sp_columns.user_id, order_by=sp_columns.updated_at.desc()
+                ).label('rn')
+            ).where(sp_columns.user_id.in_(list(set(user_ids_by_name.values())))).subquery()
+            for row in db.session.execute(select(ranked).where(ranked.c.rn == 1)):
+                recent_privacy[row.user_id] = row._mapping
+
+        ids_to_delete = []
+
         for alert in all_trigger_alerts:
             watcher_id = alert.user_id
             content = alert.content or ""
@@ -14141,20 +15207,18 @@ def cleanup_all_stale_trigger_alerts():
                 continue
 
             username = content.split("'s ")[0]
-            watched_user = User.query.filter_by(username=username).first()
+            watched_id = user_ids_by_name.get(username)
 
-            if not watched_user:
+            if not watched_id:
                 kept_count += 1
                 continue
 
-            watched_id = watched_user.id
-
             # Get watcher's circle level
-            watcher_circle = get_watcher_all_circles(watched_id, watcher_id)
+            watcher_circle = circles_by_pair.get((watched_id, watcher_id), set())
 
             if not watcher_circle:
                 # Watcher not in any circle - remove alert
-                db.session.delete(alert)
+                ids_to_delete.append(alert.id)
                 removed_count += 1
                 logger.info(f"Global cleanup: Removed alert {alert.id} - watcher {watcher_id} not in circles")
                 continue
@@ -14171,25 +15235,29 @@ def cleanup_all_stale_trigger_alerts():
                 continue
 
             # Get current privacy settings
-            recent_param = SavedParameters.query.filter_by(
-                user_id=watched_id
-            ).order_by(SavedParameters.updated_at.desc()).first()
+            recent_param = recent_privacy.get(watched_id)
 
             if not recent_param:
                 kept_count += 1
                 continue
 
-            param_privacy = getattr(recent_param, privacy_attr, 'private')
+            param_privacy = recent_param[privacy_attr]
 
             # Check if watcher should see this alert
-            if not can_see_parameter(param_privacy, watcher_circle):
-                db.session.delete(alert)
+            if param_privacy not in _visible_privacy_levels(watcher_circle):
+                ids_to_delete.append(alert.id)
                 removed_count += 1
                 logger.info(
                     f"Global cleanup: Removed alert {alert.id} - privacy violation ({param_privacy} vs {watcher_circle})")
             else:
                 kept_count += 1
 
+        # PERF: set-based DELETE in chunks (was one db.session.delete() + DELETE per alert)
+        for i in range(0, len(ids_to_delete), 1000):
+            db.session.execute(
+                delete(Alert).where(Alert.id.in_(ids_to_delete[i:i + 1000])).execution_options(
+                    synchronize_session=False)
+            )
         db.session.commit()
 
         logger.info(f"Global cleanup completed: Checked {total_checked}, Removed {removed_count}, Kept {kept_count}")
@@ -14209,12 +15277,14 @@ def get_parameter_dates():
     try:
         user_id = session.get('user_id')
 
-        # Get all parameter dates for this user using SQLAlchemy ORM
-        params = SavedParameters.query.filter_by(user_id=user_id).all()
+        # PERF: select only the date column - no ORM objects are built, and the
+        # (user_id, date) unique index (_user_date_uc) makes this an index-only scan
+        rows = db.session.execute(
+            select(SavedParameters.date).filter_by(user_id=user_id)
+        ).scalars().all()
 
-        # Extract just the dates
-        dates = [param.date.strftime('%Y-%m-%d') if hasattr(param.date, 'strftime') else str(param.date)
-                 for param in params if param.date]
+        dates = [d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d)
+                 for d in rows if d]
 
         return jsonify({
             'success': True,
@@ -14239,23 +15309,32 @@ def get_insights():
 
         # Get last 30 days - SQLAlchemy 2.0 style
         thirty_days_ago = datetime.now().date() - timedelta(days=30)
-        params_stmt = select(SavedParameters).filter(
+        in_window = and_(
             SavedParameters.user_id == user_id,
-            SavedParameters.date >= thirty_days_ago
+            SavedParameters.date >= thirty_days_ago.isoformat()  # String(10) date column
         )
-        params = db.session.execute(params_stmt).scalars().all()
+        # PERF: only the date column is loaded (for the streak); the averages and the most
+        # common mood are aggregated DB-side instead of materializing every entry's columns
+        params = db.session.execute(select(SavedParameters.date).where(in_window)).all()
 
         if not params:
             return jsonify({'message': 'No data available for insights'})
 
-        # Calculate insights
-        avg_sleep = sum(p.sleep_hours for p in params if p.sleep_hours) / len(params) if params else 0
-        moods = [p.mood for p in params if p.mood]
+        # Calculate insights (sleep_hours was migrated to the sleep_quality column)
+        sleep_total = db.session.execute(
+            select(func.coalesce(func.sum(SavedParameters.sleep_quality), 0)).where(in_window)
+        ).scalar()
+        avg_sleep = float(sleep_total) / len(params)
+        most_common_mood = db.session.execute(
+            select(SavedParameters.mood).where(
+                in_window, SavedParameters.mood.isnot(None), SavedParameters.mood != 0
+            ).group_by(SavedParameters.mood).order_by(func.count().desc()).limit(1)
+        ).scalar()
 
         return jsonify({
             'average_sleep': round(avg_sleep, 1),
             'total_entries': len(params),
-            'most_common_mood': max(moods, key=moods.count) if moods else 'N/A',
+            'most_common_mood': most_common_mood if most_common_mood is not None else 'N/A',
             'streak': calculate_streak(params)
         })
 
@@ -14459,12 +15538,8 @@ def should_redirect_to_diary():
                 'reason': 'redirect_already_done'
             })
         
-        # FIX: Query using string comparison since date column is String type
-        params_stmt = select(SavedParameters).filter(
-            SavedParameters.user_id == user_id,
-            SavedParameters.date == today_str  # String comparison
-        )
-        entry = db.session.execute(params_stmt).scalar_one_or_none()
+        # PERF: only the ratings, from Redis when cached (see _get_diary_ratings)
+        entry = _get_diary_ratings(user_id, today_str)
         
         logger.info(f"Diary check for user {user_id}, date {today_str}: entry found = {entry is not None}")
         
@@ -14478,37 +15553,14 @@ def should_redirect_to_diary():
                 'date': today_str
             })
         
-        # Check which required fields are filled
-        missing_fields = []
-        
-        mood_val = getattr(entry, 'mood', None)
-        if not mood_val or mood_val == 0:
-            missing_fields.append('mood')
-        
-        energy_val = getattr(entry, 'energy', None)
-        if not energy_val or energy_val == 0:
-            missing_fields.append('energy')
-        
-        sleep_val = getattr(entry, 'sleep_quality', None)
-        if not sleep_val or sleep_val == 0:
-            missing_fields.append('sleep_quality')
-        
-        activity_val = getattr(entry, 'physical_activity', None)
-        if not activity_val or activity_val == 0:
-            missing_fields.append('physical_activity')
-        
-        anxiety_val = getattr(entry, 'anxiety', None)
-        if not anxiety_val or anxiety_val == 0:
-            missing_fields.append('anxiety')
-        
-        belonging_val = getattr(entry, 'social_belonging', None)  # C15
-        if not belonging_val or belonging_val == 0:
-            missing_fields.append('social_belonging')
+        # Check which required fields are filled (C15: social_belonging included)
+        # PERF: one pass over the fixed _PARAM_FIELDS tuple (was six getattr + append blocks)
+        missing_fields = [field for field in _PARAM_FIELDS if not entry.get(field)]
         
         has_complete = len(missing_fields) == 0
         
         logger.info(f"Diary check for user {user_id}: complete={has_complete}, missing={missing_fields}")
-        logger.info(f"Entry values - mood:{mood_val}, energy:{energy_val}, sleep:{sleep_val}, activity:{activity_val}, anxiety:{anxiety_val}")
+        logger.info(f"Entry values - {entry}")
         
         # Clear the redirect flag regardless of completion status
         # (we only check once per session - user can navigate after this)
@@ -14520,13 +15572,7 @@ def should_redirect_to_diary():
             'missing_fields': missing_fields,
             'date': today_str,
             'entry_found': True,
-            'values': {
-                'mood': mood_val,
-                'energy': energy_val,
-                'sleep_quality': sleep_val,
-                'physical_activity': activity_val,
-                'anxiety': anxiety_val
-            }
+            'values': entry
         })
         
     except Exception as e:
@@ -14556,89 +15602,57 @@ def get_progress():
         start_date = end_date - timedelta(days=days)
         
         # Get parameters for the period
-        params_stmt = select(SavedParameters).filter(
-            SavedParameters.user_id == user_id,
-            SavedParameters.date >= start_date,
-            SavedParameters.date <= end_date
-        ).order_by(SavedParameters.date)
-        params = db.session.execute(params_stmt).scalars().all()
-        
-        dates = []
-        mood_data = []
-        energy_data = []
-        sleep_data = []
-        activity_data = []
-        anxiety_data = []  # FIX #2: Added anxiety
-        belonging_data = []  # C15
-        
-        def safe_int(val):
-            """Convert value to int, handling strings and None. Diary values are 1-4."""
-            if val is None:
-                return None
-            try:
-                v = int(val)
-                return v if 1 <= v <= 4 else None  # Diary entries use 1-4 scale
-            except (ValueError, TypeError):
-                # Handle text values by mapping to 1-4 scale
-                if isinstance(val, str):
-                    val_lower = val.lower()
-                    text_map = {
-                        '1': 1, '2': 2, '3': 3, '4': 4,
-                        'terrible': 1, 'bad': 1, 'poor': 2, 'low': 2,
-                        'okay': 3, 'neutral': 3, 'moderate': 3, 'medium': 3,
-                        'good': 4, 'high': 4, 'great': 4, 'excellent': 4
-                    }
-                    return text_map.get(val_lower, None)
-                return None
+        # PERF: only the date and the six ratings, as plain Rows (no ORM hydration of notes,
+        # privacy and timestamp columns). The 1-4 range check that safe_int() did per value
+        # runs in SQL - the rating columns are Integer, so out-of-range values come back NULL.
+        # date is a 'YYYY-MM-DD' String(10) column, so the bounds are ISO strings
+        sp_columns = SavedParameters.__table__.c
+        params = db.session.execute(
+            select(
+                sp_columns.date,
+                *[case((sp_columns[f].between(1, 4), sp_columns[f])).label(f) for f in _PARAM_FIELDS]
+            ).where(
+                sp_columns.user_id == user_id,
+                sp_columns.date.between(start_date.isoformat(), end_date.isoformat())
+            ).order_by(sp_columns.date)
+        ).all()
         
-        for p in params:
-            dates.append(p.date.strftime('%m/%d') if hasattr(p.date, 'strftime') else str(p.date))
-            
-            # Get mood value (try different column names)
-            mood_val = getattr(p, 'mood', None) or getattr(p, 'mood_rating', None)
-            mood_data.append(safe_int(mood_val))
-            
-            # Get energy value
-            energy_val = getattr(p, 'energy', None) or getattr(p, 'energy_rating', None)
-            energy_data.append(safe_int(energy_val))
-            
-            # Get sleep value
-            sleep_val = getattr(p, 'sleep_quality', None) or getattr(p, 'sleep_hours', None)
-            sleep_data.append(safe_int(sleep_val))
-            
-            # Get activity value
-            activity_val = getattr(p, 'physical_activity', None) or getattr(p, 'exercise', None)
-            activity_data.append(safe_int(activity_val))
-            
-            # FIX #2: Get anxiety value
-            anxiety_val = getattr(p, 'anxiety', None) or getattr(p, 'anxiety_level', None)
-            anxiety_data.append(safe_int(anxiety_val))
-
-            # C15: Get belonging value
-            belonging_val = getattr(p, 'social_belonging', None)
-            belonging_data.append(safe_int(belonging_val))
+        dates = [str(p.date) for p in params]
+        mood_data = [p.mood for p in params]
+        energy_data = [p.energy for p in params]
+        sleep_data = [p.sleep_quality for p in params]
+        activity_data = [p.physical_activity for p in params]
+        anxiety_data = [p.anxiety for p in params]  # FIX #2: Added anxiety
+        belonging_data = [p.social_belonging for p in params]  # C15
         
         # Calculate averages
-        def calc_avg(data):
-            valid = [v for v in data if v is not None]
-            return sum(valid) / len(valid) if valid else None
-        
-        avg_mood = calc_avg(mood_data)
-        avg_energy = calc_avg(energy_data)
-        avg_sleep = calc_avg(sleep_data)
-        avg_activity = calc_avg(activity_data)
-        avg_anxiety = calc_avg(anxiety_data)  # FIX #2: Added anxiety average
-        avg_belonging = calc_avg(belonging_data)  # C15
+        if NUMPY_AVAILABLE and params:
+            # PERF: all six averages from one (rows x 6) float array in C loops - NULL
+            # ratings become NaN and drop out of both the sums and the counts
+            ratings = np.array([p[1:] for p in params], dtype=float)
+            counts = np.count_nonzero(~np.isnan(ratings), axis=0)
+            sums = np.nansum(ratings, axis=0)
+            averages = [float(total / count) if count else None for total, count in zip(sums, counts)]
+        else:
+            def calc_avg(data):
+                valid = [v for v in data if v is not None]
+                return sum(valid) / len(valid) if valid else None
+            
+            averages = [calc_avg(data) for data in (mood_data, energy_data, sleep_data,
+                                                    activity_data, anxiety_data, belonging_data)]
+        # _PARAM_FIELDS order; FIX #2: anxiety average, C15: belonging average
+        avg_mood, avg_energy, avg_sleep, avg_activity, avg_anxiety, avg_belonging = averages
         
         # PJ6009: Get language from query parameter first, then fall back to user preference
-        user_language = request.args.get('lang', None)
+        # PERF: the preference is kept in the session at login and on every change, so
+        # only sessions that predate that need the User lookup (its result is then stored)
+        user_language = request.args.get('lang', None) or session.get('preferred_language')
         if not user_language:
             try:
-                user = db.session.get(User, user_id)
-                if user and user.preferred_language:
-                    user_language = user.preferred_language
-                else:
-                    user_language = 'en'
+                user_language = db.session.execute(
+                    select(User.preferred_language).where(User.id == user_id)
+                ).scalar() or 'en'
+                session['preferred_language'] = user_language
             except:
                 user_language = 'en'
         
@@ -14687,10 +15701,7 @@ def get_user_progress(user_id):
 
         if not is_professional_viewer:
             # ST10T1: Check if target user has added current user to their connections
-            is_following = Follow.query.filter_by(
-                follower_id=user_id,
-                followed_id=current_user_id
-            ).first() is not None
+            is_following = _follow_exists(user_id, current_user_id)
             
             is_in_circle = Circle.query.filter_by(
                 user_id=user_id,
@@ -14850,95 +15861,96 @@ def get_user_progress(user_id):
         return jsonify({'error': str(e)}), 500
 
 
+# PJ6003: Insight translations
+# PERF: built once at import (was a fresh 4-language dict literal on every call)
+_INSIGHT_TRANSLATIONS = {
+    'en': {
+        'start_tracking': 'Start tracking your daily well-being to receive personalized insights!',
+        'logged_entries': "Great job tracking for {days} days!",
+        'logged_few': "You've logged {days} entries. Keep tracking daily for better insights!",
+        'mood_positive': 'Your mood has been generally positive. Keep up the good work!',
+        'mood_low': 'Your mood has been lower than usual. Consider activities that boost your well-being.',
+        'energy_strong': 'Your energy levels are strong!',
+        'energy_low': 'Low energy detected. Consider prioritizing rest or exercise.',
+        'sleep_great': 'Great sleep quality!',
+        'sleep_improve': 'Your sleep quality could be improved. Consider better sleep hygiene.',
+        'activity_excellent': 'Excellent activity levels!',
+        'activity_low': 'Consider increasing your physical activity for better well-being.',
+        'anxiety_high': 'Anxiety levels appear elevated. Consider relaxation techniques or speaking with a professional.',
+        'anxiety_good': 'Good anxiety management!',
+        'belonging_strong': 'Your sense of social connection has been strong this period!',
+        'belonging_low': 'Your sense of belonging has been lower recently. Consider reaching out to someone you trust.',
+        'making_progress': "You're making progress! Continue tracking for more detailed insights."
+    },
+    'he': {
+        'start_tracking': 'התחל/י לעקוב אחרי הבריאות שלך כדי לקבל תובנות מותאמות אישית!',
+        'logged_entries': 'כל הכבוד על מעקב במשך {days} ימים!',
+        'logged_few': 'רשמת {days} רשומות. המשך/י לעקוב יומיומית לתובנות טובות יותר!',
+        'mood_positive': 'מצב הרוח שלך היה חיובי באופן כללי. המשך/י כך!',
+        'mood_low': 'מצב הרוח שלך היה נמוך מהרגיל. שקול/י פעילויות שמשפרות את הרווחה שלך.',
+        'energy_strong': 'רמות האנרגיה שלך חזקות!',
+        'energy_low': 'זוהתה אנרגיה נמוכה. שקול/י לתעדף מנוחה או פעילות גופנית.',
+        'sleep_great': 'איכות שינה מעולה!',
+        'sleep_improve': 'איכות השינה שלך יכולה להשתפר. שקול/י היגיינת שינה טובה יותר.',
+        'activity_excellent': 'רמות פעילות מצוינות!',
+        'activity_low': 'שקול/י להגביר את הפעילות הגופנית שלך לרווחה טובה יותר.',
+        'anxiety_high': 'רמות החרדה נראות מוגברות. שקול/י טכניקות הרגעה או שיחה עם מומחה.',
+        'anxiety_good': 'ניהול חרדה טוב!',
+        'belonging_strong': 'תחושת החיבור החברתי שלך הייתה חזקה בתקופה זו!',
+        'belonging_low': 'תחושת השייכות שלך הייתה נמוכה לאחרונה. שקול/י לפנות למישהו שאת/ה סומך/ת עליו.',
+        'making_progress': 'את/ה מתקדם/ת! המשך/י לעקוב לתובנות מפורטות יותר.'
+    },
+    'ar': {
+        'start_tracking': 'ابدأ بتتبع صحتك اليومية لتلقي رؤى مخصصة!',
+        'logged_entries': 'عمل رائع في التتبع لمدة {days} أيام!',
+        'logged_few': 'لقد سجلت {days} إدخالات. استمر في التتبع يوميًا للحصول على رؤى أفضل!',
+        'mood_positive': 'كان مزاجك إيجابيًا بشكل عام. استمر في ذلك!',
+        'mood_low': 'كان مزاجك أقل من المعتاد. فكر في أنشطة تعزز رفاهيتك.',
+        'energy_strong': 'مستويات طاقتك قوية!',
+        'energy_low': 'تم اكتشاف طاقة منخفضة. فكر في إعطاء الأولوية للراحة أو التمارين.',
+        'sleep_great': 'جودة نوم رائعة!',
+        'sleep_improve': 'يمكن تحسين جودة نومك. فكر في نظافة نوم أفضل.',
+        'activity_excellent': 'مستويات نشاط ممتازة!',
+        'activity_low': 'فكر في زيادة نشاطك البدني لرفاهية أفضل.',
+        'anxiety_high': 'يبدو أن مستويات القلق مرتفعة. فكر في تقنيات الاسترخاء أو التحدث مع متخصص.',
+        'anxiety_good': 'إدارة قلق جيدة!',
+        'belonging_strong': 'إحساسك بالارتباط الاجتماعي كان قويًا في هذه الفترة!',
+        'belonging_low': 'إحساسك بالانتماء كان أقل مؤخرًا. فكر في التواصل مع شخص تثق به.',
+        'making_progress': 'أنت تحرز تقدمًا! استمر في التتبع للحصول على رؤى أكثر تفصيلاً.'
+    },
+    'ru': {
+        'start_tracking': 'Начните отслеживать своё здоровье, чтобы получать персонализированные советы!',
+        'logged_entries': 'Отличная работа! Вы отслеживаете уже {days} дней!',
+        'logged_few': 'Вы записали {days} записей. Продолжайте отслеживать ежедневно для лучших советов!',
+        'mood_positive': 'Ваше настроение было в целом позитивным. Продолжайте в том же духе!',
+        'mood_low': 'Ваше настроение было ниже обычного. Подумайте о занятиях, которые улучшат ваше самочувствие.',
+        'energy_strong': 'Ваш уровень энергии высок!',
+        'energy_low': 'Обнаружен низкий уровень энергии. Подумайте о приоритете отдыха или упражнений.',
+        'sleep_great': 'Отличное качество сна!',
+        'sleep_improve': 'Качество вашего сна можно улучшить. Подумайте о лучшей гигиене сна.',
+        'activity_excellent': 'Отличный уровень активности!',
+        'activity_low': 'Подумайте об увеличении физической активности для лучшего самочувствия.',
+        'anxiety_high': 'Уровень тревожности повышен. Подумайте о техниках релаксации или консультации специалиста.',
+        'anxiety_good': 'Хорошее управление тревожностью!',
+        'belonging_strong': 'Ваше чувство социальной связи было сильным в этот период!',
+        'belonging_low': 'Ваше чувство принадлежности было ниже в последнее время. Подумайте о том, чтобы связаться с кем-то, кому доверяете.',
+        'making_progress': 'Вы делаете успехи! Продолжайте отслеживать для более детальных советов.'
+    }
+}
+
+
 def generate_progress_insights(avg_mood, avg_energy, avg_sleep, avg_activity, total_entries, avg_anxiety=None, language='en', avg_belonging=None):
     """Generate personalized insights based on averages. Diary values are 1-4, chart Y-axis is 1-5."""
-    
-    # PJ6003: Insight translations
-    insight_translations = {
-        'en': {
-            'start_tracking': 'Start tracking your daily well-being to receive personalized insights!',
-            'logged_entries': "Great job tracking for {days} days!",
-            'logged_few': "You've logged {days} entries. Keep tracking daily for better insights!",
-            'mood_positive': 'Your mood has been generally positive. Keep up the good work!',
-            'mood_low': 'Your mood has been lower than usual. Consider activities that boost your well-being.',
-            'energy_strong': 'Your energy levels are strong!',
-            'energy_low': 'Low energy detected. Consider prioritizing rest or exercise.',
-            'sleep_great': 'Great sleep quality!',
-            'sleep_improve': 'Your sleep quality could be improved. Consider better sleep hygiene.',
-            'activity_excellent': 'Excellent activity levels!',
-            'activity_low': 'Consider increasing your physical activity for better well-being.',
-            'anxiety_high': 'Anxiety levels appear elevated. Consider relaxation techniques or speaking with a professional.',
-            'anxiety_good': 'Good anxiety management!',
-            'belonging_strong': 'Your sense of social connection has been strong this period!',
-            'belonging_low': 'Your sense of belonging has been lower recently. Consider reaching out to someone you trust.',
-            'making_progress': "You're making progress! Continue tracking for more detailed insights."
-        },
-        'he': {
-            'start_tracking': 'התחל/י לעקוב אחרי הבריאות שלך כדי לקבל תובנות מותאמות אישית!',
-            'logged_entries': 'כל הכבוד על מעקב במשך {days} ימים!',
-            'logged_few': 'רשמת {days} רשומות. המשך/י לעקוב יומיומית לתובנות טובות יותר!',
-            'mood_positive': 'מצב הרוח שלך היה חיובי באופן כללי. המשך/י כך!',
-            'mood_low': 'מצב הרוח שלך היה נמוך מהרגיל. שקול/י פעילויות שמשפרות את הרווחה שלך.',
-            'energy_strong': 'רמות האנרגיה שלך חזקות!',
-            'energy_low': 'זוהתה אנרגיה נמוכה. שקול/י לתעדף מנוחה או פעילות גופנית.',
-            'sleep_great': 'איכות שינה מעולה!',
-            'sleep_improve': 'איכות השינה שלך יכולה להשתפר. שקול/י היגיינת שינה טובה יותר.',
-            'activity_excellent': 'רמות פעילות מצוינות!',
-            'activity_low': 'שקול/י להגביר את הפעילות הגופנית שלך לרווחה טובה יותר.',
-            'anxiety_high': 'רמות החרדה נראות מוגברות. שקול/י טכניקות הרגעה או שיחה עם מומחה.',
-            'anxiety_good': 'ניהול חרדה טוב!',
-            'belonging_strong': 'תחושת החיבור החברתי שלך הייתה חזקה בתקופה זו!',
-            'belonging_low': 'תחושת השייכות שלך הייתה נמוכה לאחרונה. שקול/י לפנות למישהו שאת/ה סומך/ת עליו.',
-            'making_progress': 'את/ה מתקדם/ת! המשך/י לעקוב לתובנות מפורטות יותר.'
-        },
-        'ar': {
-            'start_tracking': 'ابدأ بتتبع صحتك اليومية لتلقي رؤى مخصصة!',
-            'logged_entries': 'عمل رائع في التتبع لمدة {days} أيام!',
-            'logged_few': 'لقد سجلت {days} إدخالات. استمر في التتبع يوميًا للحصول على رؤى أفضل!',
-            'mood_positive': 'كان مزاجك إيجابيًا بشكل عام. استمر في ذلك!',
-            'mood_low': 'كان مزاجك أقل من المعتاد. فكر في أنشطة تعزز رفاهيتك.',
-            'energy_strong': 'مستويات طاقتك قوية!',
-            'energy_low': 'تم اكتشاف طاقة منخفضة. فكر في إعطاء الأولوية للراحة أو التمارين.',
-            'sleep_great': 'جودة نوم رائعة!',
-            'sleep_improve': 'يمكن تحسين جودة نومك. فكر في نظافة نوم أفضل.',
-            'activity_excellent': 'مستويات نشاط ممتازة!',
-            'activity_low': 'فكر في زيادة نشاطك البدني لرفاهية أفضل.',
-            'anxiety_high': 'يبدو أن مستويات القلق مرتفعة. فكر في تقنيات الاسترخاء أو التحدث مع متخصص.',
-            'anxiety_good': 'إدارة قلق جيدة!',
-            'belonging_strong': 'إحساسك بالارتباط الاجتماعي كان قويًا في هذه الفترة!',
-            'belonging_low': 'إحساسك بالانتماء كان أقل مؤخرًا. فكر في التواصل مع شخص تثق به.',
-            'making_progress': 'أنت تحرز تقدمًا! استمر في التتبع للحصول على رؤى أكثر تفصيلاً.'
-        },
-        'ru': {
-            'start_tracking': 'Начните отслеживать своё здоровье, чтобы получать персонализированные советы!',
-            'logged_entries': 'Отличная работа! Вы отслеживаете уже {days} дней!',
-            'logged_few': 'Вы записали {days} записей. Продолжайте отслеживать ежедневно для лучших советов!',
-            'mood_positive': 'Ваше настроение было в целом позитивным. Продолжайте в том же духе!',
-            'mood_low': 'Ваше настроение было ниже обычного. Подумайте о занятиях, которые улучшат ваше самочувствие.',
-            'energy_strong': 'Ваш уровень энергии высок!',
-            'energy_low': 'Обнаружен низкий уровень энергии. Подумайте о приоритете отдыха или упражнений.',
-            'sleep_great': 'Отличное качество сна!',
-            'sleep_improve': 'Качество вашего сна можно улучшить. Подумайте о лучшей гигиене сна.',
-            'activity_excellent': 'Отличный уровень активности!',
-            'activity_low': 'Подумайте об увеличении физической активности для лучшего самочувствия.',
-            'anxiety_high': 'Уровень тревожности повышен. Подумайте о техниках релаксации или консультации специалиста.',
-            'anxiety_good': 'Хорошее управление тревожностью!',
-            'belonging_strong': 'Ваше чувство социальной связи было сильным в этот период!',
-            'belonging_low': 'Ваше чувство принадлежности было ниже в последнее время. Подумайте о том, чтобы связаться с кем-то, кому доверяете.',
-            'making_progress': 'Вы делаете успехи! Продолжайте отслеживать для более детальных советов.'
-        }
-    }
-    
-    t = insight_translations.get(language, insight_translations['en'])
+    t = _INSIGHT_TRANSLATIONS.get(language, _INSIGHT_TRANSLATIONS['en'])
     insights = []
     
     if total_entries == 0:
         return t['start_tracking']
     
     if total_entries < 7:
-        insights.append(t['logged_few'].replace('{days}', str(total_entries)))
+        insights.append(t['logged_few'].format(days=total_entries))
     else:
-        insights.append(t['logged_entries'].replace('{days}', str(total_entries)))
+        insights.append(t['logged_entries'].format(days=total_entries))
     
     # Thresholds based on 1-4 scale (midpoint is 2.5)
     if avg_mood is not None:
@@ -15895,215 +16907,218 @@ def ai_feedback_preference():
 # REPORT GENERATION - TRANSLATIONS
 # =====================
 
-def get_report_translations(lang='en'):
-    """Get report translations for Excel/PDF generation"""
-    translations = {
-        'en': {
-            'title': 'Weekly Progress Report - Patient',
-            'week': 'Week',
-            'daily_checkin': 'Daily Check-in',
-            'date': 'Date',
-            'day': 'Day',
-            'checkin_time': 'Check-in Time',
-            'mood': 'Mood',
-            'mood_scale': '(1-4)',
-            'mood_notes': 'Mood Notes',
-            'energy': 'Energy',
-            'energy_scale': '(1-4)',
-            'energy_notes': 'Energy Notes',
-            'social': 'Social Activity',
-            'social_scale': '(1-4)',
-            'social_notes': 'Social Notes',
-            'sleep': 'Sleep',
-            'sleep_scale': '(1-4)',
-            'sleep_notes': 'Sleep Notes',
-            'anxiety': 'Calmness' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety',
-            'anxiety_scale': '(1-4)',
-            'anxiety_notes': ('Calmness Notes' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety Notes'),
-            'motivation': 'Motivation',
-            'motivation_scale': '(1-4)',
-            'motivation_notes': 'Motivation Notes',
-            'medication': 'Medication',
-            'medication_scale': '(1-4)',
-            'medication_notes': 'Medication Notes',
-            'physical': 'Activity',
-            'physical_scale': '(1-4)',
-            'physical_notes': 'Physical Notes',
-            'completion': 'Completion',
-            'no_checkin': 'No Check-in',
-            'weekly_summary': 'Weekly Summary',
-            'days_completed': 'days',
-            'checkin_completion': 'Check-in Completion:',
-            'mood_level': 'Mood Level:',
-            'energy_level': 'Energy:',
-            'social_activity': 'Social Activity:',
-            'sleep_quality': 'Sleep Quality:',
-            'anxiety_level': ('Calmness Level:' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety Level:'),
-            'motivation_level': 'Motivation:',
-            'medication_level': 'Medication:',
-            'physical_level': 'Physical Activity:',
-            'good': 'Good',
-            'needs_support': 'Needs Support',
-            'days': {
-                0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 
-                3: 'Thursday', 4: 'Friday', 5: 'Saturday', 6: 'Sunday'
-            }
-        },
-        'he': {
-            'title': 'דוח התקדמות שבועי - מטופל',
-            'week': 'שבוע',
-            'daily_checkin': "צ'ק-אין יומי",
-            'date': 'תאריך',
-            'day': 'יום',
-            'checkin_time': "זמן צ'ק-אין",
-            'mood': 'מצב רוח',
-            'mood_scale': '(1-4)',
-            'mood_notes': 'מצב רוח הערות',
-            'energy': 'אנרגיה',
-            'energy_scale': '(1-4)',
-            'energy_notes': 'אנרגיה הערות',
-            'social': 'פעילות חברתית',
-            'social_scale': '(1-4)',
-            'social_notes': 'פעילות חברתית הערות',
-            'sleep': 'שינה',
-            'sleep_scale': '(1-4)',
-            'sleep_notes': 'שינה הערות',
-            'anxiety': 'שלווה' if ANXIETY_DISPLAY_MODE == 'calm' else 'חרדה',
-            'anxiety_scale': '(1-4)',
-            'anxiety_notes': ('שלווה הערות' if ANXIETY_DISPLAY_MODE == 'calm' else 'חרדה הערות'),
-            'motivation': 'מוטיבציה',
-            'motivation_scale': '(1-4)',
-            'motivation_notes': 'מוטיבציה הערות',
-            'medication': 'תרופות',
-            'medication_scale': '(1-4)',
-            'medication_notes': 'תרופות הערות',
-            'physical': 'פעילות',
-            'physical_scale': '(1-4)',
-            'physical_notes': 'פעילות גופנית הערות',
-            'completion': 'השלמה',
-            'no_checkin': "אין צ'ק-אין",
-            'weekly_summary': 'סיכום שבועי',
-            'days_completed': 'ימים',
-            'checkin_completion': "השלמת צ'ק-אין:",
-            'mood_level': 'מצב רוח:',
-            'energy_level': 'אנרגיה:',
-            'social_activity': 'פעילות חברתית:',
-            'sleep_quality': 'איכות שינה:',
-            'anxiety_level': ('רמת שלווה:' if ANXIETY_DISPLAY_MODE == 'calm' else 'רמת חרדה:'),
-            'motivation_level': 'מוטיבציה:',
-            'medication_level': 'תרופות:',
-            'physical_level': 'פעילות גופנית:',
-            'good': 'טוב',
-            'needs_support': 'זקוק לתמיכה',
-            'days': {
-                0: 'יום שני', 1: 'יום שלישי', 2: 'יום רביעי',
-                3: 'יום חמישי', 4: 'יום שישי', 5: 'שבת', 6: 'יום ראשון'
-            }
-        },
-        'ar': {
-            'title': 'تقرير التقدم الأسبوعي - المريض',
-            'week': 'الأسبوع',
-            'daily_checkin': 'تسجيل الدخول اليومي',
-            'date': 'التاريخ',
-            'day': 'اليوم',
-            'checkin_time': 'وقت التسجيل',
-            'mood': 'المزاج',
-            'mood_scale': '(1-4)',
-            'mood_notes': 'ملاحظات المزاج',
-            'energy': 'الطاقة',
-            'energy_scale': '(1-4)',
-            'energy_notes': 'ملاحظات الطاقة',
-            'social': 'النشاط الاجتماعي',
-            'social_scale': '(1-4)',
-            'social_notes': 'ملاحظات اجتماعية',
-            'sleep': 'النوم',
-            'sleep_scale': '(1-4)',
-            'sleep_notes': 'ملاحظات النوم',
-            'anxiety': 'السكينة' if ANXIETY_DISPLAY_MODE == 'calm' else 'القلق',
-            'anxiety_scale': '(1-4)',
-            'anxiety_notes': ('ملاحظات السكينة' if ANXIETY_DISPLAY_MODE == 'calm' else 'ملاحظات القلق'),
-            'motivation': 'التحفيز',
-            'motivation_scale': '(1-4)',
-            'motivation_notes': 'ملاحظات التحفيز',
-            'medication': 'الأدوية',
-            'medication_scale': '(1-4)',
-            'medication_notes': 'ملاحظات الأدوية',
-            'physical': 'النشاط',
-            'physical_scale': '(1-4)',
-            'physical_notes': 'ملاحظات النشاط',
-            'completion': 'الإكمال',
-            'no_checkin': 'لا يوجد تسجيل',
-            'weekly_summary': 'ملخص أسبوعي',
-            'days_completed': 'أيام',
-            'checkin_completion': 'إكمال التسجيل:',
-            'mood_level': 'مستوى المزاج:',
-            'energy_level': 'الطاقة:',
-            'social_activity': 'النشاط الاجتماعي:',
-            'sleep_quality': 'جودة النوم:',
-            'anxiety_level': ('مستوى السكينة:' if ANXIETY_DISPLAY_MODE == 'calm' else 'مستوى القلق:'),
-            'motivation_level': 'التحفيز:',
-            'medication_level': 'الأدوية:',
-            'physical_level': 'النشاط البدني:',
-            'good': 'جيد',
-            'needs_support': 'يحتاج دعم',
-            'days': {
-                0: 'الإثنين', 1: 'الثلاثاء', 2: 'الأربعاء',
-                3: 'الخميس', 4: 'الجمعة', 5: 'السبت', 6: 'الأحد'
-            }
-        },
-        'ru': {
-            'title': 'Еженедельный отчет о прогрессе - Пациент',
-            'week': 'Неделя',
-            'daily_checkin': 'Ежедневная отметка',
-            'date': 'Дата',
-            'day': 'День',
-            'checkin_time': 'Время отметки',
-            'mood': 'Настроение',
-            'mood_scale': '(1-4)',
-            'mood_notes': 'Заметки о настроении',
-            'energy': 'Энергия',
-            'energy_scale': '(1-4)',
-            'energy_notes': 'Заметки об энергии',
-            'social': 'Социальная активность',
-            'social_scale': '(1-4)',
-            'social_notes': 'Социальные заметки',
-            'sleep': 'Сон',
-            'sleep_scale': '(1-4)',
-            'sleep_notes': 'Заметки о сне',
-            'anxiety': 'Спокойствие' if ANXIETY_DISPLAY_MODE == 'calm' else 'Тревога',
-            'anxiety_scale': '(1-4)',
-            'anxiety_notes': ('Заметки о спокойствии' if ANXIETY_DISPLAY_MODE == 'calm' else 'Заметки о тревоге'),
-            'motivation': 'Мотивация',
-            'motivation_scale': '(1-4)',
-            'motivation_notes': 'Заметки о мотивации',
-            'medication': 'Лекарства',
-            'medication_scale': '(1-4)',
-            'medication_notes': 'Заметки о лекарствах',
-            'physical': 'Активность',
-            'physical_scale': '(1-4)',
-            'physical_notes': 'Заметки об активности',
-            'completion': 'Завершение',
-            'no_checkin': 'Нет отметки',
-            'weekly_summary': 'Еженедельный итог',
-            'days_completed': 'дней',
-            'checkin_completion': 'Выполнение отметок:',
-            'mood_level': 'Настроение:',
-            'energy_level': 'Энергия:',
-            'social_activity': 'Социальная активность:',
-            'sleep_quality': 'Качество сна:',
-            'anxiety_level': ('Уровень спокойствия:' if ANXIETY_DISPLAY_MODE == 'calm' else 'Уровень тревоги:'),
-            'motivation_level': 'Мотивация:',
-            'medication_level': 'Лекарства:',
-            'physical_level': 'Физическая активность:',
-            'good': 'Хорошо',
-            'needs_support': 'Нужна поддержка',
-            'days': {
-                0: 'Понедельник', 1: 'Вторник', 2: 'Среда',
-                3: 'Четверг', 4: 'Пятница', 5: 'Суббота', 6: 'Воскресенье'
-            }
+# PERF: built once at import (was rebuilt on every report generation)
+_REPORT_TRANSLATIONS = {
+    'en': {
+        'title': 'Weekly Progress Report - Patient',
+        'week': 'Week',
+        'daily_checkin': 'Daily Check-in',
+        'date': 'Date',
+        'day': 'Day',
+        'checkin_time': 'Check-in Time',
+        'mood': 'Mood',
+        'mood_scale': '(1-4)',
+        'mood_notes': 'Mood Notes',
+        'energy': 'Energy',
+        'energy_scale': '(1-4)',
+        'energy_notes': 'Energy Notes',
+        'social': 'Social Activity',
+        'social_scale': '(1-4)',
+        'social_notes': 'Social Notes',
+        'sleep': 'Sleep',
+        'sleep_scale': '(1-4)',
+        'sleep_notes': 'Sleep Notes',
+        'anxiety': 'Calmness' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety',
+        'anxiety_scale': '(1-4)',
+        'anxiety_notes': ('Calmness Notes' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety Notes'),
+        'motivation': 'Motivation',
+        'motivation_scale': '(1-4)',
+        'motivation_notes': 'Motivation Notes',
+        'medication': 'Medication',
+        'medication_scale': '(1-4)',
+        'medication_notes': 'Medication Notes',
+        'physical': 'Activity',
+        'physical_scale': '(1-4)',
+        'physical_notes': 'Physical Notes',
+        'completion': 'Completion',
+        'no_checkin': 'No Check-in',
+        'weekly_summary': 'Weekly Summary',
+        'days_completed': 'days',
+        'checkin_completion': 'Check-in Completion:',
+        'mood_level': 'Mood Level:',
+        'energy_level': 'Energy:',
+        'social_activity': 'Social Activity:',
+        'sleep_quality': 'Sleep Quality:',
+        'anxiety_level': ('Calmness Level:' if ANXIETY_DISPLAY_MODE == 'calm' else 'Anxiety Level:'),
+        'motivation_level': 'Motivation:',
+        'medication_level': 'Medication:',
+        'physical_level': 'Physical Activity:',
+        'good': 'Good',
+        'needs_support': 'Needs Support',
+        'days': {
+            0: 'Monday', 1: 'Tuesday', 2: 'Wednesday', 
+            3: 'Thursday', 4: 'Friday', 5: 'Saturday', 6: 'Sunday'
+        }
+    },
+    'he': {
+        'title': 'דוח התקדמות שבועי - מטופל',
+        'week': 'שבוע',
+        'daily_checkin': "צ'ק-אין יומי",
+        'date': 'תאריך',
+        'day': 'יום',
+        'checkin_time': "זמן צ'ק-אין",
+        'mood': 'מצב רוח',
+        'mood_scale': '(1-4)',
+        'mood_notes': 'מצב רוח הערות',
+        'energy': 'אנרגיה',
+        'energy_scale': '(1-4)',
+        'energy_notes': 'אנרגיה הערות',
+        'social': 'פעילות חברתית',
+        'social_scale': '(1-4)',
+        'social_notes': 'פעילות חברתית הערות',
+        'sleep': 'שינה',
+        'sleep_scale': '(1-4)',
+        'sleep_notes': 'שינה הערות',
+        'anxiety': 'שלווה' if ANXIETY_DISPLAY_MODE == 'calm' else 'חרדה',
+        'anxiety_scale': '(1-4)',
+        'anxiety_notes': ('שלווה הערות' if ANXIETY_DISPLAY_MODE == 'calm' else 'חרדה הערות'),
+        'motivation': 'מוטיבציה',
+        'motivation_scale': '(1-4)',
+        'motivation_notes': 'מוטיבציה הערות',
+        'medication': 'תרופות',
+        'medication_scale': '(1-4)',
+        'medication_notes': 'תרופות הערות',
+        'physical': 'פעילות',
+        'physical_scale': '(1-4)',
+        'physical_notes': 'פעילות גופנית הערות',
+        'completion': 'השלמה',
+        'no_checkin': "אין צ'ק-אין",
+        'weekly_summary': 'סיכום שבועי',
+        'days_completed': 'ימים',
+        'checkin_completion': "השלמת צ'ק-אין:",
+        'mood_level': 'מצב רוח:',
+        'energy_level': 'אנרגיה:',
+        'social_activity': 'פעילות חברתית:',
+        'sleep_quality': 'איכות שינה:',
+        'anxiety_level': ('רמת שלווה:' if ANXIETY_DISPLAY_MODE == 'calm' else 'רמת חרדה:'),
+        'motivation_level': 'מוטיבציה:',
+        'medication_level': 'תרופות:',
+        'physical_level': 'פעילות גופנית:',
+        'good': 'טוב',
+        'needs_support': 'זקוק לתמיכה',
+        'days': {
+            0: 'יום שני', 1: 'יום שלישי', 2: 'יום רביעי',
+            3: 'יום חמישי', 4: 'יום שישי', 5: 'שבת', 6: 'יום ראשון'
+        }
+    },
+    'ar': {
+        'title': 'تقرير التقدم الأسبوعي - المريض',
+        'week': 'الأسبوع',
+        'daily_checkin': 'تسجيل الدخول اليومي',
+        'date': 'التاريخ',
+        'day': 'اليوم',
+        'checkin_time': 'وقت التسجيل',
+        'mood': 'المزاج',
+        'mood_scale': '(1-4)',
+        'mood_notes': 'ملاحظات المزاج',
+        'energy': 'الطاقة',
+        'energy_scale': '(1-4)',
+        'energy_notes': 'ملاحظات الطاقة',
+        'social': 'النشاط الاجتماعي',
+        'social_scale': '(1-4)',
+        'social_notes': 'ملاحظات اجتماعية',
+        'sleep': 'النوم',
+        'sleep_scale': '(1-4)',
+        'sleep_notes': 'ملاحظات النوم',
+        'anxiety': 'السكينة' if ANXIETY_DISPLAY_MODE == 'calm' else 'القلق',
+        'anxiety_scale': '(1-4)',
+        'anxiety_notes': ('ملاحظات السكينة' if ANXIETY_DISPLAY_MODE == 'calm' else 'ملاحظات القلق'),
+        'motivation': 'التحفيز',
+        'motivation_scale': '(1-4)',
+        'motivation_notes': 'ملاحظات التحفيز',
+        'medication': 'الأدوية',
+        'medication_scale': '(1-4)',
+        'medication_notes': 'ملاحظات الأدوية',
+        'physical': 'النشاط',
+        'physical_scale': '(1-4)',
+        'physical_notes': 'ملاحظات النشاط',
+        'completion': 'الإكمال',
+        'no_checkin': 'لا يوجد تسجيل',
+        'weekly_summary': 'ملخص أسبوعي',
+        'days_completed': 'أيام',
+        'checkin_completion': 'إكمال التسجيل:',
+        'mood_level': 'مستوى المزاج:',
+        'energy_level': 'الطاقة:',
+        'social_activity': 'النشاط الاجتماعي:',
+        'sleep_quality': 'جودة النوم:',
+        'anxiety_level': ('مستوى السكينة:' if ANXIETY_DISPLAY_MODE == 'calm' else 'مستوى القلق:'),
+        'motivation_level': 'التحفيز:',
+        'medication_level': 'الأدوية:',
+        'physical_level': 'النشاط البدني:',
+        'good': 'جيد',
+        'needs_support': 'يحتاج دعم',
+        'days': {
+            0: 'الإثنين', 1: 'الثلاثاء', 2: 'الأربعاء',
+            3: 'الخميس', 4: 'الجمعة', 5: 'السبت', 6: 'الأحد'
+        }
+    },
+    'ru': {
+        'title': 'Еженедельный отчет о прогрессе - Пациент',
+        'week': 'Неделя',
+        'daily_checkin': 'Ежедневная отметка',
+        'date': 'Дата',
+        'day': 'День',
+        'checkin_time': 'Время отметки',
+        'mood': 'Настроение',
+        'mood_scale': '(1-4)',
+        'mood_notes': 'Заметки о настроении',
+        'energy': 'Энергия',
+        'energy_scale': '(1-4)',
+        'energy_notes': 'Заметки об энергии',
+        'social': 'Социальная активность',
+        'social_scale': '(1-4)',
+        'social_notes': 'Социальные заметки',
+        'sleep': 'Сон',
+        'sleep_scale': '(1-4)',
+        'sleep_notes': 'Заметки о сне',
+        'anxiety': 'Спокойствие' if ANXIETY_DISPLAY_MODE == 'calm' else 'Тревога',
+        'anxiety_scale': '(1-4)',
+        'anxiety_notes': ('Заметки о спокойствии' if ANXIETY_DISPLAY_MODE == 'calm' else 'Заметки о тревоге'),
+        'motivation': 'Мотивация',
+        'motivation_scale': '(1-4)',
+        'motivation_notes': 'Заметки о мотивации',
+        'medication': 'Лекарства',
+        'medication_scale': '(1-4)',
+        'medication_notes': 'Заметки о лекарствах',
+        'physical': 'Активность',
+        'physical_scale': '(1-4)',
+        'physical_notes': 'Заметки об активности',
+        'completion': 'Завершение',
+        'no_checkin': 'Нет отметки',
+        'weekly_summary': 'Еженедельный итог',
+        'days_completed': 'дней',
+        'checkin_completion': 'Выполнение отметок:',
+        'mood_level': 'Настроение:',
+        'energy_level': 'Энергия:',
+        'social_activity': 'Социальная активность:',
+        'sleep_quality': 'Качество сна:',
+        'anxiety_level': ('Уровень спокойствия:' if ANXIETY_DISPLAY_MODE == 'calm' else 'Уровень тревоги:'),
+        'motivation_level': 'Мотивация:',
+        'medication_level': 'Лекарства:',
+        'physical_level': 'Физическая активность:',
+        'good': 'Хорошо',
+        'needs_support': 'Нужна поддержка',
+        'days': {
+            0: 'Понедельник', 1: 'Вторник', 2: 'Среда',
+            3: 'Четверг', 4: 'Пятница', 5: 'Суббота', 6: 'Воскресенье'
         }
     }
-    return translations.get(lang, translations['en'])
+}
+
+
+def get_report_translations(lang='en'):
+    """Get report translations for Excel/PDF generation"""
+    return _REPORT_TRANSLATIONS.get(lang, _REPORT_TRANSLATIONS['en'])
 
 
 def get_value_color(value, is_anxiety=False):
@@ -16129,34 +17144,44 @@ def get_week_data(user_id, days=7):
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days-1)
     
-    params_stmt = select(SavedParameters).filter(
-        SavedParameters.user_id == user_id,
-        SavedParameters.date >= start_date,
-        SavedParameters.date <= end_date
-    ).order_by(SavedParameters.date)
-    params = db.session.execute(params_stmt).scalars().all()
+    # PERF: only the columns the report reads, as plain Rows, placed into their day's slot by
+    # day offset. date is a 'YYYY-MM-DD' String(10) column, so the bounds are ISO strings (the
+    # old date-keyed dict lookup never matched the string keys)
+    sp_columns = SavedParameters.__table__.c
+    rows = db.session.execute(
+        select(
+            sp_columns.date, sp_columns.created_at, sp_columns.mood, sp_columns.energy,
+            sp_columns.sleep_quality, sp_columns.anxiety, sp_columns.physical_activity
+        ).where(
+            sp_columns.user_id == user_id,
+            sp_columns.date.between(start_date.isoformat(), end_date.isoformat())
+        )
+    ).all()
     
-    # Create a dict mapping date to params
-    params_by_date = {p.date: p for p in params}
+    entries_by_day = [None] * days
+    start_day = start_date.toordinal()
+    for row in rows:
+        entry_date, entry_day = _entry_day(row.date)
+        if entry_date is not None and 0 <= entry_day - start_day < days:
+            entries_by_day[entry_day - start_day] = row
     
     # Build data for each day
     week_data = []
-    current_date = start_date
-    while current_date <= end_date:
-        p = params_by_date.get(current_date)
+    for offset, p in enumerate(entries_by_day):
+        current_date = start_date + timedelta(days=offset)
         day_data = {
             'date': current_date,
             'day_of_week': current_date.weekday(),
             'has_checkin': p is not None,
-            'checkin_time': p.created_at.strftime('%H:%M') if p and hasattr(p, 'created_at') and p.created_at else '',
-            'mood': getattr(p, 'mood', None) if p else None,
-            'energy': getattr(p, 'energy', None) if p else None,
-            'social': getattr(p, 'social_activity', None) if p else None,
-            'sleep': getattr(p, 'sleep_quality', None) if p else None,
-            'anxiety': getattr(p, 'anxiety', None) if p else None,
-            'motivation': getattr(p, 'motivation', None) if p else None,
-            'medication': getattr(p, 'medication', None) if p else None,
-            'physical': getattr(p, 'physical_activity', None) if p else None,
+            'checkin_time': p.created_at.strftime('%H:%M') if p and p.created_at else '',
+            'mood': p.mood if p else None,
+            'energy': p.energy if p else None,
+            'social': None,  # social_activity, motivation and medication are not stored
+            'sleep': p.sleep_quality if p else None,
+            'anxiety': p.anxiety if p else None,
+            'motivation': None,
+            'medication': None,
+            'physical': p.physical_activity if p else None,
         }
         # T40: Invert anxiety to calmness for reports when in calm mode
         if ANXIETY_DISPLAY_MODE == 'calm' and day_data['anxiety'] is not None:
@@ -16165,11 +17190,13 @@ def get_week_data(user_id, days=7):
             except (ValueError, TypeError):
                 pass
         week_data.append(day_data)
-        current_date += timedelta(days=1)
     
     return week_data, start_date, end_date
 
 
+_SUMMARY_FIELDS = ('mood', 'energy', 'social', 'sleep', 'anxiety', 'motivation', 'medication', 'physical')
+
+
 def calculate_summary(week_data):
     """Calculate weekly summary statistics"""
     def calc_avg(field):
@@ -16180,22 +17207,30 @@ def calculate_summary(week_data):
         except (ValueError, TypeError):
             return None
     
+    averages = None
+    if NUMPY_AVAILABLE and week_data:
+        # PERF: every field's average from one (days x fields) float array - missing values
+        # are NaN and drop out of both the sums and the counts
+        try:
+            values = np.array([[d[f] for f in _SUMMARY_FIELDS] for d in week_data], dtype=float)
+            counts = np.count_nonzero(~np.isnan(values), axis=0)
+            sums = np.nansum(values, axis=0)
+            averages = [float(total / count) if count else None for total, count in zip(sums, counts)]
+        except (ValueError, TypeError):
+            averages = None  # a non-numeric value - calc_avg reports that field as None
+    if averages is None:
+        averages = [calc_avg(f) for f in _SUMMARY_FIELDS]
+    
     checkin_count = sum(1 for d in week_data if d['has_checkin'])
     total_days = len(week_data)
     
-    return {
+    summary = {
         'checkin_count': checkin_count,
         'total_days': total_days,
         'completion_pct': (checkin_count / total_days * 100) if total_days > 0 else 0,
-        'avg_mood': calc_avg('mood'),
-        'avg_energy': calc_avg('energy'),
-        'avg_social': calc_avg('social'),
-        'avg_sleep': calc_avg('sleep'),
-        'avg_anxiety': calc_avg('anxiety'),
-        'avg_motivation': calc_avg('motivation'),
-        'avg_medication': calc_avg('medication'),
-        'avg_physical': calc_avg('physical'),
     }
+    summary.update((f'avg_{f}', avg) for f, avg in zip(_SUMMARY_FIELDS, averages))
+    return summary
 
 
 # =====================
@@ -17078,6 +18113,26 @@ def get_watcher_all_circles(watched_id, watcher_id):
         return set()
 
 
+def _low_value_alert_level(vals):
+    avg = sum(vals) / len(vals)
+    return 'critical' if avg == 1 else ('high' if avg <= 1.5 else 'warning')
+
+
+def _high_value_alert_level(vals):
+    avg = sum(vals) / len(vals)
+    return 'critical' if avg == 4 else ('high' if avg >= 3.5 else 'warning')
+
+
+# New-schema watcher checks: (trigger flag, value attr, privacy attr, condition, severity)
+_WATCHER_TRIGGER_CHECKS = (
+    ('mood_alert', 'mood', 'mood_privacy', lambda val: val <= 2, _low_value_alert_level),
+    ('energy_alert', 'energy', 'energy_privacy', lambda val: val <= 2, _low_value_alert_level),
+    ('sleep_alert', 'sleep_quality', 'sleep_quality_privacy', lambda val: val <= 2, _low_value_alert_level),
+    ('physical_alert', 'physical_activity', 'physical_activity_privacy', lambda val: val <= 2, _low_value_alert_level),
+    ('anxiety_alert', 'anxiety', 'anxiety_privacy', lambda val: val >= 3, _high_value_alert_level),
+)
+
+
 @app.route('/api/parameters/check-triggers', methods=['GET'])
 @login_required
 def check_parameter_triggers():
@@ -17116,31 +18171,7 @@ def check_parameter_triggers():
         patterns_seen = set()
 
         # Helper function to convert values to numbers (for OLD schema)
-        def to_number(val):
-            if val is None:
-                return None
-            if isinstance(val, (int, float)):
-                return float(val)
-            if isinstance(val, str):
-                if val.lower() in ['private', 'hidden', 'none']:
-                    return None
-                try:
-                    return float(val)
-                except ValueError:
-                    return None
-            return None
-
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            """Check if watcher can see this parameter based on privacy and circle level"""
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
+        to_number = _trigger_number
 
         for trigger in triggers:
             # PI502alt: Skip if consecutive_days below minimum threshold
@@ -17151,6 +18182,8 @@ def check_parameter_triggers():
             watcher_circle = get_watcher_all_circles(trigger.watched_id, watcher_id)
             if not watcher_circle:
                 continue
+            # PERF: one table lookup per trigger; rows below test tuple membership
+            visible_levels = _visible_privacy_levels(watcher_circle)
 
             # T8 FIX (Bug A+B): Handle no_checkin BEFORE the parameters count gate.
             # no_checkin triggers fire when users DON'T have entries, so the gate
@@ -17199,6 +18232,10 @@ def check_parameter_triggers():
             if len(parameters) < consecutive_days:
                 continue
 
+            # PERF: parse each entry's 'YYYY-MM-DD' string ONCE into (date, day ordinal); the
+            # streak scans below step on int ordinals instead of subtracting dates per entry
+            entry_days = [_entry_day(param.date) for param in parameters]
+
             watched_user = db.session.get(User, trigger.watched_id)
             if not watched_user:
                 continue
@@ -17225,16 +18262,19 @@ def check_parameter_triggers():
                     
                     # Collect all valid entries that meet the condition
                     valid_entries = []
-                    for param in parameters:
+                    for param, (param_date, param_day) in zip(parameters, entry_days):
+                        if param_date is None:
+                            continue
                         param_value = getattr(param, param_attr, None)
                         param_privacy = getattr(param, privacy_attr, 'private')
 
-                        if not can_see_parameter(param_privacy, watcher_circle):
+                        if param_privacy not in visible_levels:
                             continue
                         
                         if param_value is not None and condition_func(param_value):
                             valid_entries.append({
-                                'date': param.date,
+                                'date': param_date,
+                                'day': param_day,
                                 'value': param_value
                             })
                     
@@ -17242,16 +18282,14 @@ def check_parameter_triggers():
                     
                     # Find ALL consecutive streaks of required length
                     if len(valid_entries) >= consecutive_days:
-                        valid_entries.sort(key=lambda x: x['date'])
+                        valid_entries.sort(key=lambda x: x['day'])
                         current_streak = []
                         
                         for entry in valid_entries:
                             if not current_streak:
                                 current_streak = [entry]
                             else:
-                                last_date = current_streak[-1]['date']
-                                curr_date = entry['date']
-                                days_diff = (curr_date - last_date).days
+                                days_diff = entry['day'] - current_streak[-1]['day']
                                 
                                 if days_diff == 1:
                                     current_streak.append(entry)
@@ -17324,40 +18362,12 @@ def check_parameter_triggers():
                     return found_patterns
 
                 # Check each parameter type if its alert flag is enabled
-                if trigger.mood_alert:
-                    logger.info(f"[PJ815 DEBUG] Checking mood for {watched_user.username}")
-                    results = check_consecutive_pattern('mood', 'mood_privacy', 
-                                                        lambda val: val <= 2,
-                                                        lambda vals: 'critical' if sum(vals)/len(vals) == 1 else ('high' if sum(vals)/len(vals) <= 1.5 else 'warning'))
-                    alerts.extend(results)
-
-                if trigger.energy_alert:
-                    logger.info(f"[PJ815 DEBUG] Checking energy for {watched_user.username}")
-                    results = check_consecutive_pattern('energy', 'energy_privacy',
-                                                        lambda val: val <= 2,
-                                                        lambda vals: 'critical' if sum(vals)/len(vals) == 1 else ('high' if sum(vals)/len(vals) <= 1.5 else 'warning'))
-                    alerts.extend(results)
-
-                if trigger.sleep_alert:
-                    logger.info(f"[PJ815 DEBUG] Checking sleep_quality for {watched_user.username}")
-                    results = check_consecutive_pattern('sleep_quality', 'sleep_quality_privacy',
-                                                        lambda val: val <= 2,
-                                                        lambda vals: 'critical' if sum(vals)/len(vals) == 1 else ('high' if sum(vals)/len(vals) <= 1.5 else 'warning'))
-                    alerts.extend(results)
-
-                if trigger.physical_alert:
-                    logger.info(f"[PJ815 DEBUG] Checking physical_activity for {watched_user.username}")
-                    results = check_consecutive_pattern('physical_activity', 'physical_activity_privacy',
-                                                        lambda val: val <= 2,
-                                                        lambda vals: 'critical' if sum(vals)/len(vals) == 1 else ('high' if sum(vals)/len(vals) <= 1.5 else 'warning'))
-                    alerts.extend(results)
-
-                if trigger.anxiety_alert:
-                    logger.info(f"[PJ815 DEBUG] Checking anxiety for {watched_user.username}")
-                    results = check_consecutive_pattern('anxiety', 'anxiety_privacy',
-                                                        lambda val: val >= 3,
-                                                        lambda vals: 'critical' if sum(vals)/len(vals) == 4 else ('high' if sum(vals)/len(vals) >= 3.5 else 'warning'))
-                    alerts.extend(results)
+                # PERF: conditions / severity functions come from the module-level
+                # _WATCHER_TRIGGER_CHECKS table (was ten fresh lambdas per trigger row)
+                for alert_flag, param_attr, privacy_attr, condition_func, level_func in _WATCHER_TRIGGER_CHECKS:
+                    if getattr(trigger, alert_flag):
+                        logger.info(f"[PJ815 DEBUG] Checking {param_attr} for {watched_user.username}")
+                        alerts.extend(check_consecutive_pattern(param_attr, privacy_attr, condition_func, level_func))
 
             # ===== OLD SCHEMA CODE =====
             elif has_old_schema:
@@ -17408,14 +18418,16 @@ def check_parameter_triggers():
                 # PJ815: Find ALL consecutive patterns with proper dates array
                 streak_dates = []  # Track dates in current streak
                 streak_values = []  # Track values in current streak
-                last_date = None
+                last_day = None
 
-                for param in parameters:
+                for param, (param_date, param_day) in zip(parameters, entry_days):
+                    if param_date is None:
+                        continue
                     param_value = getattr(param, param_attr, None)
                     param_privacy = getattr(param, privacy_attr, 'private')
 
                     # Check if watcher can see this parameter
-                    if not can_see_parameter(param_privacy, watcher_circle):
+                    if param_privacy not in visible_levels:
                         # Reset streak if we hit a private parameter
                         if len(streak_dates) >= consecutive_days:
                             # Save the streak before resetting
@@ -17441,22 +18453,22 @@ def check_parameter_triggers():
                                 logger.info(f"[PJ815 PATTERN] OLD SCHEMA NEW: {watched_user.username}/{param_name} {start_date} to {end_date}")
                         streak_dates = []
                         streak_values = []
-                        last_date = None
+                        last_day = None
                         continue
 
                     if condition_func(param_value):
                         # Condition met
-                        if last_date is None:
+                        if last_day is None:
                             # Start new streak
-                            streak_dates = [param.date]
+                            streak_dates = [param_date]
                             streak_values = [param_value]
-                            last_date = param.date
-                        elif (param.date - last_date).days == 1:
+                            last_day = param_day
+                        elif param_day - last_day == 1:
                             # Consecutive - extend streak
-                            streak_dates.append(param.date)
+                            streak_dates.append(param_date)
                             streak_values.append(param_value)
-                            last_date = param.date
-                        elif (param.date - last_date).days == 0:
+                            last_day = param_day
+                        elif param_day - last_day == 0:
                             # Same day - skip
                             continue
                         else:
@@ -17484,9 +18496,9 @@ def check_parameter_triggers():
                                     logger.info(f"[PJ815 PATTERN] OLD SCHEMA NEW: {watched_user.username}/{param_name} {start_date} to {end_date}")
                             
                             # Start new streak
-                            streak_dates = [param.date]
+                            streak_dates = [param_date]
                             streak_values = [param_value]
-                            last_date = param.date
+                            last_day = param_day
                     else:
                         # Condition not met - save streak if long enough
                         if len(streak_dates) >= consecutive_days:
@@ -17513,7 +18525,7 @@ def check_parameter_triggers():
                         
                         streak_dates = []
                         streak_values = []
-                        last_date = None
+                        last_day = None
                 
                 # Don't forget the last streak after loop ends
                 if len(streak_dates) >= consecutive_days:
@@ -17604,18 +18616,6 @@ def cleanup_trigger_privacy():
     try:
         user_id = session.get('user_id')
 
-        # Helper function (copy from main fix)
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            """Check if watcher can see this parameter based on privacy and circle level"""
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
 
         # Get all trigger alerts for this user
         trigger_alerts = Alert.query.filter_by(
@@ -17692,7 +18692,7 @@ def cleanup_trigger_privacy():
             param_privacy = getattr(recent_param, privacy_attr, 'private')
 
             # Check if watcher should see this parameter
-            if not can_see_parameter(param_privacy, watcher_circle):
+            if param_privacy not in _visible_privacy_levels(watcher_circle):
                 db.session.delete(alert)
                 removed_count += 1
                 logger.info(f"Removed alert {alert.id}: privacy violation ({param_privacy} vs {watcher_circle})")
@@ -17740,17 +18740,6 @@ def cleanup_all_trigger_privacy():
         # if not current_user.is_admin:
         #     return jsonify({'error': 'Admin access required'}), 403
 
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
-
         # Get ALL trigger alerts
         trigger_alerts = Alert.query.filter_by(alert_type='trigger').all()
 
@@ -17813,7 +18802,7 @@ def cleanup_all_trigger_privacy():
 
             param_privacy = getattr(recent_param, privacy_attr, 'private')
 
-            if not can_see_parameter(param_privacy, watcher_circle):
+            if param_privacy not in _visible_privacy_levels(watcher_circle):
                 db.session.delete(alert)
                 removed_count += 1
                 removed_by_user[watcher_id] = removed_by_user.get(watcher_id, 0) + 1
@@ -17927,7 +18916,9 @@ def calculate_streak(params):
     if not params:
         return 0
 
-    dates = sorted([p.date for p in params], reverse=True)
+    # date may be a 'YYYY-MM-DD' string (SavedParameters.date is String(10))
+    dates = sorted([p.date if isinstance(p.date, date) else date.fromisoformat(str(p.date)[:10])
+                    for p in params], reverse=True)
     streak = 1
     today = datetime.now().date()
 
@@ -18301,7 +19292,7 @@ def list_objective_groups():
         is_op = user_obj and user_obj.role in ('operator', 'org_manager', 'admin')
         user_member_ids = {m.group_id for m in ObjectiveGroupMembership.query.filter_by(user_id=user_id).all()}
         if not is_op:
-            groups = [g for g in groups if (g.group_privacy or 'visible') != 'hidden' or g.id in user_member_ids]
+            groups = [grp for grp in groups if (grp.group_privacy or 'visible') != 'hidden' or grp.id in user_member_ids]
 
         # Fetch this user's memberships for the joined flag
         memberships = user_member_ids
@@ -18314,10 +19305,10 @@ def list_objective_groups():
         count_map = {gid: cnt for gid, cnt in count_rows}
 
         result = []
-        for g in groups:
-            gd = g.to_dict()
-            gd['member_count'] = count_map.get(g.id, 0)
-            gd['is_member'] = g.id in memberships
+        for grp in groups:
+            gd = grp.to_dict()
+            gd['member_count'] = count_map.get(grp.id, 0)
+            gd['is_member'] = grp.id in memberships
             result.append(gd)
 
         return jsonify({'groups': result})
@@ -20739,10 +21730,7 @@ def get_friends_updates():
                         'id': followed_user.id,
                         'username': followed_user.username,
                         'selected_city': followed_user.selected_city,
-                        'follows_you': Follow.query.filter_by(
-                            follower_id=followed_user.id,
-                            followed_id=user_id
-                        ).first() is not None
+                        'follows_you': _follow_exists(followed_user.id, user_id)
                     },
                     'date': date_str,
                     'params': visible_params
@@ -20787,10 +21775,7 @@ def get_following():
             followed_user = db.session.get(User, follow.followed_id)
             if followed_user:
                 # VINTER2: Check if this user follows back
-                follows_back = Follow.query.filter_by(
-                    follower_id=followed_user.id,
-                    followed_id=user_id
-                ).first() is not None
+                follows_back = _follow_exists(followed_user.id, user_id)
                 # CS1: Get last check-in date (always visible regardless of privacy settings)
                 last_checkin = db.session.execute(
                     select(SavedParameters.date).filter_by(user_id=followed_user.id)
@@ -21713,31 +22698,7 @@ def run_background_trigger_check_for_watcher(watcher_id):
         alerts = []
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
         patterns_seen = set()
-
-        def to_number(val):
-            if val is None:
-                return None
-            if isinstance(val, (int, float)):
-                return float(val)
-            if isinstance(val, str):
-                if val.lower() in ['private', 'hidden', 'none']:
-                    return None
-                try:
-                    return float(val)
-                except ValueError:
-                    return None
-            return None
-
-        def can_see_parameter(param_privacy, watcher_circle):  # U5: watcher_circle is now a set
-            if param_privacy == 'private':
-                return False
-            elif param_privacy == 'class_a':
-                return 'class_a' in watcher_circle
-            elif param_privacy == 'class_b':
-                return 'class_b' in watcher_circle
-            elif param_privacy == 'public':
-                return True
-            return False
+        to_number = _trigger_number
 
         for trigger in triggers:
             # PI502alt: Enforce minimum consecutive days
@@ -21748,6 +22709,8 @@ def run_background_trigger_check_for_watcher(watcher_id):
             watcher_circle = get_watcher_all_circles(trigger.watched_id, watcher_id)
             if not watcher_circle:
                 continue
+            # PERF: one table lookup per trigger; rows below test tuple membership
+            visible_levels = _visible_privacy_levels(watcher_circle)
 
             # T8 FIX (Bug A): Handle no_checkin BEFORE the parameters count gate.
             # no_checkin triggers fire when users DON'T have entries, so the gate
@@ -21795,6 +22758,10 @@ def run_background_trigger_check_for_watcher(watcher_id):
             if len(parameters) < consecutive_days:
                 continue
 
+            # PERF: parse each entry's 'YYYY-MM-DD' string ONCE into (date, day ordinal); the
+            # streak scans below step on int ordinals instead of subtracting dates per entry
+            entry_days = [_entry_day(param.date) for param in parameters]
+
             watched_user = db.session.get(User, trigger.watched_id)
             if not watched_user:
                 continue
@@ -21816,25 +22783,25 @@ def run_background_trigger_check_for_watcher(watcher_id):
                 def check_consecutive_pattern(param_attr, privacy_attr, condition_func):
                     found_patterns = []
                     valid_entries = []
-                    for param in parameters:
+                    for param, (param_date, param_day) in zip(parameters, entry_days):
+                        if param_date is None:
+                            continue
                         param_value = getattr(param, param_attr, None)
                         param_privacy = getattr(param, privacy_attr, 'private')
-                        if not can_see_parameter(param_privacy, watcher_circle):
+                        if param_privacy not in visible_levels:
                             continue
                         if param_value is not None and condition_func(param_value):
-                            valid_entries.append({'date': param.date, 'value': param_value})
+                            valid_entries.append({'date': param_date, 'day': param_day, 'value': param_value})
                     
                     if len(valid_entries) >= consecutive_days:
-                        valid_entries.sort(key=lambda x: x['date'])
+                        valid_entries.sort(key=lambda x: x['day'])
                         current_streak = []
                         
                         for entry in valid_entries:
                             if not current_streak:
                                 current_streak = [entry]
                             else:
-                                last_date = current_streak[-1]['date']
-                                curr_date = entry['date']
-                                days_diff = (curr_date - last_date).days
+                                days_diff = entry['day'] - current_streak[-1]['day']
                                 
                                 if days_diff == 1:
                                     current_streak.append(entry)
@@ -21875,17 +22842,12 @@ def run_background_trigger_check_for_watcher(watcher_id):
                     
                     return found_patterns
 
-                # PJ817: Fixed lambdas to use to_number() to handle string values from database
-                if trigger.mood_alert:
-                    alerts.extend(check_consecutive_pattern('mood', 'mood_privacy', lambda val: to_number(val) is not None and to_number(val) <= 2))
-                if trigger.energy_alert:
-                    alerts.extend(check_consecutive_pattern('energy', 'energy_privacy', lambda val: to_number(val) is not None and to_number(val) <= 2))
-                if trigger.sleep_alert:
-                    alerts.extend(check_consecutive_pattern('sleep_quality', 'sleep_quality_privacy', lambda val: to_number(val) is not None and to_number(val) <= 2))
-                if trigger.physical_alert:
-                    alerts.extend(check_consecutive_pattern('physical_activity', 'physical_activity_privacy', lambda val: to_number(val) is not None and to_number(val) <= 2))
-                if trigger.anxiety_alert:
-                    alerts.extend(check_consecutive_pattern('anxiety', 'anxiety_privacy', lambda val: to_number(val) is not None and to_number(val) >= 3))
+                # PJ817: string-safe concern tests from the module-level _TRIGGER_PARAM_CHECKS
+                # table (PERF: no fresh lambdas per trigger row)
+                for alert_flag, name in _TRIGGER_ALERT_FLAGS:
+                    if getattr(trigger, alert_flag):
+                        param_attr, _name, privacy_attr, condition_func = _TRIGGER_PARAM_CHECKS[name]
+                        alerts.extend(check_consecutive_pattern(param_attr, privacy_attr, condition_func))
 
             # OLD SCHEMA processing
             elif has_old_schema:
@@ -21955,13 +22917,15 @@ def run_background_trigger_check_for_watcher(watcher_id):
 
                 streak_dates = []
                 streak_values = []
-                last_date = None
+                last_day = None
 
-                for param in parameters:
+                for param, (param_date, param_day) in zip(parameters, entry_days):
+                    if param_date is None:
+                        continue
                     param_value = getattr(param, param_attr, None)
                     param_privacy = getattr(param, privacy_attr, 'private')
 
-                    if not can_see_parameter(param_privacy, watcher_circle):
+                    if param_privacy not in visible_levels:
                         if len(streak_dates) >= consecutive_days:
                             start_date = streak_dates[0]
                             end_date = streak_dates[-1]
@@ -21979,19 +22943,19 @@ def run_background_trigger_check_for_watcher(watcher_id):
                                 })
                         streak_dates = []
                         streak_values = []
-                        last_date = None
+                        last_day = None
                         continue
 
                     if condition_func(param_value):
-                        if last_date is None:
-                            streak_dates = [param.date]
+                        if last_day is None:
+                            streak_dates = [param_date]
                             streak_values = [param_value]
-                            last_date = param.date
-                        elif (param.date - last_date).days == 1:
-                            streak_dates.append(param.date)
+                            last_day = param_day
+                        elif param_day - last_day == 1:
+                            streak_dates.append(param_date)
                             streak_values.append(param_value)
-                            last_date = param.date
-                        elif (param.date - last_date).days == 0:
+                            last_day = param_day
+                        elif param_day - last_day == 0:
                             continue
                         else:
                             if len(streak_dates) >= consecutive_days:
@@ -22009,9 +22973,9 @@ def run_background_trigger_check_for_watcher(watcher_id):
                                         'values': streak_values[:],
                                         'condition_text': condition_text
                                     })
-                            streak_dates = [param.date]
+                            streak_dates = [param_date]
                             streak_values = [param_value]
-                            last_date = param.date
+                            last_day = param_day
                     else:
                         if len(streak_dates) >= consecutive_days:
                             start_date = streak_dates[0]
@@ -22030,7 +22994,7 @@ def run_background_trigger_check_for_watcher(watcher_id):
                                 })
                         streak_dates = []
                         streak_values = []
-                        last_date = None
+                        last_day = None
                 
                 # Last streak
                 if len(streak_dates) >= consecutive_days:
@@ -22382,6 +23346,74 @@ def start_trigger_scheduler():
 _job_queue_scheduler_started = False
 _job_queue_scheduler_lock = threading.Lock()
 
+# PERF: enqueue sites NOTIFY this channel so the scheduler wakes immediately instead of
+# waiting out its poll interval (PostgreSQL only; SQLite keeps plain polling)
+_JOB_QUEUE_NOTIFY_CHANNEL = 'bg_jobs'
+# With LISTEN active, the timed wake-up is only a safety net (expired locks released by
+# _recover_stale_job_locks, retries, jobs queued by another instance whose NOTIFY was
+# missed); without it, plain polling
+_JOB_QUEUE_HEARTBEAT_SECONDS = 30
+_JOB_QUEUE_POLL_SECONDS = 10
+_job_notify_conn = None
+
+
+def _notify_job_queue(job_id=None):
+    """Queue a NOTIFY for the job scheduler in the current transaction (delivered on COMMIT)."""
+    if 'postgresql' not in str(db.engine.url):
+        return
+    try:
+        db.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {'channel': _JOB_QUEUE_NOTIFY_CHANNEL, 'payload': str(job_id or '')}
+        )
+    except Exception as e:
+        logger.warning(f"[JOB QUEUE] pg_notify failed (scheduler will poll): {e}")
+
+
+def _wait_for_job_notification(timeout):
+    """Block until a job-queue NOTIFY arrives or timeout seconds pass.
+    Uses a dedicated autocommit psycopg2 connection LISTENing on _JOB_QUEUE_NOTIFY_CHANNEL;
+    falls back to polling (time.sleep() for at most _JOB_QUEUE_POLL_SECONDS) on SQLite or
+    if the listener connection fails."""
+    global _job_notify_conn
+    import select as _select_module
+
+    try:
+        with app.app_context():
+            is_postgres = 'postgresql' in str(db.engine.url)
+        if not is_postgres:
+            time.sleep(min(timeout, _JOB_QUEUE_POLL_SECONDS))
+            return False
+
+        if _job_notify_conn is None or _job_notify_conn.closed:
+            _job_notify_conn = get_db()
+            _job_notify_conn.autocommit = True
+            with _job_notify_conn.cursor() as cur:
+                cur.execute(f"LISTEN {_JOB_QUEUE_NOTIFY_CHANNEL}")
+            logger.info(f"[JOB QUEUE SCHEDULER] Listening on '{_JOB_QUEUE_NOTIFY_CHANNEL}'")
+
+        # Drain anything that arrived while jobs were being processed
+        _job_notify_conn.poll()
+        if _job_notify_conn.notifies:
+            _job_notify_conn.notifies.clear()
+            return True
+
+        if _select_module.select([_job_notify_conn], [], [], timeout) == ([], [], []):
+            return False
+        _job_notify_conn.poll()
+        _job_notify_conn.notifies.clear()
+        return True
+    except Exception as e:
+        logger.warning(f"[JOB QUEUE SCHEDULER] LISTEN wait failed, falling back to sleep: {e}")
+        try:
+            if _job_notify_conn is not None:
+                _job_notify_conn.close()
+        except Exception:
+            pass
+        _job_notify_conn = None
+        time.sleep(min(timeout, _JOB_QUEUE_POLL_SECONDS))
+        return False
+
 def run_job_queue_scheduler():
     """
     Background thread that processes pending jobs from the database queue.
@@ -22401,6 +23433,7 @@ def run_job_queue_scheduler():
         try:
             with app.app_context():
                 _jobq_lock_acquired = False
+                _settled = 0
                 try:
                     # T15a: Only process if this worker holds the advisory lock
                     if not _try_acquire_scheduler_lock(_SCHEDULER_LOCK_JOB_QUEUE):
@@ -22410,7 +23443,7 @@ def run_job_queue_scheduler():
 
                     _jobq_lock_acquired = True
                     # Process up to 10 jobs per cycle
-                    process_background_jobs(batch_size=10)
+                    _settled = process_background_jobs(batch_size=10)
                 except Exception as inner_error:
                     logger.error(f"[JOB QUEUE SCHEDULER] Processing error: {str(inner_error)}")
                     try:
@@ -22427,8 +23460,12 @@ def run_job_queue_scheduler():
                     except Exception:
                         pass
             
-            # Sleep for 10 seconds between job processing cycles
-            time.sleep(10)
+            # PERF: a full batch settled without retries means more jobs are waiting - go
+            # straight to the next one. Otherwise (including any retry, which would be
+            # re-claimed at once) sleep until a NOTIFY from an enqueue site, with the heartbeat
+            # as a safety net (SQLite / no listener: poll every _JOB_QUEUE_POLL_SECONDS)
+            if _settled < 10:
+                _wait_for_job_notification(_JOB_QUEUE_HEARTBEAT_SECONDS)
                     
         except Exception as e:
             logger.error(f"[JOB QUEUE SCHEDULER] Scheduler error: {str(e)}")
@@ -23170,8 +24207,14 @@ def get_user_feed(user_id, date_str):
         if user_id != current_user_id and not current_user.is_following(target_user):
             return jsonify({'error': 'You must be connected to this user to view their feed'}), 403
 
+        try:
+            day_start, day_end = _day_bounds(date_str)
+        except ValueError:
+            return jsonify({'error': 'Invalid date format'}), 400
+
         post = Post.query.filter_by(user_id=user_id).filter(
-            db.func.date(Post.created_at) == date_str
+            Post.created_at >= day_start,
+            Post.created_at < day_end
         ).first()
 
         if not post: